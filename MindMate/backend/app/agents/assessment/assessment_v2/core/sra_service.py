@@ -4,8 +4,13 @@ Processes all responses in real-time to extract symptoms and attributes
 Works silently in the background throughout the entire workflow
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import re
 
@@ -27,6 +32,54 @@ except ImportError:
             LLMWrapper = None
             logger.debug("LLMWrapper not available - SRA service will use rule-based extraction only")
 
+# Integer codes for severity/impact levels (unknown values score as moderate)
+SEVERITY_CODES = {"mild": 1, "moderate": 2, "severe": 3, "extreme": 4}
+IMPACT_CODES = {"minor": 1, "moderate": 2, "severe": 3, "extreme": 4}
+SEVERITY_LEVELS = ("mild", "moderate", "severe", "extreme")
+SEVERITY_THRESHOLDS = (1.5, 2.5, 3.5)
+
+# Duration classification codes and keywords
+TEMPORAL_ACUTE, TEMPORAL_SUBACUTE, TEMPORAL_CHRONIC, TEMPORAL_UNKNOWN = range(4)
+ACUTE_DURATION_WORDS = ("week", "weeks", "day", "days")
+SUBACUTE_DURATION_WORDS = ("month", "months")
+CHRONIC_DURATION_WORDS = ("year", "years")
+
+
+def classify_duration(duration: str) -> int:
+    """Classify a lowercased duration string as acute, subacute, chronic or unknown"""
+    if any(word in duration for word in ACUTE_DURATION_WORDS):
+        return TEMPORAL_ACUTE
+    is_chronic = any(word in duration for word in CHRONIC_DURATION_WORDS)
+    if not is_chronic and any(word in duration for word in SUBACUTE_DURATION_WORDS):
+        return TEMPORAL_SUBACUTE
+    if is_chronic:
+        return TEMPORAL_CHRONIC
+    return TEMPORAL_UNKNOWN
+
+
+@dataclass(frozen=True)
+class SymptomView:
+    """Exported symptom paired with its lowercased matching fields"""
+    symptom: Dict[str, Any]
+    name: str
+    category: str
+    severity: str
+    impact: str
+    frequency: str
+    duration: str
+
+    @classmethod
+    def from_symptom(cls, symptom: Dict[str, Any]) -> "SymptomView":
+        return cls(
+            symptom=symptom,
+            name=symptom.get("name", "").lower(),
+            category=symptom.get("category", "").lower(),
+            severity=symptom.get("severity", "moderate").lower(),
+            impact=symptom.get("impact", "moderate").lower(),
+            frequency=symptom.get("frequency", "").lower(),
+            duration=symptom.get("duration", "").lower()
+        )
+
 
 class SRAService:
     """
@@ -661,11 +714,21 @@ Extract symptoms and their attributes. Return JSON array:"""
             symptoms = self.symptom_db.export_symptoms(session_id)
             summary = self.symptom_db.get_symptoms_summary(session_id)
 
+            # Single pass: lowercase matching fields and gather confidence inputs
+            views = []
+            confidences = []
+            categories = set()
+            for symptom in symptoms:
+                views.append(SymptomView.from_symptom(symptom))
+                confidences.append(symptom.get("confidence", 1.0))
+                if symptom.get("category"):
+                    categories.add(symptom["category"])
+
             # Analyze symptom patterns and clusters
-            symptom_clusters = self._analyze_symptom_clusters(symptoms)
-            temporal_patterns = self._analyze_temporal_patterns(symptoms)
-            severity_assessment = self._assess_overall_severity(symptoms)
-            clinical_correlations = self._identify_clinical_correlations(symptoms)
+            symptom_clusters = self._analyze_symptom_clusters(views)
+            temporal_patterns, temporal_codes = self._analyze_temporal_patterns(views)
+            severity_assessment = self._assess_overall_severity(views)
+            clinical_correlations = self._identify_clinical_correlations(views)
 
             # Generate comprehensive report
             report = {
@@ -676,8 +739,8 @@ Extract symptoms and their attributes. Return JSON array:"""
                 "severity_assessment": severity_assessment,
                 "clinical_correlations": clinical_correlations,
                 "report_generated_at": datetime.now().isoformat(),
-                "confidence_score": self._calculate_report_confidence(symptoms),
-                "recommendations": self._generate_sra_recommendations(symptoms)
+                "confidence_score": self._calculate_report_confidence(confidences, categories),
+                "recommendations": self._generate_sra_recommendations(views, temporal_codes)
             }
 
             logger.info(f"Generated comprehensive symptom report for session {session_id} with {len(symptoms)} symptoms")
@@ -692,7 +755,7 @@ Extract symptoms and their attributes. Return JSON array:"""
                 "report_generated_at": datetime.now().isoformat()
             }
 
-    def _analyze_symptom_clusters(self, symptoms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_symptom_clusters(self, symptoms: List[SymptomView]) -> Dict[str, Any]:
         """Analyze symptom clusters and patterns"""
         clusters = {
             "mood_symptoms": [],
@@ -703,8 +766,9 @@ Extract symptoms and their attributes. Return JSON array:"""
             "behavioral_symptoms": []
         }
 
-        for symptom in symptoms:
-            category = symptom.get("category", "").lower()
+        for view in symptoms:
+            category = view.category
+            symptom = view.symptom
             if "mood" in category or "depress" in category:
                 clusters["mood_symptoms"].append(symptom)
             elif "anxiety" in category or "panic" in category or "worry" in category:
@@ -718,73 +782,58 @@ Extract symptoms and their attributes. Return JSON array:"""
             elif "behavior" in category or "withdrawal" in category:
                 clusters["behavioral_symptoms"].append(symptom)
 
+        cluster_counts = {k: len(v) for k, v in clusters.items()}
+        dominant_cluster = max(cluster_counts, key=cluster_counts.__getitem__) if any(cluster_counts.values()) else None
+
         return {
             "clusters": clusters,
-            "cluster_counts": {k: len(v) for k, v in clusters.items()},
-            "dominant_cluster": max(clusters.items(), key=lambda x: len(x[1]))[0] if clusters else None
+            "cluster_counts": cluster_counts,
+            "dominant_cluster": dominant_cluster
         }
 
-    def _analyze_temporal_patterns(self, symptoms: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze temporal patterns in symptoms"""
+    def _analyze_temporal_patterns(self, symptoms: List[SymptomView]) -> Tuple[Dict[str, Any], List[int]]:
+        """Analyze temporal patterns in symptoms, also returning each symptom's duration code"""
         temporal_data = {
             "acute_symptoms": [],  # < 1 month
             "subacute_symptoms": [],  # 1-6 months
             "chronic_symptoms": [],  # > 6 months
-            "frequency_patterns": {},
+            "frequency_patterns": defaultdict(list),
             "onset_patterns": []
         }
 
-        for symptom in symptoms:
-            duration = symptom.get("duration", "").lower()
+        temporal_buckets = {
+            TEMPORAL_ACUTE: temporal_data["acute_symptoms"],
+            TEMPORAL_SUBACUTE: temporal_data["subacute_symptoms"],
+            TEMPORAL_CHRONIC: temporal_data["chronic_symptoms"]
+        }
+        temporal_codes = []
 
-            if any(word in duration for word in ["week", "weeks", "day", "days"]):
-                temporal_data["acute_symptoms"].append(symptom)
-            elif any(word in duration for word in ["month", "months"]) and not any(word in duration for word in ["year", "years"]):
-                temporal_data["subacute_symptoms"].append(symptom)
-            elif any(word in duration for word in ["year", "years"]):
-                temporal_data["chronic_symptoms"].append(symptom)
+        for view in symptoms:
+            symptom = view.symptom
+            code = classify_duration(view.duration)
+            temporal_codes.append(code)
+            if code in temporal_buckets:
+                temporal_buckets[code].append(symptom)
 
             # Analyze frequency
-            frequency = symptom.get("frequency", "").lower()
-            if frequency not in temporal_data["frequency_patterns"]:
-                temporal_data["frequency_patterns"][frequency] = []
-            temporal_data["frequency_patterns"][frequency].append(symptom)
+            temporal_data["frequency_patterns"][view.frequency].append(symptom)
 
-        return temporal_data
+        temporal_data["frequency_patterns"] = dict(temporal_data["frequency_patterns"])
+        return temporal_data, temporal_codes
 
-    def _assess_overall_severity(self, symptoms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_overall_severity(self, symptoms: List[SymptomView]) -> Dict[str, Any]:
         """Assess overall severity of symptoms"""
-        severity_scores = {"mild": 1, "moderate": 2, "severe": 3, "extreme": 4}
-        impact_scores = {"minor": 1, "moderate": 2, "severe": 3, "extreme": 4}
-
-        total_severity = 0
-        total_impact = 0
-        severity_breakdown = {"mild": 0, "moderate": 0, "severe": 0, "extreme": 0}
+        severity_codes = [SEVERITY_CODES.get(v.severity, 2) for v in symptoms]
+        impact_codes = [IMPACT_CODES.get(v.impact, 2) for v in symptoms]
 
-        for symptom in symptoms:
-            severity = symptom.get("severity", "moderate").lower()
-            impact = symptom.get("impact", "moderate").lower()
+        code_counts = Counter(severity_codes)
+        severity_breakdown = {level: code_counts[code] for code, level in enumerate(SEVERITY_LEVELS, 1)}
 
-            severity_score = severity_scores.get(severity, 2)
-            impact_score = impact_scores.get(impact, 2)
-
-            total_severity += severity_score
-            total_impact += impact_score
-
-            severity_breakdown[severity] += 1
-
-        avg_severity = total_severity / len(symptoms) if symptoms else 0
-        avg_impact = total_impact / len(symptoms) if symptoms else 0
+        avg_severity = sum(severity_codes) / len(symptoms) if symptoms else 0
+        avg_impact = sum(impact_codes) / len(symptoms) if symptoms else 0
 
         # Determine overall severity level
-        if avg_severity >= 3.5:
-            overall_level = "extreme"
-        elif avg_severity >= 2.5:
-            overall_level = "severe"
-        elif avg_severity >= 1.5:
-            overall_level = "moderate"
-        else:
-            overall_level = "mild"
+        overall_level = SEVERITY_LEVELS[bisect_right(SEVERITY_THRESHOLDS, avg_severity)]
 
         return {
             "overall_severity_level": overall_level,
@@ -794,7 +843,7 @@ Extract symptoms and their attributes. Return JSON array:"""
             "total_symptoms": len(symptoms)
         }
 
-    def _identify_clinical_correlations(self, symptoms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _identify_clinical_correlations(self, symptoms: List[SymptomView]) -> Dict[str, Any]:
         """Identify clinical correlations and patterns"""
         correlations = {
             "depression_indicators": [],
@@ -806,9 +855,9 @@ Extract symptoms and their attributes. Return JSON array:"""
         }
 
         # Simple rule-based correlation detection
-        for symptom in symptoms:
-            name = symptom.get("name", "").lower()
-            context = " ".join(symptom.get("context", [])).lower()
+        for view in symptoms:
+            name = view.name
+            symptom = view.symptom
 
             # Depression indicators
             if any(word in name for word in ["sad", "depressed", "hopeless", "worthless", "suicidal"]):
@@ -835,9 +884,10 @@ Extract symptoms and their attributes. Return JSON array:"""
                 correlations["psychosis_indicators"].append(symptom)
 
         # Calculate correlation strengths
+        total = len(symptoms) or 1
         correlation_strengths = {}
         for condition, symptoms_list in correlations.items():
-            strength = len(symptoms_list) / len(symptoms) if symptoms else 0
+            strength = len(symptoms_list) / total
             correlation_strengths[condition] = {
                 "count": len(symptoms_list),
                 "percentage": strength * 100,
@@ -847,16 +897,16 @@ Extract symptoms and their attributes. Return JSON array:"""
         return {
             "correlations": correlations,
             "correlation_strengths": correlation_strengths,
-            "primary_correlations": sorted(
+            "primary_correlations": heapq.nlargest(
+                3,
                 correlation_strengths.items(),
-                key=lambda x: x[1]["count"],
-                reverse=True
-            )[:3]  # Top 3 correlations
+                key=lambda x: x[1]["count"]
+            )  # Top 3 correlations
         }
 
-    def _calculate_report_confidence(self, symptoms: List[Dict[str, Any]]) -> float:
-        """Calculate confidence score for the symptom report"""
-        if not symptoms:
+    def _calculate_report_confidence(self, confidences: List[float], categories: set) -> float:
+        """Calculate confidence score for the symptom report from per-symptom confidences and categories"""
+        if not confidences:
             return 0.0
 
         # Factors affecting confidence:
@@ -865,19 +915,19 @@ Extract symptoms and their attributes. Return JSON array:"""
         # 3. Diversity of symptom categories
         # 4. Temporal consistency
 
-        base_confidence = min(len(symptoms) / 10, 1.0)  # More symptoms = higher confidence
+        symptom_count = len(confidences)
+        base_confidence = min(symptom_count / 10, 1.0)  # More symptoms = higher confidence
 
-        avg_symptom_confidence = sum(s.get("confidence", 1.0) for s in symptoms) / len(symptoms)
+        avg_symptom_confidence = sum(confidences) / symptom_count
 
         # Check category diversity
-        categories = set(s.get("category", "") for s in symptoms if s.get("category"))
-        category_diversity = len(categories) / max(1, len(symptoms) * 0.5)  # Expect ~2 categories per 10 symptoms
+        category_diversity = len(categories) / max(1, symptom_count * 0.5)  # Expect ~2 categories per 10 symptoms
 
         confidence = (base_confidence * 0.4) + (avg_symptom_confidence * 0.4) + (category_diversity * 0.2)
 
         return min(confidence, 1.0)
 
-    def _generate_sra_recommendations(self, symptoms: List[Dict[str, Any]]) -> List[str]:
+    def _generate_sra_recommendations(self, symptoms: List[SymptomView], temporal_codes: List[int]) -> List[str]:
         """Generate SRA recommendations for DA consideration"""
         recommendations = []
 
@@ -887,26 +937,20 @@ Extract symptoms and their attributes. Return JSON array:"""
             recommendations.append("Extensive symptom presentation - prioritize most severe symptoms")
 
         # Check for temporal patterns
-        acute_count = sum(1 for s in symptoms if any(word in s.get("duration", "").lower() for word in ["week", "weeks", "day", "days"]))
+        acute_count = temporal_codes.count(TEMPORAL_ACUTE)
         if acute_count > len(symptoms) * 0.7:
             recommendations.append("Primarily acute symptoms - consider recent onset conditions")
 
-        chronic_count = sum(1 for s in symptoms if any(word in s.get("duration", "").lower() for word in ["year", "years"]))
+        chronic_count = temporal_codes.count(TEMPORAL_CHRONIC)
         if chronic_count > len(symptoms) * 0.5:
             recommendations.append("Primarily chronic symptoms - consider long-term conditions")
 
         return recommendations
 
 
-# Global SRA service instance
-_sra_service: Optional[SRAService] = None
-
-
+@lru_cache(maxsize=None)
 def get_sra_service() -> SRAService:
     """Get global SRA service instance (singleton)"""
-    global _sra_service
-    if _sra_service is None:
-        _sra_service = SRAService()
-    return _sra_service
+    return SRAService()
 
 
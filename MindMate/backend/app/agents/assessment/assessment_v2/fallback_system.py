@@ -8,27 +8,55 @@ regardless of complex system issues.
 """
 
 import logging
+import sys
 import uuid
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Set
+from datetime import datetime, timedelta
 
 from app.core.logging_config import get_logger
 logger = get_logger(__name__)
 
+# Bounds for in-memory fallback sessions
+SESSION_TTL = timedelta(hours=24)
+MAX_SESSIONS = 10000
+
 class FallbackAssessmentSession:
     """Comprehensive session state for fallback system"""
 
-    def __init__(self, session_id: str, user_id: str):
+    def __init__(self, session_id: str, user_id: str, workflow_modules: List[Dict[str, Any]]):
         self.session_id = session_id
         self.user_id = user_id
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
+        self.workflow_modules = workflow_modules
         self.current_module_index = 0
-        self.module_responses = {}
+        self.current_question_index = 0
+        self.module_answers: List[List[Optional[str]]] = [[None] * len(m['questions']) for m in workflow_modules]
         self.completed_modules = []
+        self._completed_set: Set[str] = set()
         self.is_complete = False
         self.completed_at = None
 
+    def answered_count(self, module_index: int) -> int:
+        """Number of questions answered in the given module"""
+        if module_index < self.current_module_index:
+            return len(self.module_answers[module_index])
+        if module_index == self.current_module_index:
+            return self.current_question_index
+        return 0
+
+    @property
+    def module_responses(self) -> Dict[str, Dict[str, str]]:
+        """Answers keyed by module id and response key, for modules that have been started"""
+        responses = {}
+        for module, answers in zip(self.workflow_modules, self.module_answers):
+            answered = {key: answer for key, answer in zip(module['response_keys'], answers) if answer is not None}
+            if answered:
+                responses[module['id']] = answered
+        return responses
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "session_id": self.session_id,
@@ -56,8 +84,11 @@ class AssessmentFallbackSystem:
     7. TPA Treatment Planning - Treatment plan generation
     """
 
-    def __init__(self):
-        self.sessions: Dict[str, FallbackAssessmentSession] = {}
+    def __init__(self, session_ttl: timedelta = SESSION_TTL, max_sessions: int = MAX_SESSIONS):
+        # Ordered by last activity (oldest first) so stale sessions can be evicted from the front
+        self.sessions: "OrderedDict[str, FallbackAssessmentSession]" = OrderedDict()
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
 
         # Clinically accurate assessment workflow mirroring real modules
         self.workflow_modules = [
@@ -127,6 +158,16 @@ class AssessmentFallbackSystem:
             }
         ]
 
+        # Intern module identifiers used as dict keys in responses and progress maps
+        for module in self.workflow_modules:
+            module['id'] = sys.intern(module['id'])
+            module['name'] = sys.intern(module['name'])
+
+        # Workflow is fixed after init, so cache per-module totals
+        self._module_ids = tuple(m['id'] for m in self.workflow_modules)
+        self._question_counts = [len(m['questions']) for m in self.workflow_modules]
+        self._total_questions = sum(self._question_counts)
+
         self.completion_message = """
 ## 🎉 Assessment Complete!
 
@@ -157,55 +198,69 @@ Your responses are securely stored and will help your provider develop the most
 **Remember**: This assessment provides important information but professional evaluation and treatment planning require discussion with a qualified healthcare provider.
 """
 
+        # Pre-rendered module prompts (workflow is fixed after init)
+        self._module_first_prompt = [
+            f"""## {m['name']}
+*{m['description']}*
+
+{m['questions'][0]}"""
+            for m in self.workflow_modules
+        ]
+        self._start_prompt = f"""I apologize for the technical difficulty with our main assessment system. I'll guide you through a comprehensive assessment that covers all the key areas.
+
+{self._module_first_prompt[0]}"""
+        # _transition_prompt[i] is shown after module i completes
+        self._transition_prompt = [
+            f"""## ✅ {prev['name']} Complete
+
+Thank you for completing the {prev['name']} section.
+
+{self._module_first_prompt[i + 1]}"""
+            for i, prev in enumerate(self.workflow_modules[:-1])
+        ]
+
     def start_assessment(self, user_id: str, session_id: Optional[str] = None) -> str:
         """Start a new comprehensive fallback assessment session"""
         if not session_id:
             session_id = str(uuid.uuid4())
 
-        session = FallbackAssessmentSession(session_id, user_id)
+        session = FallbackAssessmentSession(session_id, user_id, self.workflow_modules)
         self.sessions[session_id] = session
+        self.sessions.move_to_end(session_id)
+        self._evict_stale_sessions()
 
         logger.info(f"Comprehensive fallback assessment started for user {user_id}, session {session_id}")
 
-        first_module = self.workflow_modules[0]
-        return f"""I apologize for the technical difficulty with our main assessment system. I'll guide you through a comprehensive assessment that covers all the key areas.
-
-## {first_module['name']}
-*{first_module['description']}*
-
-{first_module['questions'][0]}"""
+        return self._start_prompt
 
     def process_message(self, user_id: str, session_id: str, message: str) -> str:
         """Process user message in comprehensive fallback assessment"""
+        self._evict_stale_sessions()
         session = self.sessions.get(session_id)
         if not session:
             return "Session not found. Please start a new assessment."
 
+        # Keep LRU order and TTL in step: whatever moves to the end is also freshly touched
+        self.sessions.move_to_end(session_id)
+        session.updated_at = datetime.now()
+
         if session.is_complete:
             return "Assessment already completed. Thank you for your responses."
 
         current_module = self.workflow_modules[session.current_module_index]
 
-        # Initialize module responses if not exists
-        if current_module['id'] not in session.module_responses:
-            session.module_responses[current_module['id']] = {}
-
-        # Get current question index within this module
-        current_question_index = len(session.module_responses[current_module['id']])
-
         # Store current response
-        if current_question_index < len(current_module['response_keys']):
-            response_key = current_module['response_keys'][current_question_index]
-            session.module_responses[current_module['id']][response_key] = message.strip()
-            session.updated_at = datetime.now()
+        session.module_answers[session.current_module_index][session.current_question_index] = message.strip()
 
         # Move to next question or module
-        current_question_index += 1
+        session.current_question_index += 1
 
-        if current_question_index >= len(current_module['questions']):
+        if session.current_question_index >= self._question_counts[session.current_module_index]:
             # Module complete, move to next module
             session.completed_modules.append(current_module['id'])
+            session._completed_set.add(current_module['id'])
             session.current_module_index += 1
+            session.current_question_index = 0
 
             if session.current_module_index >= len(self.workflow_modules):
                 # Assessment complete
@@ -215,20 +270,22 @@ Your responses are securely stored and will help your provider develop the most
                 return self.completion_message
             else:
                 # Start next module
-                next_module = self.workflow_modules[session.current_module_index]
-                return f"""## ✅ {current_module['name']} Complete
-
-Thank you for completing the {current_module['name']} section.
-
-## {next_module['name']}
-*{next_module['description']}*
-
-{next_module['questions'][0]}"""
+                return self._transition_prompt[session.current_module_index - 1]
         else:
             # Next question in current module
-            next_question = current_module['questions'][current_question_index]
+            next_question = current_module['questions'][session.current_question_index]
             return next_question
 
+    def _evict_stale_sessions(self) -> None:
+        """Drop sessions idle longer than the TTL and cap the number kept in memory"""
+        cutoff = datetime.now() - self.session_ttl
+        while self.sessions:
+            oldest = next(iter(self.sessions.values()))
+            if len(self.sessions) <= self.max_sessions and oldest.updated_at >= cutoff:
+                break
+            self.sessions.popitem(last=False)
+            logger.debug(f"Evicted fallback assessment session {oldest.session_id}")
+
     def get_session_state(self, session_id: str) -> Optional[FallbackAssessmentSession]:
         """Get session state"""
         return self.sessions.get(session_id)
@@ -244,9 +301,9 @@ Thank you for completing the {current_module['name']} section.
 
         # Calculate overall progress
         completed_modules = len(session.completed_modules)
-        current_module = self.workflow_modules[min(current_module_index, total_modules - 1)]
-        current_module_responses = session.module_responses.get(current_module['id'], {})
-        current_module_progress = len(current_module_responses) / len(current_module['questions'])
+        current_position = min(current_module_index, total_modules - 1)
+        current_module = self.workflow_modules[current_position]
+        current_module_progress = session.answered_count(current_position) / self._question_counts[current_position]
 
         overall_percentage = int(((completed_modules + current_module_progress) / total_modules) * 100)
 
@@ -254,7 +311,7 @@ Thank you for completing the {current_module['name']} section.
         module_status = {}
         module_timeline = []
         for i, module in enumerate(self.workflow_modules):
-            if module['id'] in session.completed_modules:
+            if module['id'] in session._completed_set:
                 status = "completed"
             elif i == current_module_index:
                 status = "in_progress"
@@ -269,14 +326,14 @@ Thank you for completing the {current_module['name']} section.
             "percentage": overall_percentage,
             "is_complete": session.is_complete,
             "current_module": current_module['id'],
-            "module_sequence": [m['id'] for m in self.workflow_modules],
+            "module_sequence": list(self._module_ids),
             "module_status": module_status,
             "next_module": self.workflow_modules[current_module_index + 1]['id'] if current_module_index + 1 < total_modules else None,
             "module_timeline": module_timeline,
             "flow_info": {"fallback_mode": True, "reason": "Main assessment system unavailable"},
             "background_services": {},
             "overall_percentage": overall_percentage,
-            "module_percentage": {module['id']: (100 if module['id'] in session.completed_modules else (len(session.module_responses.get(module['id'], {})) / len(module['questions']) * 100)) for module in self.workflow_modules}
+            "module_percentage": {module_id: (100 if module_id in session._completed_set else (session.answered_count(i) / self._question_counts[i] * 100)) for i, module_id in enumerate(self._module_ids)}
         }
 
     def get_results(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -286,25 +343,26 @@ Thank you for completing the {current_module['name']} section.
             return None
 
         # Calculate totals
-        total_questions = sum(len(module['questions']) for module in self.workflow_modules)
-        questions_answered = sum(len(responses) for responses in session.module_responses.values())
+        total_questions = self._total_questions
+        questions_answered = sum(session.answered_count(i) for i in range(len(self._module_ids)))
 
         # Compile all responses
+        module_responses = session.module_responses
         all_responses = {}
-        for module_id, responses in session.module_responses.items():
+        for module_id, responses in module_responses.items():
             all_responses.update(responses)
 
         # Generate module summaries
         module_summaries = {}
-        for module in self.workflow_modules:
+        for i, module in enumerate(self.workflow_modules):
             module_id = module['id']
-            responses = session.module_responses.get(module_id, {})
+            responses = module_responses.get(module_id, {})
             module_summaries[module_id] = {
                 "name": module['name'],
                 "description": module['description'],
-                "completed": module_id in session.completed_modules,
-                "questions_total": len(module['questions']),
-                "questions_answered": len(responses),
+                "completed": module_id in session._completed_set,
+                "questions_total": self._question_counts[i],
+                "questions_answered": session.answered_count(i),
                 "responses": responses
             }
 
@@ -314,7 +372,7 @@ Thank you for completing the {current_module['name']} section.
             "assessment_type": "comprehensive_fallback_assessment",
             "completed_at": session.completed_at.isoformat() if session.completed_at else None,
             "responses": all_responses,
-            "module_responses": session.module_responses,
+            "module_responses": module_responses,
             "module_summaries": module_summaries,
             "completed_modules": session.completed_modules,
             "total_modules": len(self.workflow_modules),
@@ -322,19 +380,14 @@ Thank you for completing the {current_module['name']} section.
             "questions_answered": questions_answered,
             "is_complete": session.is_complete,
             "fallback_reason": "Main assessment system encountered an error",
-            "workflow_sequence": [m['id'] for m in self.workflow_modules]
+            "workflow_sequence": list(self._module_ids)
         }
 
     def is_available(self) -> bool:
         """Check if fallback system is available (always true)"""
         return True
 
-# Global fallback instance
-_fallback_instance = None
-
+@lru_cache(maxsize=None)
 def get_fallback_system() -> AssessmentFallbackSystem:
     """Get the global fallback system instance"""
-    global _fallback_instance
-    if _fallback_instance is None:
-        _fallback_instance = AssessmentFallbackSystem()
-    return _fallback_instance
+    return AssessmentFallbackSystem()
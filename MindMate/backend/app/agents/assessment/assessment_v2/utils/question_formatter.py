@@ -7,6 +7,13 @@ from typing import Dict, Any, Optional
 from ..base_types import SCIDQuestion, ResponseType
 
 
+# Response-type-specific fields added to the formatted question
+_RESPONSE_TYPE_FIELDS = {
+    ResponseType.MULTIPLE_CHOICE: lambda q: {"options": q.options},
+    ResponseType.SCALE: lambda q: {"scale_range": q.scale_range, "scale_labels": q.scale_labels},
+}
+
+
 class QuestionFormatter:
     """Formats questions for frontend display"""
     
@@ -38,19 +45,17 @@ class QuestionFormatter:
             "progress_percentage": progress_percentage,
             "estimated_time_remaining": estimated_time_remaining,
             "question_text": question.simple_text,
-            "help_text": question.help_text if question.help_text else None,
-            "examples": question.examples if question.examples else [],
+            "help_text": question.help_text or None,
+            "examples": question.examples or [],
             "response_type": question.response_type.value,
             "accepts_free_text": question.accepts_free_text,
             "free_text_prompt": question.free_text_prompt if question.accepts_free_text else None,
         }
         
         # Add response-specific fields
-        if question.response_type == ResponseType.MULTIPLE_CHOICE:
-            formatted["options"] = question.options
-        elif question.response_type == ResponseType.SCALE:
-            formatted["scale_range"] = question.scale_range
-            formatted["scale_labels"] = question.scale_labels
+        extra_fields = _RESPONSE_TYPE_FIELDS.get(question.response_type)
+        if extra_fields:
+            formatted.update(extra_fields(question))
         
         # Note: We do NOT include:
         # - clinical_text (backend only)
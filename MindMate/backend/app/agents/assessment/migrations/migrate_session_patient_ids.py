@@ -13,11 +13,21 @@ Usage:
 
 Or from project root:
     python -m app.agents.assessment.migrations.migrate_session_patient_ids
+
+Pass --workers N to migrate N disjoint id ranges concurrently.
+
+Progress is checkpointed per id range in the migration_state table, so an
+interrupted run resumes where it stopped. A range's checkpoint is removed once
+the range completes, so the next run scans it in full again (session ids are
+random, so new sessions land anywhere in the keyspace). Pass --reset to
+discard all checkpoints, including those left by interrupted runs.
 """
 
 import sys
 import logging
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from datetime import datetime
 import uuid
 
@@ -28,14 +38,157 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when scanning sessions
+BATCH_SIZE = 1000
+
+# Largest UUID; upper bound of the last id range
+MAX_UUID = uuid.UUID(int=(1 << 128) - 1)
+
+# Prefix of this script's checkpoint rows in migration_state
+MIGRATION_NAME = "migrate_session_patient_ids"
+
 try:
-    from app.db.session import SessionLocal
+    from sqlalchemy import String, cast, func, or_, text
+    from app.db.session import SessionLocal, engine
     from app.models.assessment import AssessmentSession
     DATABASE_AVAILABLE = True
 except ImportError as e:
     logger.error(f"Failed to import database models: {e}")
     DATABASE_AVAILABLE = False
 
+# Copies the patient_id column into session_metadata for one keyset batch of
+# sessions (ids in (:cursor, :upper_bound]) and reports the batch's last id,
+# size and number of rows updated.
+MIGRATE_BATCH_SQL = """
+WITH batch AS (
+    SELECT id FROM assessment_sessions
+    WHERE id > CAST(:cursor AS uuid)
+      AND id <= CAST(:upper_bound AS uuid)
+    ORDER BY id
+    LIMIT :batch_size
+), migrated AS (
+    UPDATE assessment_sessions AS s
+    SET session_metadata = (
+            CASE WHEN jsonb_typeof(s.session_metadata) = 'object'
+                 THEN s.session_metadata ELSE '{}'::jsonb END
+        ) || jsonb_build_object(
+            'patient_id', s.patient_id::text,
+            'migration_date', CAST(:migration_date AS text),
+            'migration_version', '1.0'
+        ),
+        updated_at = now()
+    FROM batch
+    WHERE s.id = batch.id
+      AND s.patient_id IS NOT NULL
+      AND (s.session_metadata IS NULL
+           OR s.session_metadata->>'patient_id' IS DISTINCT FROM s.patient_id::text)
+    RETURNING s.id
+)
+SELECT
+    (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+    (SELECT count(*) FROM batch) AS scanned,
+    (SELECT count(*) FROM migrated) AS migrated
+"""
+
+
+CREATE_STATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS migration_state (
+    name TEXT PRIMARY KEY,
+    last_id UUID,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+)
+"""
+
+LOAD_CHECKPOINT_SQL = "SELECT last_id FROM migration_state WHERE name = :name"
+
+SAVE_CHECKPOINT_SQL = """
+INSERT INTO migration_state (name, last_id, updated_at)
+VALUES (:name, CAST(:last_id AS uuid), now())
+ON CONFLICT (name) DO UPDATE
+SET last_id = EXCLUDED.last_id, updated_at = EXCLUDED.updated_at
+"""
+
+CLEAR_CHECKPOINT_SQL = "DELETE FROM migration_state WHERE name = :name"
+
+RESET_CHECKPOINTS_SQL = "DELETE FROM migration_state WHERE name LIKE :prefix"
+
+# Last id and size of the batch MIGRATE_BATCH_SQL would take, for skipping a
+# batch whose UPDATE failed
+BATCH_BOUNDS_SQL = """
+WITH batch AS (
+    SELECT id FROM assessment_sessions
+    WHERE id > CAST(:cursor AS uuid)
+      AND id <= CAST(:upper_bound AS uuid)
+    ORDER BY id
+    LIMIT :batch_size
+)
+SELECT
+    (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+    (SELECT count(*) FROM batch) AS scanned
+"""
+
+# Session-level advisory lock keeping two runs from migrating concurrently
+TRY_LOCK_SQL = "SELECT pg_try_advisory_lock(hashtext(:name))"
+UNLOCK_SQL = "SELECT pg_advisory_unlock(hashtext(:name))"
+
+
+def checkpoint_name(lower: uuid.UUID, upper: uuid.UUID) -> str:
+    """Checkpoint key for one id range; ranges differ per worker count"""
+    return f"{MIGRATION_NAME}:{lower}-{upper}"
+
+
+def pending_migration_filter():
+    """
+    SQL predicate matching sessions whose metadata lacks, or disagrees with,
+    the patient_id column. Evaluated by Postgres so already-migrated rows are
+    never fetched.
+    """
+    metadata = AssessmentSession.session_metadata
+    return or_(
+        metadata.is_(None),
+        ~metadata.has_key("patient_id"),
+        metadata["patient_id"].astext != cast(AssessmentSession.patient_id, String)
+    )
+
+
+def iter_session_batches(db_session, batch_size: int = BATCH_SIZE) -> Iterator[List[AssessmentSession]]:
+    """
+    Yield sessions pending migration in primary-key order, one batch at a time.
+    
+    Uses keyset pagination on id so each batch is a fresh, bounded query and
+    commits between batches do not invalidate an open cursor.
+    """
+    last_id = None
+    while True:
+        query = (
+            db_session.query(AssessmentSession)
+            .filter(AssessmentSession.patient_id.isnot(None))
+            .filter(pending_migration_filter())
+            .order_by(AssessmentSession.id)
+        )
+        if last_id is not None:
+            query = query.filter(AssessmentSession.id > last_id)
+        batch = query.limit(batch_size).all()
+        if not batch:
+            return
+        last_id = batch[-1].id
+        yield batch
+
+
+def _to_uuid_str(value: Any) -> str:
+    """
+    Normalize a UUID value to its canonical string form.
+    
+    UUID instances (as returned by the UUID(as_uuid=True) column) are
+    formatted directly; anything else is parsed first.
+    
+    Raises:
+        ValueError, TypeError: If the value is not a valid UUID
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return str(uuid.UUID(str(value)))
+
 
 def get_patient_id_from_session(session_model: AssessmentSession) -> Optional[str]:
     """
@@ -52,7 +205,7 @@ def get_patient_id_from_session(session_model: AssessmentSession) -> Optional[st
     # First check database column (most reliable)
     if session_model.patient_id:
         try:
-            return str(uuid.UUID(str(session_model.patient_id)))
+            return _to_uuid_str(session_model.patient_id)
         except (ValueError, TypeError):
             logger.warning(f"Invalid patient_id format in database for session {session_model.session_id}")
     
@@ -61,7 +214,7 @@ def get_patient_id_from_session(session_model: AssessmentSession) -> Optional[st
         metadata_patient_id = session_model.session_metadata.get("patient_id")
         if metadata_patient_id:
             try:
-                return str(uuid.UUID(str(metadata_patient_id)))
+                return _to_uuid_str(metadata_patient_id)
             except (ValueError, TypeError):
                 logger.warning(f"Invalid patient_id format in metadata for session {session_model.session_id}")
     
@@ -76,11 +229,22 @@ def needs_migration(session_model: AssessmentSession) -> bool:
     1. patient_id is missing from metadata, OR
     2. patient_id in metadata doesn't match database column
     """
+    # Fast path: identical raw values need no UUID parsing
+    raw_db_patient_id = session_model.patient_id
+    metadata = session_model.session_metadata
+    raw_metadata_patient_id = metadata.get("patient_id") if isinstance(metadata, dict) else None
+    if (
+        raw_db_patient_id is not None
+        and raw_metadata_patient_id is not None
+        and str(raw_db_patient_id) == str(raw_metadata_patient_id)
+    ):
+        return False
+    
     # Get patient_id from database
     db_patient_id = None
     if session_model.patient_id:
         try:
-            db_patient_id = str(uuid.UUID(str(session_model.patient_id)))
+            db_patient_id = _to_uuid_str(session_model.patient_id)
         except (ValueError, TypeError):
             pass
     
@@ -90,7 +254,7 @@ def needs_migration(session_model: AssessmentSession) -> bool:
         metadata_patient_id = session_model.session_metadata.get("patient_id")
         if metadata_patient_id:
             try:
-                metadata_patient_id = str(uuid.UUID(str(metadata_patient_id)))
+                metadata_patient_id = _to_uuid_str(metadata_patient_id)
             except (ValueError, TypeError):
                 metadata_patient_id = None
     
@@ -110,48 +274,150 @@ def needs_migration(session_model: AssessmentSession) -> bool:
     return False
 
 
-def migrate_session(session_model: AssessmentSession, db_session) -> bool:
+def preview_migration(db_session, stats: Dict[str, Any]) -> None:
+    """Log the sessions a migration run would update, without changing them"""
+    scanned = 0
+    for batch in iter_session_batches(db_session):
+        scanned += len(batch)
+        for session_model in batch:
+            try:
+                # Defensive double-check of the SQL pre-filter
+                if needs_migration(session_model):
+                    stats["needs_migration"] += 1
+                    patient_id = get_patient_id_from_session(session_model)
+                    logger.info(
+                        f"[DRY RUN] Would migrate session {session_model.session_id} "
+                        f"with patient_id {patient_id}"
+                    )
+                    stats["migrated"] += 1
+                else:
+                    stats["skipped"] += 1
+                    
+            except Exception as e:
+                logger.error(f"Error processing session {session_model.session_id}: {e}", exc_info=True)
+                stats["failed"] += 1
+                stats["errors"].append({
+                    "session_id": session_model.session_id,
+                    "error": str(e)
+                })
+    
+    # Rows excluded by the SQL pre-filter are already migrated
+    stats["skipped"] += stats["total_sessions"] - scanned
+
+
+def split_id_ranges(workers: int) -> List[Tuple[uuid.UUID, uuid.UUID]]:
     """
-    Migrate a single session to include patient_id in metadata.
+    Split the UUID keyspace into `workers` contiguous (lower, upper] ranges.
     
-    Returns:
-        True if migration succeeded, False otherwise
+    Session ids are random (uuid4), so equal-width ranges hold roughly equal
+    numbers of rows without having to sample the table first.
+    """
+    width = ((1 << 128) - 1) // workers
+    bounds = [uuid.UUID(int=i * width) for i in range(workers)] + [MAX_UUID]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def migrate_id_range(
+    lower: uuid.UUID,
+    upper: uuid.UUID,
+    stats: Dict[str, Any],
+    stats_lock: threading.Lock,
+    batch_size: int = BATCH_SIZE
+) -> None:
     """
+    Migrate sessions with ids in (lower, upper] using server-side UPDATEs.
+    
+    Runs on its own session/connection so ranges can be processed in parallel;
+    walks the range in primary-key order and commits after each batch to keep
+    row locks short. The range's checkpoint is saved in the same transaction
+    as each batch and, if present, is where the walk starts; it is cleared
+    when the range completes.
+    
+    A batch whose UPDATE fails is rolled back, its sessions are counted as
+    failed and the walk continues after it.
+    """
+    name = checkpoint_name(lower, upper)
+    db_session = SessionLocal()
     try:
-        # Get patient_id (prefer database column)
-        patient_id = get_patient_id_from_session(session_model)
-        
-        if not patient_id:
-            logger.error(f"Cannot migrate session {session_model.session_id}: no patient_id found")
-            return False
-        
-        # Initialize metadata if needed
-        if not session_model.session_metadata or not isinstance(session_model.session_metadata, dict):
-            session_model.session_metadata = {}
-        
-        # Update metadata with patient_id
-        session_model.session_metadata["patient_id"] = patient_id
-        session_model.session_metadata["migration_date"] = datetime.now().isoformat()
-        session_model.session_metadata["migration_version"] = "1.0"
-        
-        # Commit changes
-        db_session.commit()
-        
-        logger.info(f"✓ Migrated session {session_model.session_id} with patient_id {patient_id}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to migrate session {session_model.session_id}: {e}", exc_info=True)
+        checkpoint = db_session.execute(text(LOAD_CHECKPOINT_SQL), {"name": name}).scalar()
+        cursor = str(checkpoint or lower)
+        if checkpoint:
+            logger.info(f"Resuming range ({lower}, {upper}] after id {cursor}")
+        while True:
+            params = {"cursor": cursor, "upper_bound": str(upper), "batch_size": batch_size}
+            try:
+                row = db_session.execute(
+                    text(MIGRATE_BATCH_SQL),
+                    {**params, "migration_date": datetime.now().isoformat()}
+                ).one()
+                if row.scanned:
+                    db_session.execute(text(SAVE_CHECKPOINT_SQL), {"name": name, "last_id": str(row.last_id)})
+                db_session.commit()
+            except Exception as e:
+                db_session.rollback()
+                failed = db_session.execute(text(BATCH_BOUNDS_SQL), params).one()
+                logger.error(f"Error migrating {failed.scanned} sessions after id {cursor}: {e}", exc_info=True)
+                with stats_lock:
+                    stats["failed"] += failed.scanned
+                    stats["errors"].append({"after_id": cursor, "error": str(e)})
+                if not failed.scanned:
+                    break
+                cursor = str(failed.last_id)
+                continue
+            
+            if not row.scanned:
+                # Range complete: the next run should scan it in full again
+                db_session.execute(text(CLEAR_CHECKPOINT_SQL), {"name": name})
+                db_session.commit()
+                break
+            
+            with stats_lock:
+                stats["needs_migration"] += row.migrated
+                stats["migrated"] += row.migrated
+                stats["skipped"] += row.scanned - row.migrated
+            cursor = str(row.last_id)
+            logger.info(f"✓ Migrated {row.migrated} of {row.scanned} sessions up to id {cursor}")
+    except Exception:
         db_session.rollback()
-        return False
+        raise
+    finally:
+        db_session.close()
 
 
-def run_migration(dry_run: bool = False) -> Dict[str, Any]:
+def migrate_in_database(stats: Dict[str, Any], workers: int = 1, batch_size: int = BATCH_SIZE) -> None:
+    """
+    Migrate all sessions, processing `workers` disjoint id ranges concurrently.
+    
+    The work is IO-bound on the database, so threads suffice; each range
+    holds one pooled connection for its duration.
+    """
+    stats_lock = threading.Lock()
+    ranges = split_id_ranges(workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(migrate_id_range, lower, upper, stats, stats_lock, batch_size)
+            for lower, upper in ranges
+        ]
+        for future in as_completed(futures):
+            # Re-raise the first worker failure
+            future.result()
+
+
+def reset_checkpoints(db_session) -> int:
+    """Delete this migration's checkpoints; returns the number removed"""
+    result = db_session.execute(text(RESET_CHECKPOINTS_SQL), {"prefix": f"{MIGRATION_NAME}:%"})
+    db_session.commit()
+    return result.rowcount
+
+
+def run_migration(dry_run: bool = False, workers: int = 1, reset: bool = False) -> Dict[str, Any]:
     """
     Run the migration for all assessment sessions.
     
     Args:
         dry_run: If True, only report what would be migrated without making changes
+        workers: Number of id ranges to migrate concurrently (ignored for dry runs)
+        reset: If True, discard saved checkpoints and start from the beginning
         
     Returns:
         Dictionary with migration statistics
@@ -173,45 +439,34 @@ def run_migration(dry_run: bool = False) -> Dict[str, Any]:
     }
     
     db_session = SessionLocal()
+    lock_connection = None
+    locked = False
     
     try:
-        # Get all assessment sessions
-        all_sessions = db_session.query(AssessmentSession).all()
-        stats["total_sessions"] = len(all_sessions)
+        if not dry_run:
+            # Held on a dedicated connection for the whole run; worker sessions
+            # and per-batch commits don't affect a session-level lock
+            lock_connection = engine.connect()
+            locked = lock_connection.execute(text(TRY_LOCK_SQL), {"name": MIGRATION_NAME}).scalar()
+            if not locked:
+                logger.error("Another instance of this migration is running - exiting")
+                stats["success"] = False
+                stats["error"] = "Another migration instance is running"
+                return stats
         
-        logger.info(f"Found {stats['total_sessions']} assessment sessions")
+        stats["total_sessions"] = db_session.query(func.count(AssessmentSession.id)).scalar()
         
-        for session_model in all_sessions:
-            try:
-                if needs_migration(session_model):
-                    stats["needs_migration"] += 1
-                    
-                    if dry_run:
-                        patient_id = get_patient_id_from_session(session_model)
-                        logger.info(
-                            f"[DRY RUN] Would migrate session {session_model.session_id} "
-                            f"with patient_id {patient_id}"
-                        )
-                        stats["migrated"] += 1
-                    else:
-                        if migrate_session(session_model, db_session):
-                            stats["migrated"] += 1
-                        else:
-                            stats["failed"] += 1
-                else:
-                    stats["skipped"] += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing session {session_model.session_id}: {e}", exc_info=True)
-                stats["failed"] += 1
-                stats["errors"].append({
-                    "session_id": session_model.session_id,
-                    "error": str(e)
-                })
+        logger.info(f"Found {stats['total_sessions']} assessment sessions")
         
-        # Final commit if not dry run
-        if not dry_run:
+        if dry_run:
+            preview_migration(db_session, stats)
+        else:
+            db_session.execute(text(CREATE_STATE_TABLE_SQL))
             db_session.commit()
+            if reset:
+                removed = reset_checkpoints(db_session)
+                logger.info(f"Cleared {removed} migration checkpoints")
+            migrate_in_database(stats, workers=max(1, workers))
         
         logger.info("=" * 60)
         logger.info("Migration Summary:")
@@ -234,6 +489,10 @@ def run_migration(dry_run: bool = False) -> Dict[str, Any]:
         
     finally:
         db_session.close()
+        if lock_connection is not None:
+            if locked:
+                lock_connection.execute(text(UNLOCK_SQL), {"name": MIGRATION_NAME})
+            lock_connection.close()
 
 
 def main():
@@ -248,6 +507,17 @@ def main():
         action="store_true",
         help="Run migration in dry-run mode (no changes made)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of id ranges to migrate in parallel (default: 1)"
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Discard saved checkpoints and rescan all sessions"
+    )
     
     args = parser.parse_args()
     
@@ -258,7 +528,7 @@ def main():
     if args.dry_run:
         logger.info("Running in DRY RUN mode - no changes will be made")
     
-    result = run_migration(dry_run=args.dry_run)
+    result = run_migration(dry_run=args.dry_run, workers=args.workers, reset=args.reset)
     
     if result.get("success"):
         logger.info("Migration completed successfully")
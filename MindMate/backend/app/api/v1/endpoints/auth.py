@@ -10,6 +10,7 @@ Version: 2.0.0 - Consolidated authentication system
 
 import os
 import re
+import time
 import uuid
 import secrets
 import hashlib
@@ -19,6 +20,7 @@ from typing import Optional, Dict, Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr, Field, field_validator
 import bcrypt
@@ -69,6 +71,13 @@ if not PLATFORM_ADMIN_KEY:
     logger.critical("⚠️ ADMIN_REGISTRATION_KEY environment variable not set! Admin login will not work.")
     PLATFORM_ADMIN_KEY = "ADMIN-KEY-NOT-SET-" + secrets.token_urlsafe(16)  # Unusable random value
 
+# Short-lived cache of verified token claims (keyed by SHA256 of the token).
+# Claims depend only on the token, so entries never go stale; the user and its
+# account status are still read from the database on every request.
+TOKEN_CLAIMS_CACHE_TTL_SECONDS = 60
+TOKEN_CLAIMS_CACHE_MAX_ENTRIES = 10000
+_token_claims_cache: Dict[str, Dict[str, Any]] = {}
+
 # ============================================================================
 # PYDANTIC MODELS
 # ============================================================================
@@ -609,6 +618,33 @@ def authenticate_admin(db: Session, email: str, password: str, secret_key: str)
 # DEPENDENCY FUNCTIONS
 # ============================================================================
 
+def _get_cached_token_claims(token_key: str) -> Optional[dict]:
+    """Return the cached claims for a token, if present and not expired"""
+    entry = _token_claims_cache.get(token_key)
+    if entry is None:
+        return None
+    if entry["expires_at"] < time.time():
+        _token_claims_cache.pop(token_key, None)
+        return None
+    return entry["payload"]
+
+
+def _cache_token_claims(token_key: str, payload: dict) -> None:
+    """Store verified claims for a token"""
+    now = time.time()
+    if len(_token_claims_cache) >= TOKEN_CLAIMS_CACHE_MAX_ENTRIES:
+        for key in [k for k, v in _token_claims_cache.items() if v["expires_at"] < now]:
+            _token_claims_cache.pop(key, None)
+        if len(_token_claims_cache) >= TOKEN_CLAIMS_CACHE_MAX_ENTRIES:
+            _token_claims_cache.clear()
+    # Never serve cached claims past the token's own expiry
+    token_exp = payload.get("exp")
+    expires_at = now + TOKEN_CLAIMS_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, float(token_exp))
+    _token_claims_cache[token_key] = {"expires_at": expires_at, "payload": payload}
+
+
 async def get_current_user_from_token(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db)
@@ -631,6 +667,9 @@ async def get_current_user_from_token(
 
         token = credentials.credentials
 
+        token_key = hashlib.sha256(token.strip().encode()).hexdigest()
+        payload = _get_cached_token_claims(token_key)
+
         try:
             # Clean and validate token format
             token = token.strip()
@@ -642,7 +681,9 @@ async def get_current_user_from_token(
                     headers={"WWW-Authenticate": "Bearer"},
                 )
             
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            if payload is None:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+                _cache_token_claims(token_key, payload)
         except jwt.ExpiredSignatureError:
             logger.error(f"JWT decode error: Token expired")
             raise HTTPException(
@@ -678,18 +719,19 @@ async def get_current_user_from_token(
         auth_info = None
 
         try:
+            # User and auth info come back in one round trip; status is re-checked on every request
             if user_type == "patient":
-                user = db.query(Patient).filter(
+                row = db.query(Patient, PatientAuthInfo).outerjoin(
+                    PatientAuthInfo, PatientAuthInfo.patient_id == Patient.id
+                ).filter(
                     Patient.id == user_id,
                     Patient.email == email,
                     Patient.is_deleted == False
                 ).first()
+                if row:
+                    user, auth_info = row
 
                 if user:
-                    auth_info = db.query(PatientAuthInfo).filter(
-                        PatientAuthInfo.patient_id == user.id
-                    ).first()
-
                     if not auth_info or not auth_info.is_verified:
                         raise HTTPException(
                             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -697,18 +739,21 @@ async def get_current_user_from_token(
                         )
 
             elif user_type == "specialist":
-                user = db.query(Specialists).filter(
+                row = db.query(Specialists, SpecialistsAuthInfo).outerjoin(
+                    SpecialistsAuthInfo,
+                    and_(
+                        SpecialistsAuthInfo.specialist_id == Specialists.id,
+                        SpecialistsAuthInfo.email_verification_status == EmailVerificationStatusEnum.VERIFIED
+                    )
+                ).filter(
                     Specialists.id == user_id,
                     Specialists.email == email,
                     Specialists.is_deleted == False
                 ).first()
+                if row:
+                    user, auth_info = row
 
                 if user:
-                    auth_info = db.query(SpecialistsAuthInfo).filter(
-                        SpecialistsAuthInfo.specialist_id == user.id,
-                        SpecialistsAuthInfo.email_verification_status == EmailVerificationStatusEnum.VERIFIED
-                    ).first()
-
                     if not auth_info:
                         raise HTTPException(
                             status_code=status.HTTP_401_UNAUTHORIZED,
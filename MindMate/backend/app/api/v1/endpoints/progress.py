@@ -7,13 +7,18 @@ Author: MindMate Team
 Version: 1.0.0
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Body
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, aliased, raiseload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy import JSON, Numeric, String, cast, func, delete, desc, and_, insert, lambda_stmt, literal, select, true, tuple_, union_all, update
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime, timedelta, timezone
 from uuid import UUID
+from pydantic import TypeAdapter
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.api.v1.endpoints.auth import get_current_user_from_token
 from app.models.patient import (
@@ -24,52 +29,182 @@ from app.models.patient import (
 from app.schemas.progress import (
     ExerciseProgressResponse, ExerciseProgressUpdate,
     StreakResponse, PracticeCalendarResponse,
-    DashboardStats, CalendarDayData, ExerciseAnalytics,
+    DashboardStats, CalendarDayData,
     MoodTrendDataPoint, SessionStartRequest, SessionUpdateRequest,
     SessionCompleteRequest, SessionQuickCompleteRequest, SessionResponse, PaginatedSessionsResponse,
     GoalCreateRequest, GoalUpdateRequest, GoalResponse,
-    PaginatedGoalsResponse, AchievementResponse, AchievementDefinition
+    PaginatedGoalsResponse, AchievementResponse, AchievementDefinition,
+    PaginatedExerciseAnalyticsResponse, PaginatedCalendarResponse, StreakCalendarResponse
+)
+from app.services.progress_service import (
+    ProgressService, get_cached_achievements, cache_achievements, invalidate_achievements_cache,
+    get_cached_stats, cache_stats, invalidate_stats_cache, get_cached_streak, cache_streak,
+    invalidate_progress_caches
+)
+from app.utils.achievements_config import (
+    ACHIEVEMENTS, get_achievement_by_id, get_achievements_by_category, get_all_achievement_ids
 )
-from app.services.progress_service import ProgressService
-from app.utils.achievements_config import ACHIEVEMENTS, get_all_achievement_ids
 
 router = APIRouter(prefix="/progress-tracker", tags=["Progress Tracker"])
 
+# Matches the user_goals_active_limit trigger
+MAX_ACTIVE_GOALS = 3
+
+# exercise_progress columns that ExerciseProgressResponse reads directly
+_EXERCISE_PROGRESS_COLUMNS = tuple(
+    column for name, column in ExerciseProgress.__table__.c.items()
+    if name in ExerciseProgressResponse.model_fields
+)
+
+# user_streaks columns behind StreakResponse (is_active is computed)
+_STREAK_COLUMNS = tuple(
+    column for name, column in UserStreak.__table__.c.items()
+    if name in StreakResponse.model_fields
+)
+
+# practice_calendar columns behind CalendarDayData, in its field order
+_CALENDAR_DAY_COLUMNS = (
+    PracticeCalendar.practice_date, PracticeCalendar.session_count,
+    PracticeCalendar.intensity_level, PracticeCalendar.exercises_practiced
+)
+
+# exercise_progress columns behind ExerciseAnalytics, labelled by its field names
+_EXERCISE_ANALYTICS_COLUMNS = (
+    ExerciseProgress.exercise_name,
+    ExerciseProgress.completion_count,
+    ExerciseProgress.total_time_hours.label("total_time_hours"),
+    ExerciseProgress.average_session_duration_minutes.label("average_session_duration_minutes"),
+    ExerciseProgress.average_mood_improvement,
+    ExerciseProgress.mastery_level,
+    ExerciseProgress.last_practiced_at.label("last_practiced"),
+    ExerciseProgress.is_favorite
+)
+
+# Tables cleared by a progress reset
+_PROGRESS_MODELS = (ExerciseSession, UserGoal, UserAchievement, ExerciseProgress, UserStreak)
+
+# Validate a whole page of ORM rows in one pass rather than model by model
+_SESSION_LIST_ADAPTER = TypeAdapter(List[SessionResponse])
+_GOAL_LIST_ADAPTER = TypeAdapter(List[GoalResponse])
+
+
+
+# hour (0-23) -> TimeOfDay; morning 5-11, afternoon 12-16, evening 17-20, night otherwise
+_HOUR_BUCKETS = [TimeOfDay.NIGHT] * 24
+for _hour in range(5, 12):
+    _HOUR_BUCKETS[_hour] = TimeOfDay.MORNING
+for _hour in range(12, 17):
+    _HOUR_BUCKETS[_hour] = TimeOfDay.AFTERNOON
+for _hour in range(17, 21):
+    _HOUR_BUCKETS[_hour] = TimeOfDay.EVENING
+del _hour
 
 
 def _determine_time_of_day(reference: Optional[datetime] = None) -> TimeOfDay:
     """Infer the time of day bucket based on a reference datetime (defaults to now)."""
-    reference = reference or datetime.now()
-    hour = reference.hour
-    if 5 <= hour < 12:
-        return TimeOfDay.MORNING
-    if 12 <= hour < 17:
-        return TimeOfDay.AFTERNOON
-    if 17 <= hour < 21:
-        return TimeOfDay.EVENING
-    return TimeOfDay.NIGHT
+    return _HOUR_BUCKETS[(reference or datetime.now()).hour]
 
 
 def _normalize_time_of_day(value: Optional[object]) -> TimeOfDay:
     """Convert incoming request value to TimeOfDay enum, falling back to inferred value."""
-    if value is None:
-        return _determine_time_of_day()
     if isinstance(value, TimeOfDay):
         return value
-    if hasattr(value, "value"):
-        return TimeOfDay(value.value)
-    return TimeOfDay(str(value))
+    if value is None:
+        return _determine_time_of_day()
+    # Other enums (e.g. the request schema's) carry the raw string in .value
+    return TimeOfDay(str(getattr(value, "value", value)))
 
 
 def _normalize_location_type(value: Optional[object]) -> Optional[LocationType]:
     """Convert incoming request value to LocationType enum."""
-    if value is None:
-        return None
     if isinstance(value, LocationType):
         return value
-    if hasattr(value, "value"):
-        return LocationType(value.value)
-    return LocationType(str(value))
+    if value is None:
+        return None
+    return LocationType(str(getattr(value, "value", value)))
+
+
+def _entity_query(db: Session, *entities):
+    """
+    db.query() for ORM entities; in DEBUG any lazy relationship load on the
+    results raises, so N+1 access during serialization fails loudly.
+    """
+    query = db.query(*entities)
+    return query.options(raiseload("*")) if settings.DEBUG else query
+
+
+def _first_entity(db: Session, stmt):
+    """
+    Run a lambda_stmt() entity lookup and return the first result or None.
+
+    The lambda's SQL is compiled once per call site and reused; closure
+    variables become bound parameters. Applies the same DEBUG raiseload as
+    _entity_query.
+    """
+    if settings.DEBUG:
+        stmt = stmt + (lambda s: s.options(raiseload("*")))
+    return db.scalars(stmt).first()
+
+
+def _calendar_range(year: int, month: Optional[int] = None) -> tuple:
+    """[start, end) dates of a year or month, for sargable practice_date filters"""
+    if month is None:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    return date(year, month, 1), date(year + (month == 12), month % 12 + 1, 1)
+
+
+def _calendar_day_data(rows) -> List[CalendarDayData]:
+    """CalendarDayData from (practice_date, session_count, intensity_level, exercises) rows"""
+    return [
+        CalendarDayData(date=practice_date.isoformat(), count=count, intensity=intensity, exercises=exercises or [])
+        for practice_date, count, intensity, exercises in rows
+    ]
+
+
+def _calendar_day_dicts(rows) -> List[Dict[str, Any]]:
+    """CalendarDayData-shaped dicts from the same rows, for ORJSONResponse"""
+    return [
+        {"date": practice_date, "count": count, "intensity": intensity, "exercises": exercises or []}
+        for practice_date, count, intensity, exercises in rows
+    ]
+
+
+def _delete_patient_rows(db: Session, patient_id: UUID, models: tuple) -> Dict[str, int]:
+    """
+    Delete a patient's rows from several tables in a single statement.
+
+    Each DELETE runs as a data-modifying CTE of one round trip; returns the
+    number of rows removed per table.
+    """
+    deleted = [
+        delete(model).where(model.patient_id == patient_id).returning(model.id).cte(
+            f"deleted_{model.__tablename__}"
+        )
+        for model in models
+    ]
+    row = db.execute(
+        select(*(select(func.count()).select_from(cte).scalar_subquery().label(cte.name) for cte in deleted))
+    ).one()
+    return dict(row._mapping)
+
+
+def _encode_keyset_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Build the keyset cursor pointing just past the row with this (timestamp, id)."""
+    return f"{timestamp.isoformat()}|{row_id}"
+
+
+def _decode_keyset_cursor(cursor: str) -> tuple:
+    """Parse a `<iso_timestamp>|<row_id>` cursor; the id part is optional."""
+    raw_time, _, raw_id = cursor.partition("|")
+    try:
+        start_time = datetime.fromisoformat(raw_time.strip())
+        session_id = UUID(raw_id.strip()) if raw_id.strip() else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return start_time, session_id
 
 
 
@@ -130,10 +265,10 @@ async def start_session(
         )
         
         db.add(session)
-        db.commit()
-        db.refresh(session)
+        db.flush()
         
-        return SessionResponse(
+        # Build the response from the flushed row; commit expires it
+        response = SessionResponse(
             id=session.id,
             patient_id=session.patient_id,
             exercise_name=session.exercise_name,
@@ -145,6 +280,10 @@ async def start_session(
             session_completed=False,
             created_at=session.created_at
         )
+        db.commit()
+        invalidate_stats_cache(user.id)
+        
+        return response
         
     except Exception as e:
         db.rollback()
@@ -174,7 +313,7 @@ async def update_session(
         user = current_user_data["user"]
         
         # Find session
-        session = db.query(ExerciseSession).filter(
+        session = _entity_query(db, ExerciseSession).filter(
             ExerciseSession.id == session_id,
             ExerciseSession.patient_id == user.id
         ).first()
@@ -194,10 +333,11 @@ async def update_session(
         
         session.updated_at = datetime.now()
         
+        db.flush()
+        response = SessionResponse.model_validate(session, from_attributes=True)
         db.commit()
-        db.refresh(session)
         
-        return SessionResponse.from_orm(session)
+        return response
         
     except HTTPException:
         raise
@@ -225,7 +365,7 @@ async def complete_session(
         user = current_user_data["user"]
         
         # Find session
-        session = db.query(ExerciseSession).filter(
+        session = _entity_query(db, ExerciseSession).filter(
             ExerciseSession.id == session_id,
             ExerciseSession.patient_id == user.id
         ).first()
@@ -250,28 +390,22 @@ async def complete_session(
             minutes = max(request.duration_minutes, 0)
             session.duration_seconds = int(round(minutes * 60))
         elif session.start_time:
-            # Ensure both datetimes are timezone-aware for subtraction
-            start_time = session.start_time
-            if start_time.tzinfo is None:
-                # If start_time is naive, assume it's UTC
-                start_time = start_time.replace(tzinfo=timezone.utc)
-            elif start_time.tzinfo != timezone.utc:
-                # Convert to UTC if different timezone
-                start_time = start_time.astimezone(timezone.utc)
-            
-            duration_seconds = int((completion_timestamp - start_time).total_seconds())
+            # start_time is a timezone-aware column (set in UTC by start_session),
+            # so epoch arithmetic needs no tzinfo normalization
+            duration_seconds = int(completion_timestamp.timestamp() - session.start_time.timestamp())
             if duration_seconds > 0:
                 session.duration_seconds = duration_seconds
         
         if session.mood_before is not None and session.mood_after is not None:
             session.mood_improvement = session.mood_after - session.mood_before
         
-        db.commit()
-        db.refresh(session)
+        db.flush()
+        response = SessionResponse.model_validate(session, from_attributes=True)
         
+        # Committed together with the progress/streak/goal updates
         ProgressService.process_session_completion(db, user.id, session)
         
-        return SessionResponse.from_orm(session)
+        return response
         
     except HTTPException:
         raise
@@ -296,7 +430,7 @@ async def quick_complete_session(
         time_of_day = _normalize_time_of_day(request.time_of_day)
         location_type = _normalize_location_type(request.location_type)
         
-        session = ExerciseSession(
+        payload = dict(
             patient_id=user.id,
             exercise_name=request.exercise_name,
             exercise_category=request.exercise_category,
@@ -313,20 +447,23 @@ async def quick_complete_session(
         
         if request.duration_minutes is not None:
             minutes = max(request.duration_minutes, 0)
-            session.duration_seconds = int(round(minutes * 60))
+            payload["duration_seconds"] = int(round(minutes * 60))
         elif request.mood_before is not None or request.mood_after is not None:
-            session.duration_seconds = 300
+            payload["duration_seconds"] = 300
         
-        if session.mood_before is not None and session.mood_after is not None:
-            session.mood_improvement = session.mood_after - session.mood_before
+        if request.mood_before is not None and request.mood_after is not None:
+            payload["mood_improvement"] = request.mood_after - request.mood_before
         
-        db.add(session)
-        db.commit()
-        db.refresh(session)
+        # Single INSERT ... RETURNING; the returned row is already in the session
+        session = db.scalars(
+            insert(ExerciseSession).values(**payload).returning(ExerciseSession)
+        ).one()
+        response = SessionResponse.model_validate(session, from_attributes=True)
         
+        # Committed together with the progress/streak/goal updates
         ProgressService.process_session_completion(db, user.id, session)
         
-        return SessionResponse.from_orm(session)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -339,38 +476,83 @@ async def quick_complete_session(
 
 @router.get("/sessions", response_model=PaginatedSessionsResponse)
 async def get_sessions(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also return the total session count"),
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
-    Get user's exercise sessions with pagination and filtering
+    Get user's exercise sessions, newest first.
+
+    Uses keyset pagination on (start_time, id): pass the returned `next_cursor`
+    to fetch the following page. The total is only computed on request, via a
+    window count in the same query.
     """
     try:
         user = current_user_data["user"]
-        
-        # Build query
-        query = db.query(ExerciseSession).filter(ExerciseSession.patient_id == user.id)
-        
-        # Get total count
-        total = query.count()
-        
-        # Get paginated results
-        sessions = query.order_by(desc(ExerciseSession.start_time)).offset(
-            (page - 1) * page_size
-        ).limit(page_size).all()
-        
-        total_pages = (total + page_size - 1) // page_size
-        
+
+        if include_total:
+            counted = select(
+                ExerciseSession, func.count().over().label("total")
+            ).where(ExerciseSession.patient_id == user.id).subquery()
+            session_model = aliased(ExerciseSession, counted)
+            query = _entity_query(db, session_model, counted.c.total)
+        else:
+            session_model = ExerciseSession
+            query = _entity_query(db, ExerciseSession).filter(ExerciseSession.patient_id == user.id)
+
+        if cursor:
+            cursor_time, cursor_id = _decode_keyset_cursor(cursor)
+            if cursor_id is None:
+                query = query.filter(session_model.start_time < cursor_time)
+            else:
+                query = query.filter(
+                    tuple_(session_model.start_time, session_model.id) < tuple_(cursor_time, cursor_id)
+                )
+        elif page > 1:
+            query = query.offset((page - 1) * page_size)
+
+        # Fetch one extra row to learn whether another page exists
+        rows = query.order_by(
+            desc(session_model.start_time), desc(session_model.id)
+        ).limit(page_size + 1).all()
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        total = None
+        total_pages = None
+        if include_total:
+            sessions = [row[0] for row in rows]
+            if rows:
+                total = rows[0][1]
+            elif cursor or page > 1:
+                # Past the end: the window had no rows to report on
+                total = db.query(func.count(ExerciseSession.id)).filter(
+                    ExerciseSession.patient_id == user.id
+                ).scalar()
+            else:
+                total = 0
+            total_pages = (total + page_size - 1) // page_size
+        else:
+            sessions = rows
+
         return PaginatedSessionsResponse(
-            sessions=[SessionResponse.from_orm(s) for s in sessions],
+            sessions=_SESSION_LIST_ADAPTER.validate_python(sessions, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            has_more=has_more,
+            next_cursor=(
+                _encode_keyset_cursor(sessions[-1].start_time, sessions[-1].id) if has_more else None
+            )
         )
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -396,21 +578,8 @@ async def create_goal(
     try:
         user = current_user_data["user"]
         
-        # Check if user already has 3 active goals
-        active_goals_count = db.query(func.count(UserGoal.id)).filter(
-            UserGoal.patient_id == user.id,
-            UserGoal.status == GoalStatus.ACTIVE
-        ).scalar()
-        
-        if active_goals_count >= 3:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Maximum of 3 active goals allowed"
-            )
-        
-        # Create goal
         from datetime import date as date_type
-        goal = UserGoal(
+        values = dict(
             patient_id=user.id,
             goal_type=request.goal_type,
             title=request.title,
@@ -424,9 +593,38 @@ async def create_goal(
             status=GoalStatus.ACTIVE
         )
         
-        db.add(goal)
+        # Create the goal only if the user has fewer than MAX_ACTIVE_GOALS active
+        # goals: INSERT ... SELECT ... WHERE (active count) < limit RETURNING,
+        # so the check and the insert are one statement
+        active_goals_count = select(func.count(UserGoal.id)).where(
+            UserGoal.patient_id == user.id,
+            UserGoal.status == GoalStatus.ACTIVE
+        ).scalar_subquery()
+        columns = UserGoal.__table__.c
+        stmt = insert(UserGoal).from_select(
+            list(values),
+            select(
+                *(literal(value, columns[name].type) for name, value in values.items())
+            ).where(active_goals_count < MAX_ACTIVE_GOALS)
+        ).returning(UserGoal)
+        
+        try:
+            goal = db.scalars(stmt).one_or_none()
+        except IntegrityError as e:
+            # Raised by the active-goal limit trigger when a concurrent request won
+            if "active goals" not in str(e.orig):
+                raise
+            goal = None
+        
+        if goal is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Maximum of {MAX_ACTIVE_GOALS} active goals allowed"
+            )
+        
         db.commit()
-        db.refresh(goal)
+        invalidate_stats_cache(user.id)
         
         # Calculate days remaining
         days_remaining = None
@@ -467,45 +665,73 @@ async def create_goal(
 
 @router.get("/goals", response_model=PaginatedGoalsResponse)
 async def get_goals(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    goal_status: Optional[str] = Query(None, alias="status", description="Filter by status"),
     goal_type: Optional[str] = Query(None, description="Filter by goal type"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also return the total goal count"),
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
     Get user's goals with pagination and filtering
+
+    Uses keyset pagination on (created_at, id), newest first; pass the returned
+    `next_cursor` to fetch the following page. The total is only counted on
+    request; `has_more` tells whether another page exists.
     """
     try:
         user = current_user_data["user"]
         
         # Build query
-        query = db.query(UserGoal).filter(UserGoal.patient_id == user.id)
+        query = _entity_query(db, UserGoal).filter(UserGoal.patient_id == user.id)
         
-        if status:
-            query = query.filter(UserGoal.status == status)
+        if goal_status:
+            query = query.filter(UserGoal.status == goal_status)
         if goal_type:
             query = query.filter(UserGoal.goal_type == goal_type)
         
-        # Get total count
-        total = query.count()
+        total = None
+        total_pages = None
+        if include_total:
+            # Plain COUNT, not count(*) over a wrapped subquery
+            total = query.with_entities(func.count(UserGoal.id)).scalar()
+            total_pages = (total + page_size - 1) // page_size
+        
+        if cursor:
+            cursor_time, cursor_id = _decode_keyset_cursor(cursor)
+            if cursor_id is None:
+                query_page = query.filter(UserGoal.created_at < cursor_time)
+            else:
+                query_page = query.filter(
+                    tuple_(UserGoal.created_at, UserGoal.id) < tuple_(cursor_time, cursor_id)
+                )
+        else:
+            query_page = query.offset((page - 1) * page_size) if page > 1 else query
         
-        # Get paginated results
-        goals = query.order_by(desc(UserGoal.created_at)).offset(
-            (page - 1) * page_size
-        ).limit(page_size).all()
+        # Fetch one extra row to learn whether another page exists
+        goals = query_page.order_by(
+            desc(UserGoal.created_at), desc(UserGoal.id)
+        ).limit(page_size + 1).all()
         
-        total_pages = (total + page_size - 1) // page_size
+        has_more = len(goals) > page_size
+        goals = goals[:page_size]
         
         return PaginatedGoalsResponse(
-            goals=[GoalResponse.from_orm(g) for g in goals],
+            goals=_GOAL_LIST_ADAPTER.validate_python(goals, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            has_more=has_more,
+            next_cursor=(
+                _encode_keyset_cursor(goals[-1].created_at, goals[-1].id) if has_more else None
+            )
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -529,10 +755,11 @@ async def update_goal(
         user = current_user_data["user"]
         
         # Find goal
-        goal = db.query(UserGoal).filter(
+        patient_id = user.id
+        goal = _first_entity(db, lambda_stmt(lambda: select(UserGoal).where(
             UserGoal.id == goal_id,
-            UserGoal.patient_id == user.id
-        ).first()
+            UserGoal.patient_id == patient_id
+        )))
         
         if not goal:
             raise HTTPException(
@@ -555,9 +782,10 @@ async def update_goal(
         goal.updated_at = datetime.now()
         
         db.commit()
+        invalidate_stats_cache(user.id)
         db.refresh(goal)
         
-        return GoalResponse.from_orm(goal)
+        return GoalResponse.model_validate(goal, from_attributes=True)
         
     except HTTPException:
         raise
@@ -584,10 +812,11 @@ async def delete_goal(
         user = current_user_data["user"]
         
         # Find goal
-        goal = db.query(UserGoal).filter(
+        patient_id = user.id
+        goal = _first_entity(db, lambda_stmt(lambda: select(UserGoal).where(
             UserGoal.id == goal_id,
-            UserGoal.patient_id == user.id
-        ).first()
+            UserGoal.patient_id == patient_id
+        )))
         
         if not goal:
             raise HTTPException(
@@ -600,6 +829,7 @@ async def delete_goal(
         goal.deleted_at = datetime.now()
         
         db.commit()
+        invalidate_stats_cache(user.id)
         
         return {"message": "Goal deleted successfully"}
         
@@ -617,7 +847,7 @@ async def delete_goal(
 # ACHIEVEMENT SYSTEM ENDPOINTS (from achievements.py)
 # ============================================================================
 
-@router.get("/achievements", response_model=List[AchievementDefinition])
+@router.get("/achievements", response_model=List[AchievementDefinition], response_class=ORJSONResponse)
 async def get_achievements(
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db),
@@ -631,39 +861,39 @@ async def get_achievements(
     """
     try:
         user = current_user_data["user"]
-        # Get unlocked achievement IDs
-        unlocked_achievements = db.query(UserAchievement).filter(
-            UserAchievement.patient_id == user.id,
-            UserAchievement.is_deleted == False
-        ).all()
-        
-        unlocked_ids = {ua.achievement_id for ua in unlocked_achievements}
+        cache_variant = f"list:{unlocked_only}:{category or ''}"
+        cached = get_cached_achievements(user.id, cache_variant)
+        if cached is not None:
+            return cached
+        
+        # Get unlocked achievement IDs; only the two columns the response
+        # needs, which ix_user_achievements_patient_live covers
+        unlocked_by_id = dict(db.execute(
+            select(UserAchievement.achievement_id, UserAchievement.unlocked_at).where(
+                UserAchievement.patient_id == user.id,
+                UserAchievement.is_deleted == False
+            )
+        ).all())
         
         # Filter achievements
-        all_achievements = ACHIEVEMENTS
-        if category:
-            all_achievements = [a for a in all_achievements if a.get("category") == category]
+        all_achievements = get_achievements_by_category(category) if category else ACHIEVEMENTS
         
         if unlocked_only:
-            all_achievements = [a for a in all_achievements if a["achievement_id"] in unlocked_ids]
+            all_achievements = [a for a in all_achievements if a["achievement_id"] in unlocked_by_id]
         
         # Add unlock status and progress
         result = []
         for achievement in all_achievements:
+            unlocked = achievement["achievement_id"] in unlocked_by_id
             achievement_data = achievement.copy()
-            achievement_data["unlocked"] = achievement["achievement_id"] in unlocked_ids
-            achievement_data["unlocked_at"] = None
-            
-            if achievement["achievement_id"] in unlocked_ids:
-                user_achievement = next(
-                    (ua for ua in unlocked_achievements if ua.achievement_id == achievement["achievement_id"]),
-                    None
-                )
-                if user_achievement:
-                    achievement_data["unlocked_at"] = user_achievement.unlocked_at.isoformat()
+            achievement_data["unlocked"] = unlocked
+            achievement_data["unlocked_at"] = (
+                unlocked_by_id[achievement["achievement_id"]].isoformat() if unlocked else None
+            )
             
             result.append(achievement_data)
         
+        cache_achievements(user.id, cache_variant, result)
         return result
         
     except Exception as e:
@@ -686,12 +916,8 @@ async def get_achievement(
     """
     try:
         user = current_user_data["user"]
-        
         # Find achievement definition
-        achievement_def = next(
-            (a for a in ACHIEVEMENTS if a["achievement_id"] == achievement_id),
-            None
-        )
+        achievement_def = get_achievement_by_id(achievement_id)
         
         if not achievement_def:
             raise HTTPException(
@@ -699,15 +925,16 @@ async def get_achievement(
                 detail="Achievement not found"
             )
         
-        # Check if user has unlocked this achievement
-        user_achievement = db.query(UserAchievement).filter(
-            UserAchievement.patient_id == user.id,
+        # Check if user has unlocked this achievement; only unlocked_at is needed
+        patient_id = user.id
+        unlocked_row = db.execute(lambda_stmt(lambda: select(UserAchievement.unlocked_at).where(
+            UserAchievement.patient_id == patient_id,
             UserAchievement.achievement_id == achievement_id,
             UserAchievement.is_deleted == False
-        ).first()
+        ))).first()
         
-        unlocked = user_achievement is not None
-        unlocked_at = user_achievement.unlocked_at if user_achievement else None
+        unlocked = unlocked_row is not None
+        unlocked_at = unlocked_row.unlocked_at if unlocked_row else None
         
         return AchievementResponse(
             id=achievement_def["achievement_id"],
@@ -744,24 +971,27 @@ async def acknowledge_achievement(
     try:
         user = current_user_data["user"]
         
-        # Find user achievement
-        user_achievement = db.query(UserAchievement).filter(
-            UserAchievement.patient_id == user.id,
-            UserAchievement.achievement_id == achievement_id,
-            UserAchievement.is_deleted == False
-        ).first()
+        # Acknowledge in a single UPDATE; no matching row means not unlocked
+        result = db.execute(
+            update(UserAchievement)
+            .where(
+                UserAchievement.patient_id == user.id,
+                UserAchievement.achievement_id == achievement_id,
+                UserAchievement.is_deleted == False
+            )
+            .values(is_notified=True)
+            .execution_options(synchronize_session=False)
+        )
         
-        if not user_achievement:
+        if result.rowcount == 0:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Achievement not found or not unlocked"
             )
         
-        # Acknowledge achievement
-        user_achievement.acknowledged = True
-        user_achievement.acknowledged_at = datetime.now()
-        
         db.commit()
+        invalidate_achievements_cache(user.id)
         
         return {"message": "Achievement acknowledged successfully"}
         
@@ -779,98 +1009,149 @@ async def acknowledge_achievement(
 # UNIFIED ACTIVITY ENDPOINTS (from unified.py)
 # ============================================================================
 
-@router.get("/timeline")
+@router.get("/timeline", response_class=ORJSONResponse)
 async def get_unified_timeline(
     days: int = Query(30, ge=1, le=365, description="Number of days to include"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of activities to return"),
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
     Get unified activity timeline across all progress domains
     
-    Returns chronological activity from sessions, mood assessments, and journal entries
+    Returns the newest `limit` activities from sessions, mood assessments, and
+    journal entries; total_activities counts everything in the date range
     """
     try:
         user = current_user_data["user"]
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Get exercise sessions
-        sessions = db.query(ExerciseSession).filter(
+        # Merge, sort and limit all three activity kinds in Postgres; each
+        # branch projects the same (kind, id, sort_ts, payload) shape
+        session_rows = select(
+            literal("exercise_session", String).label("kind"),
+            ExerciseSession.id.label("id"),
+            ExerciseSession.start_time.label("sort_ts"),
+            func.json_build_object(
+                "exercise_name", ExerciseSession.exercise_name,
+                "exercise_category", ExerciseSession.exercise_category,
+                "duration_seconds", ExerciseSession.duration_seconds,
+                "mood_before", ExerciseSession.mood_before,
+                "mood_after", ExerciseSession.mood_after,
+                type_=JSON
+            ).label("payload")
+        ).where(
             ExerciseSession.patient_id == user.id,
             ExerciseSession.start_time >= start_date
-        ).order_by(desc(ExerciseSession.start_time)).all()
+        )
         
-        # Get mood assessments
-        mood_assessments = db.query(MoodAssessment).filter(
+        # assessment_date is a naive UTC column; compare instants when sorting
+        mood_rows = select(
+            literal("mood_assessment", String).label("kind"),
+            MoodAssessment.id.label("id"),
+            func.timezone("UTC", MoodAssessment.assessment_date).label("sort_ts"),
+            func.json_build_object(
+                "overall_mood_score", MoodAssessment.overall_mood_score,
+                "overall_mood_score_text", cast(MoodAssessment.overall_mood_score, String),
+                "stress_level", MoodAssessment.stress_level,
+                "energy_level", MoodAssessment.energy_level,
+                "dominant_emotions", MoodAssessment.dominant_emotions,
+                type_=JSON
+            ).label("payload")
+        ).where(
             MoodAssessment.patient_id == user.id,
             MoodAssessment.assessment_date >= start_date
-        ).order_by(desc(MoodAssessment.assessment_date)).all()
+        )
         
-        # Get journal entries
-        journal_entries = db.query(JournalEntry).filter(
+        journal_rows = select(
+            literal("journal_entry", String).label("kind"),
+            JournalEntry.id.label("id"),
+            JournalEntry.entry_date.label("sort_ts"),
+            func.json_build_object(
+                "mood", JournalEntry.mood,
+                # Only the previews are returned; one extra character tells
+                # whether the entry was longer than 100
+                "content_head", func.left(JournalEntry.content, 101),
+                type_=JSON
+            ).label("payload")
+        ).where(
             JournalEntry.patient_id == user.id,
             JournalEntry.entry_date >= start_date
-        ).order_by(desc(JournalEntry.entry_date)).all()
+        )
         
-        # Combine and sort activities
+        timeline = union_all(session_rows, mood_rows, journal_rows).subquery()
+        rows = db.execute(
+            select(timeline, func.count().over().label("total"))
+            .order_by(desc(timeline.c.sort_ts))
+            .limit(limit)
+        )
+        
+        # Build activities straight off the result; LIMIT already bounds it to
+        # `limit` rows, so there is no intermediate row list
+        total_activities = 0
         activities = []
         
-        for session in sessions:
-            duration_minutes = session.computed_duration_minutes
-            activities.append({
-                "type": "exercise_session",
-                "id": str(session.id),
-                "timestamp": session.start_time.isoformat(),
-                "title": f"{session.exercise_name} Session",
-                "description": f"Completed {duration_minutes} minutes",
-                "data": {
-                    "exercise_name": session.exercise_name,
-                    "exercise_category": session.exercise_category,
-                    "duration_minutes": duration_minutes,
-                    "mood_before": session.mood_before,
-                    "mood_after": session.mood_after
-                }
-            })
-        
-        for assessment in mood_assessments:
-            activities.append({
-                "type": "mood_assessment",
-                "id": str(assessment.id),
-                "timestamp": assessment.assessment_date.isoformat(),
-                "title": "Mood Assessment",
-                "description": f"Mood Score: {assessment.overall_mood_score}/10",
-                "data": {
-                    "overall_mood_score": assessment.overall_mood_score,
-                    "stress_level": assessment.stress_level,
-                    "energy_level": assessment.energy_level,
-                    "dominant_emotions": assessment.dominant_emotions
-                }
-            })
-        
-        for entry in journal_entries:
-            activities.append({
-                "type": "journal_entry",
-                "id": str(entry.id),
-                "timestamp": entry.entry_date.isoformat(),
-                "title": "Journal Entry",
-                "description": entry.content[:50] + "..." if len(entry.content) > 50 else entry.content,
-                "data": {
+        for row in rows:
+            total_activities = row.total
+            payload = row.payload
+            
+            if row.kind == "exercise_session":
+                duration_seconds = payload["duration_seconds"]
+                duration_minutes = round(duration_seconds / 60, 1) if duration_seconds is not None else 0.0
+                activities.append({
+                    "type": "exercise_session",
+                    "id": row.id,
+                    "timestamp": row.sort_ts,
+                    "title": f"{payload['exercise_name']} Session",
+                    "description": f"Completed {duration_minutes} minutes",
+                    "data": {
+                        "exercise_name": payload["exercise_name"],
+                        "exercise_category": payload["exercise_category"],
+                        "duration_minutes": duration_minutes,
+                        "mood_before": payload["mood_before"],
+                        "mood_after": payload["mood_after"]
+                    }
+                })
+            
+            elif row.kind == "mood_assessment":
+                # Report the stored naive UTC value, as the column holds it
+                assessment_date = row.sort_ts.astimezone(timezone.utc).replace(tzinfo=None)
+                activities.append({
+                    "type": "mood_assessment",
+                    "id": row.id,
+                    "timestamp": assessment_date,
+                    "title": "Mood Assessment",
+                    "description": f"Mood Score: {payload['overall_mood_score_text']}/10",
+                    "data": {
+                        "overall_mood_score": payload["overall_mood_score"],
+                        "stress_level": payload["stress_level"],
+                        "energy_level": payload["energy_level"],
+                        "dominant_emotions": payload["dominant_emotions"]
+                    }
+                })
+            
+            else:
+                content = payload["content_head"]
+                activities.append({
+                    "type": "journal_entry",
+                    "id": row.id,
+                    "timestamp": row.sort_ts,
                     "title": "Journal Entry",
-                    "mood": entry.mood,
-                    "content_preview": entry.content[:100] + "..." if len(entry.content) > 100 else entry.content
-                }
-            })
-        
-        # Sort by timestamp (newest first)
-        activities.sort(key=lambda x: x["timestamp"], reverse=True)
+                    "description": content[:50] + "..." if len(content) > 50 else content,
+                    "data": {
+                        "title": "Journal Entry",
+                        "mood": payload["mood"],
+                        "content_preview": content[:100] + "..." if len(content) > 100 else content
+                    }
+                })
         
         return {
             "activities": activities,
-            "total_activities": len(activities),
+            "total_activities": total_activities,
             "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat(),
+                "start": start_date,
+                "end": end_date,
                 "days": days
             }
         }
@@ -883,56 +1164,75 @@ async def get_unified_timeline(
 
 
 @router.get("/stats")
-async def get_unified_stats(
+def get_unified_stats(
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
     Get unified statistics across all progress domains
     
-    Returns comprehensive stats including sessions, mood, goals, and achievements
+    Returns comprehensive stats including sessions, mood, goals, and achievements.
+    Served from a short-lived Redis snapshot when one is available.
     """
     try:
         user = current_user_data["user"]
-        
-        # Exercise session stats
-        total_sessions = db.query(func.count(ExerciseSession.id)).filter(
-            ExerciseSession.patient_id == user.id
-        ).scalar() or 0
-        
-        completed_sessions = db.query(func.count(ExerciseSession.id)).filter(
-            ExerciseSession.patient_id == user.id,
-            ExerciseSession.session_completed == True
-        ).scalar() or 0
-        
-        # Mood assessment stats
-        total_mood_assessments = db.query(func.count(MoodAssessment.id)).filter(
-            MoodAssessment.patient_id == user.id
-        ).scalar() or 0
-        
-        avg_mood_score = db.query(func.avg(MoodAssessment.overall_mood_score)).filter(
-            MoodAssessment.patient_id == user.id
-        ).scalar() or 0.0
-        
-        # Goal stats
-        total_goals = db.query(func.count(UserGoal.id)).filter(
+        cached = get_cached_stats(user.id)
+        if cached is not None:
+            return cached
+        
+        # One round trip: a single-row aggregate per table, cross-joined
+        session_stats = select(
+            func.count(ExerciseSession.id).label("total"),
+            func.count(ExerciseSession.id).filter(
+                ExerciseSession.session_completed == True
+            ).label("completed")
+        ).where(ExerciseSession.patient_id == user.id).subquery()
+        
+        mood_stats = select(
+            func.count(MoodAssessment.id).label("total"),
+            func.coalesce(func.avg(MoodAssessment.overall_mood_score), 0.0).label("average")
+        ).where(MoodAssessment.patient_id == user.id).subquery()
+        
+        goal_stats = select(
+            func.count(UserGoal.id).label("total"),
+            func.count(UserGoal.id).filter(UserGoal.status == GoalStatus.ACTIVE).label("active")
+        ).where(
             UserGoal.patient_id == user.id,
             UserGoal.is_deleted == False
-        ).scalar() or 0
+        ).subquery()
         
-        active_goals = db.query(func.count(UserGoal.id)).filter(
-            UserGoal.patient_id == user.id,
-            UserGoal.status == GoalStatus.ACTIVE,
-            UserGoal.is_deleted == False
-        ).scalar() or 0
-        
-        # Achievement stats
-        total_achievements = db.query(func.count(UserAchievement.id)).filter(
+        achievement_stats = select(
+            func.count(UserAchievement.id).label("total")
+        ).where(
             UserAchievement.patient_id == user.id,
             UserAchievement.is_deleted == False
-        ).scalar() or 0
-        
-        return {
+        ).subquery()
+        
+        row = db.execute(
+            select(
+                session_stats.c.total.label("total_sessions"),
+                session_stats.c.completed.label("completed_sessions"),
+                mood_stats.c.total.label("total_mood_assessments"),
+                mood_stats.c.average.label("avg_mood_score"),
+                goal_stats.c.total.label("total_goals"),
+                goal_stats.c.active.label("active_goals"),
+                achievement_stats.c.total.label("total_achievements")
+            )
+            .select_from(session_stats)
+            .join(mood_stats, true())
+            .join(goal_stats, true())
+            .join(achievement_stats, true())
+        ).one()
+        
+        total_sessions = row.total_sessions or 0
+        completed_sessions = row.completed_sessions or 0
+        total_mood_assessments = row.total_mood_assessments or 0
+        avg_mood_score = row.avg_mood_score or 0.0
+        total_goals = row.total_goals or 0
+        active_goals = row.active_goals or 0
+        total_achievements = row.total_achievements or 0
+        
+        stats = {
             "exercise_sessions": {
                 "total": total_sessions,
                 "completed": completed_sessions,
@@ -953,6 +1253,9 @@ async def get_unified_stats(
             }
         }
         
+        cache_stats(user.id, stats)
+        return stats
+        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -989,32 +1292,11 @@ async def reset_progress(
         
         user = current_user_data["user"]
         
-        # Delete exercise sessions
-        db.query(ExerciseSession).filter(
-            ExerciseSession.patient_id == user.id
-        ).delete()
-        
-        # Delete goals
-        db.query(UserGoal).filter(
-            UserGoal.patient_id == user.id
-        ).delete()
-        
-        # Delete achievements
-        db.query(UserAchievement).filter(
-            UserAchievement.patient_id == user.id
-        ).delete()
-        
-        # Delete progress records
-        db.query(ExerciseProgress).filter(
-            ExerciseProgress.patient_id == user.id
-        ).delete()
-        
-        # Delete streaks
-        db.query(UserStreak).filter(
-            UserStreak.patient_id == user.id
-        ).delete()
+        # Delete sessions, goals, achievements, progress records and streaks
+        _delete_patient_rows(db, user.id, _PROGRESS_MODELS)
         
         db.commit()
+        invalidate_progress_caches(user.id)
         
         return {"message": "Progress data reset successfully"}
         
@@ -1048,21 +1330,13 @@ async def delete_all_data(
         
         user = current_user_data["user"]
         
-        # Delete all progress-related data
-        db.query(ExerciseSession).filter(ExerciseSession.patient_id == user.id).delete()
-        db.query(UserGoal).filter(UserGoal.patient_id == user.id).delete()
-        db.query(UserAchievement).filter(UserAchievement.patient_id == user.id).delete()
-        db.query(ExerciseProgress).filter(ExerciseProgress.patient_id == user.id).delete()
-        db.query(UserStreak).filter(UserStreak.patient_id == user.id).delete()
-        
-        # Delete mood assessments
-        db.query(MoodAssessment).filter(MoodAssessment.patient_id == user.id).delete()
-        db.query(MoodTrend).filter(MoodTrend.patient_id == user.id).delete()
-        
-        # Delete journal entries
-        db.query(JournalEntry).filter(JournalEntry.patient_id == user.id).delete()
+        # Delete all progress-related data, mood assessments and journal entries
+        _delete_patient_rows(
+            db, user.id, _PROGRESS_MODELS + (MoodAssessment, MoodTrend, JournalEntry)
+        )
         
         db.commit()
+        invalidate_progress_caches(user.id)
         
         return {"message": "All user data deleted successfully"}
         
@@ -1093,22 +1367,23 @@ async def get_all_exercise_progress(
     """
     try:
         user = current_user_data["user"]
-        query = db.query(ExerciseProgress).filter(
+        # Read-only listing: select plain columns rather than hydrating ORM
+        # objects; Postgres computes the derived fields in the same scan
+        stmt = select(
+            *_EXERCISE_PROGRESS_COLUMNS,
+            ExerciseProgress.total_time_hours.label("total_time_hours"),
+            ExerciseProgress.average_session_duration_minutes.label("average_session_duration_minutes")
+        ).where(
             ExerciseProgress.patient_id == user.id,
             ExerciseProgress.is_deleted == False
         )
         
         if favorite_only:
-            query = query.filter(ExerciseProgress.is_favorite == True)
+            stmt = stmt.where(ExerciseProgress.is_favorite == True)
         
-        progress_list = query.order_by(desc(ExerciseProgress.last_practiced_at)).all()
+        rows = db.execute(stmt.order_by(desc(ExerciseProgress.last_practiced_at))).mappings()
         
-        # Add computed properties
-        for progress in progress_list:
-            progress.total_time_hours = progress.total_time_hours
-            progress.average_session_duration_minutes = progress.average_session_duration_minutes
-        
-        return progress_list
+        return [ExerciseProgressResponse(**row) for row in rows]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1129,11 +1404,12 @@ async def get_exercise_progress(
     """
     try:
         user = current_user_data["user"]
-        progress = db.query(ExerciseProgress).filter(
-            ExerciseProgress.patient_id == user.id,
+        patient_id = user.id
+        progress = _first_entity(db, lambda_stmt(lambda: select(ExerciseProgress).where(
+            ExerciseProgress.patient_id == patient_id,
             ExerciseProgress.exercise_name == exercise_name,
             ExerciseProgress.is_deleted == False
-        ).first()
+        )))
         
         if not progress:
             raise HTTPException(
@@ -1141,10 +1417,6 @@ async def get_exercise_progress(
                 detail=f"No progress found for exercise: {exercise_name}"
             )
         
-        # Add computed properties
-        progress.total_time_hours = progress.total_time_hours
-        progress.average_session_duration_minutes = progress.average_session_duration_minutes
-        
         return progress
     except HTTPException:
         raise
@@ -1167,11 +1439,12 @@ async def update_exercise_progress(
     """
     try:
         user = current_user_data["user"]
-        progress = db.query(ExerciseProgress).filter(
-            ExerciseProgress.patient_id == user.id,
+        patient_id = user.id
+        progress = _first_entity(db, lambda_stmt(lambda: select(ExerciseProgress).where(
+            ExerciseProgress.patient_id == patient_id,
             ExerciseProgress.exercise_name == exercise_name,
             ExerciseProgress.is_deleted == False
-        ).first()
+        )))
         
         if not progress:
             raise HTTPException(
@@ -1188,10 +1461,6 @@ async def update_exercise_progress(
         db.commit()
         db.refresh(progress)
         
-        # Add computed properties
-        progress.total_time_hours = progress.total_time_hours
-        progress.average_session_duration_minutes = progress.average_session_duration_minutes
-        
         return progress
     except HTTPException:
         raise
@@ -1214,27 +1483,30 @@ async def toggle_favorite_exercise(
     """
     try:
         user = current_user_data["user"]
-        progress = db.query(ExerciseProgress).filter(
-            ExerciseProgress.patient_id == user.id,
-            ExerciseProgress.exercise_name == exercise_name,
-            ExerciseProgress.is_deleted == False
+        # Flip the flag in one UPDATE ... SET is_favorite = NOT is_favorite RETURNING
+        progress = db.scalars(
+            update(ExerciseProgress)
+            .where(
+                ExerciseProgress.patient_id == user.id,
+                ExerciseProgress.exercise_name == exercise_name,
+                ExerciseProgress.is_deleted == False
+            )
+            .values(is_favorite=~ExerciseProgress.is_favorite)
+            .returning(ExerciseProgress)
         ).first()
         
         if not progress:
             # Create if doesn't exist
             progress = ProgressService.get_or_create_exercise_progress(
-                db, user.id, exercise_name
+                db, user.id, exercise_name, commit=False
             )
+            progress.is_favorite = not progress.is_favorite
+            db.flush()
         
-        progress.is_favorite = not progress.is_favorite
+        response = ExerciseProgressResponse.model_validate(progress, from_attributes=True)
         db.commit()
-        db.refresh(progress)
-        
-        # Add computed properties
-        progress.total_time_hours = progress.total_time_hours
-        progress.average_session_duration_minutes = progress.average_session_duration_minutes
         
-        return progress
+        return response
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1248,23 +1520,24 @@ async def toggle_favorite_exercise(
 # ============================================================================
 
 @router.get("/streak", response_model=StreakResponse)
-async def get_streak(
+def get_streak(
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
     Get current streak information
+    
+    Database errors are turned into a 500 by the app-level handler.
     """
-    try:
-        user = current_user_data["user"]
-        streak = ProgressService.get_or_create_streak(db, user.id)
-        streak.is_active = streak.is_active
-        return streak
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching streak: {str(e)}"
-        )
+    user = current_user_data["user"]
+    cached = get_cached_streak(user.id)
+    if cached is not None:
+        return cached
+    
+    streak = ProgressService.get_or_create_streak(db, user.id)
+    response = StreakResponse.model_validate(streak, from_attributes=True).model_dump(mode="json")
+    cache_streak(user.id, response)
+    return response
 
 
 # ============================================================================
@@ -1272,9 +1545,9 @@ async def get_streak(
 # ============================================================================
 
 @router.get("/calendar", response_model=List[CalendarDayData])
-async def get_practice_calendar(
+def get_practice_calendar(
     days: Optional[int] = Query(30, description="Number of days to fetch (defaults to 30)"),
-    year: Optional[int] = Query(None, description="Year (defaults to current year)"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Year (defaults to current year)"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Month (1-12, optional)"),
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
@@ -1293,40 +1566,28 @@ async def get_practice_calendar(
             end_date = date.today()
             start_date = end_date - timedelta(days=days)
             
-            calendar_days = db.query(PracticeCalendar).filter(
+            calendar_days = db.execute(select(*_CALENDAR_DAY_COLUMNS).where(
                 PracticeCalendar.patient_id == user.id,
                 PracticeCalendar.practice_date >= start_date,
                 PracticeCalendar.practice_date <= end_date,
                 PracticeCalendar.is_deleted == False
-            ).all()
+            )).all()
         else:
             # Legacy: Filter by year/month
             if year is None:
                 year = date.today().year
             
-            query = db.query(PracticeCalendar).filter(
+            # Range predicates on practice_date can use (patient_id, practice_date)
+            range_start, range_end = _calendar_range(year, month)
+            calendar_days = db.execute(select(*_CALENDAR_DAY_COLUMNS).where(
                 PracticeCalendar.patient_id == user.id,
-                func.extract('year', PracticeCalendar.practice_date) == year,
+                PracticeCalendar.practice_date >= range_start,
+                PracticeCalendar.practice_date < range_end,
                 PracticeCalendar.is_deleted == False
-            )
-            
-            if month is not None:
-                query = query.filter(func.extract('month', PracticeCalendar.practice_date) == month)
-            
-            calendar_days = query.all()
+            )).all()
         
         # Convert to simplified format with ISO date strings
-        result = [
-            CalendarDayData(
-                date=day.practice_date.isoformat() if hasattr(day.practice_date, 'isoformat') else str(day.practice_date),
-                count=day.session_count,
-                intensity=day.intensity_level,
-                exercises=day.exercises_practiced or []
-            )
-            for day in calendar_days
-        ]
-        
-        return result
+        return _calendar_day_data(calendar_days)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1334,34 +1595,93 @@ async def get_practice_calendar(
         )
 
 
-@router.get("/calendar/year/{year}", response_model=List[CalendarDayData])
-async def get_year_calendar(
-    year: int,
+@router.get("/streak-calendar", response_model=StreakCalendarResponse)
+def get_streak_calendar(
+    days: int = Query(30, ge=1, le=366, description="Number of days of calendar to fetch"),
+    current_user_data: dict = Depends(get_current_user_from_token),
+    db: Session = Depends(get_db)
+):
+    """
+    Get streak and the last `days` of calendar data in one request
+    
+    Both come back from a single statement: the streak row and the calendar
+    days are turned into JSON by Postgres (row_to_json / json_agg).
+    """
+    user = current_user_data["user"]
+    
+    streak = select(
+        *_STREAK_COLUMNS,
+        func.coalesce(UserStreak.last_practice_date >= func.current_date() - 1, False).label("is_active")
+    ).where(
+        UserStreak.patient_id == user.id,
+        UserStreak.is_deleted == False
+    ).subquery("streak")
+    
+    calendar = select(
+        PracticeCalendar.practice_date.label("date"),
+        PracticeCalendar.session_count.label("count"),
+        PracticeCalendar.intensity_level.label("intensity"),
+        func.coalesce(PracticeCalendar.exercises_practiced, cast("[]", JSON)).label("exercises")
+    ).where(
+        PracticeCalendar.patient_id == user.id,
+        PracticeCalendar.practice_date >= date.today() - timedelta(days=days),
+        PracticeCalendar.is_deleted == False
+    ).subquery("calendar")
+    
+    row = db.execute(select(
+        select(func.row_to_json(streak.table_valued(), type_=JSON)).scalar_subquery().label("streak"),
+        select(
+            func.json_agg(aggregate_order_by(calendar.table_valued(), calendar.c.date), type_=JSON)
+        ).scalar_subquery().label("calendar")
+    )).one()
+    
+    streak_data = row.streak
+    if streak_data is None:
+        # First visit: create the streak row like /streak does
+        streak_data = ProgressService.get_or_create_streak(db, user.id)
+    
+    return StreakCalendarResponse(
+        streak=StreakResponse.model_validate(streak_data),
+        calendar=row.calendar or []
+    )
+
+
+@router.get("/calendar/year/{year}", response_model=PaginatedCalendarResponse, response_class=ORJSONResponse)
+def get_year_calendar(
+    year: int = Path(..., ge=1, le=9998),
+    cursor: Optional[date] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=366, description="Maximum number of days to return"),
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
     """
     Get full year calendar data for heat map
+    
+    Days are returned oldest first, `limit` at a time; pass the returned
+    `next_cursor` to continue from the next practice date.
     """
     try:
         user = current_user_data["user"]
-        calendar_days = db.query(PracticeCalendar).filter(
+        range_start, range_end = _calendar_range(year)
+        if cursor is not None:
+            range_start = max(range_start, cursor)
+        
+        # Fetch one extra row to learn whether another page exists
+        calendar_days = db.execute(select(*_CALENDAR_DAY_COLUMNS).where(
             PracticeCalendar.patient_id == user.id,
-            func.extract('year', PracticeCalendar.practice_date) == year,
+            PracticeCalendar.practice_date >= range_start,
+            PracticeCalendar.practice_date < range_end,
             PracticeCalendar.is_deleted == False
-        ).all()
-        
-        result = [
-            CalendarDayData(
-                date=day.practice_date,
-                count=day.session_count,
-                intensity=day.intensity_level,
-                exercises=day.exercises_practiced or []
-            )
-            for day in calendar_days
-        ]
+        ).order_by(PracticeCalendar.practice_date).limit(limit + 1)).all()
         
-        return result
+        has_more = len(calendar_days) > limit
+        
+        # Rows go straight to orjson; response_model only documents the shape
+        return ORJSONResponse({
+            "days": _calendar_day_dicts(calendar_days[:limit]),
+            "has_more": has_more,
+            "next_cursor": calendar_days[limit].practice_date if has_more else None
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1373,25 +1693,29 @@ async def get_year_calendar(
 # ANALYTICS ENDPOINTS
 # ============================================================================
 
-@router.get("/analytics/exercises", response_model=List[ExerciseAnalytics])
-async def get_exercise_analytics(
+@router.get("/analytics/exercises", response_model=PaginatedExerciseAnalyticsResponse, response_class=ORJSONResponse)
+def get_exercise_analytics(
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db),
-    sort_by: str = Query("most_practiced", description="Sort by: most_practiced, most_effective, recent")
+    sort_by: str = Query("most_practiced", description="Sort by: most_practiced, most_effective, recent"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of exercises to skip"),
+    include_total: bool = Query(False, description="Also return the total exercise count")
 ):
     """
     Get analytics for all exercises
     
-    Returns detailed stats with sorting options
+    Returns detailed stats with sorting options, `limit` exercises at a time;
+    pass the returned `next_offset` to fetch the following page.
     """
     try:
         user = current_user_data["user"]
-        query = db.query(ExerciseProgress).filter(
+        query = db.query(*_EXERCISE_ANALYTICS_COLUMNS).filter(
             ExerciseProgress.patient_id == user.id,
             ExerciseProgress.is_deleted == False
         )
         
-        # Apply sorting
+        # Apply sorting (most_practiced walks ix_exercise_progress_patient_count_live)
         if sort_by == "most_practiced":
             query = query.order_by(desc(ExerciseProgress.completion_count))
         elif sort_by == "most_effective":
@@ -1399,23 +1723,34 @@ async def get_exercise_analytics(
         elif sort_by == "recent":
             query = query.order_by(desc(ExerciseProgress.last_practiced_at))
         
-        progress_list = query.all()
-        
-        result = [
-            ExerciseAnalytics(
-                exercise_name=p.exercise_name,
-                completion_count=p.completion_count,
-                total_time_hours=p.total_time_hours,
-                average_session_duration_minutes=p.average_session_duration_minutes,
-                average_mood_improvement=p.average_mood_improvement,
-                mastery_level=p.mastery_level,
-                last_practiced=p.last_practiced_at,
-                is_favorite=p.is_favorite
-            )
-            for p in progress_list
-        ]
+        total = None
+        if include_total:
+            total = query.order_by(None).with_entities(func.count(ExerciseProgress.id)).scalar()
         
-        return result
+        # id breaks ties so offsets stay stable; fetch one extra row for has_more
+        progress_list = query.order_by(ExerciseProgress.id).offset(offset).limit(limit + 1).all()
+        has_more = len(progress_list) > limit
+        progress_list = progress_list[:limit]
+        
+        # ExerciseAnalytics-shaped dicts; orjson handles the enum and datetime
+        # but not Decimal, so the Numeric columns are converted here
+        result = []
+        for row in progress_list:
+            item = row._asdict()
+            item["total_time_hours"] = float(row.total_time_hours)
+            item["average_session_duration_minutes"] = float(row.average_session_duration_minutes)
+            if row.average_mood_improvement is not None:
+                item["average_mood_improvement"] = float(row.average_mood_improvement)
+            result.append(item)
+        
+        return ORJSONResponse({
+            "exercises": result,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+            "next_offset": offset + limit if has_more else None
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1424,7 +1759,7 @@ async def get_exercise_analytics(
 
 
 @router.get("/analytics/mood-trends", response_model=List[MoodTrendDataPoint])
-async def get_mood_trends(
+def get_mood_trends(
     current_user_data: dict = Depends(get_current_user_from_token),
     db: Session = Depends(get_db),
     date_from: Optional[date] = Query(None, description="Start date"),
@@ -1444,40 +1779,33 @@ async def get_mood_trends(
         if date_from is None:
             date_from = date_to - timedelta(days=30)
         
-        # Build query
-        query = db.query(
-            func.date(ExerciseSession.start_time).label('date'),
-            func.avg(ExerciseSession.mood_before).label('mood_before_avg'),
-            func.avg(ExerciseSession.mood_after).label('mood_after_avg'),
-            func.avg(ExerciseSession.mood_improvement).label('mood_improvement_avg'),
-            func.count(ExerciseSession.id).label('session_count')
-        ).filter(
+        # Build query on the stored practice_day so (patient_id, practice_day)
+        # can serve the range, grouping and order; casting to Numeric(5, 2)
+        # rounds the averages in SQL
+        query = select(
+            ExerciseSession.practice_day.label('date'),
+            cast(func.avg(ExerciseSession.mood_before), Numeric(5, 2)).label('mood_before_avg'),
+            cast(func.avg(ExerciseSession.mood_after), Numeric(5, 2)).label('mood_after_avg'),
+            cast(func.avg(ExerciseSession.mood_improvement), Numeric(5, 2)).label('mood_improvement_avg'),
+            func.count().label('session_count')
+        ).where(
             ExerciseSession.patient_id == user.id,
-            func.date(ExerciseSession.start_time) >= date_from,
-            func.date(ExerciseSession.start_time) <= date_to,
+            ExerciseSession.practice_day >= date_from,
+            ExerciseSession.practice_day <= date_to,
             ExerciseSession.is_deleted == False
         )
         
         # Filter by exercise if provided
         if exercise_name:
-            query = query.filter(ExerciseSession.exercise_name == exercise_name)
+            query = query.where(ExerciseSession.exercise_name == exercise_name)
         
         # Group by date
-        query = query.group_by(func.date(ExerciseSession.start_time))
-        query = query.order_by(func.date(ExerciseSession.start_time))
-        
-        results = query.all()
-        
-        trend_data = [
-            MoodTrendDataPoint(
-                date=row.date,
-                mood_before_avg=round(row.mood_before_avg, 2) if row.mood_before_avg else None,
-                mood_after_avg=round(row.mood_after_avg, 2) if row.mood_after_avg else None,
-                mood_improvement_avg=round(row.mood_improvement_avg, 2) if row.mood_improvement_avg else None,
-                session_count=row.session_count
-            )
-            for row in results
-        ]
+        query = query.group_by(ExerciseSession.practice_day)
+        query = query.order_by(ExerciseSession.practice_day)
+        
+        results = db.execute(query).all()
+        
+        trend_data = [MoodTrendDataPoint(**row._mapping) for row in results]
         
         return trend_data
     except Exception as e:
@@ -4,21 +4,81 @@ Users Management Endpoints
 Endpoints for user profile management, specifically for patients.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+import hashlib
 import uuid
 import logging
 
 from app.db.session import get_db
 from app.api.v1.endpoints.auth import get_current_user_from_token
 from app.services.patient_profiles import PatientProfileService
-from app.models.patient import Patient
+from app.models.appointment import Appointment, AppointmentStatusEnum
+from app.models.patient import Patient, PatientAuthInfo, PatientHistory
+from app.models.specialist import Specialists
+from app.schemas.patient_profile_schemas import DetailedAppointment
+from app.utils.cache import cache_delete, cache_hget, cache_hset
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# The assembled profile is read on every profile view but changes rarely;
+# profile updates drop it and the TTL bounds staleness from other writers
+PROFILE_CACHE_TTL_SECONDS = 30
+
+
+def _profile_cache_key(patient_id: uuid.UUID) -> str:
+    return f"profile:{patient_id}"
+
+
+def _profile_etag(db: Session, patient_id: uuid.UUID) -> str:
+    """
+    Weak ETag for the frontend profile, from one cheap query.
+    
+    Covers the rows transform_profile_for_frontend reads: the patient, its
+    auth info, history, appointments and their specialists (newest
+    updated_at, plus the appointment count so deletions change it too).
+    appointments.next also depends on the clock, so the id of the current
+    next appointment is hashed in and the tag changes once it starts.
+    """
+    def newest(model):
+        return select(func.max(model.updated_at)).where(model.patient_id == patient_id).scalar_subquery()
+    
+    next_appointment = select(Appointment.id).where(
+        Appointment.patient_id == patient_id,
+        Appointment.scheduled_start > datetime.now(timezone.utc),
+        Appointment.status.in_([AppointmentStatusEnum.SCHEDULED, AppointmentStatusEnum.CONFIRMED])
+    ).order_by(Appointment.scheduled_start).limit(1).scalar_subquery()
+    newest_specialist = select(func.max(Specialists.updated_at)).join(
+        Appointment, Appointment.specialist_id == Specialists.id
+    ).where(Appointment.patient_id == patient_id).scalar_subquery()
+    
+    row = db.execute(
+        select(
+            func.greatest(
+                Patient.updated_at,
+                newest(PatientAuthInfo),
+                newest(PatientHistory),
+                newest(Appointment),
+                newest_specialist
+            ),
+            select(func.count(Appointment.id)).where(Appointment.patient_id == patient_id).scalar_subquery(),
+            next_appointment
+        ).where(Patient.id == patient_id)
+    ).one_or_none()
+    digest = hashlib.blake2b(repr(tuple(row or ())).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+# Dumps the whole appointment list in one pydantic-core call
+_appointments_adapter = TypeAdapter(List[DetailedAppointment])
+
 
 def get_authenticated_patient(
     current_user_data: dict = Depends(get_current_user_from_token)
@@ -53,6 +113,11 @@ def get_authenticated_patient(
     return user
 
 
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """model_dump() of a profile component; {} when it is missing"""
+    return obj.model_dump() if isinstance(obj, BaseModel) else {}
+
+
 def transform_profile_for_frontend(profile_data: Any) -> Dict[str, Any]:
     """
     Transform PatientPrivateProfile to match frontend expected format.
@@ -76,120 +141,26 @@ def transform_profile_for_frontend(profile_data: Any) -> Dict[str, Any]:
             "account": {}
         }
     
-    # Use model_dump() if available (Pydantic v2), otherwise fallback
-    try:
-        if hasattr(profile_data, 'model_dump'):
-            profile_dict = profile_data.model_dump()
-        elif hasattr(profile_data, 'dict'):
-            profile_dict = profile_data.dict()
-        else:
-            profile_dict = {}
-    except Exception:
-        profile_dict = {}
-    
-    # Extract personal_info
-    personal_info = {}
-    if profile_data.personal_info:
-        if hasattr(profile_data.personal_info, 'model_dump'):
-            personal_info = profile_data.personal_info.model_dump()
-        elif hasattr(profile_data.personal_info, 'dict'):
-            personal_info = profile_data.personal_info.dict()
-        else:
-            personal_info = {
-                "first_name": getattr(profile_data.personal_info, 'first_name', ''),
-                "last_name": getattr(profile_data.personal_info, 'last_name', ''),
-                "date_of_birth": getattr(profile_data.personal_info, 'date_of_birth', None),
-                "gender": getattr(profile_data.personal_info, 'gender', None),
-                "primary_language": getattr(profile_data.personal_info, 'primary_language', None),
-                "full_address": getattr(profile_data.personal_info, 'full_address', '')
-            }
-    
-    # Extract location
-    location = {}
-    if profile_data.location_info:
-        if hasattr(profile_data.location_info, 'model_dump'):
-            location = profile_data.location_info.model_dump()
-        elif hasattr(profile_data.location_info, 'dict'):
-            location = profile_data.location_info.dict()
-        else:
-            location = {
-                "city": getattr(profile_data.location_info, 'city', ''),
-                "district": getattr(profile_data.location_info, 'district', None),
-                "province": getattr(profile_data.location_info, 'province', None),
-                "country": getattr(profile_data.location_info, 'country', '')
-            }
-    
-    # Extract medical_history
-    medical_history = {}
-    if profile_data.medical_history:
-        if hasattr(profile_data.medical_history, 'model_dump'):
-            medical_history = profile_data.medical_history.model_dump()
-        elif hasattr(profile_data.medical_history, 'dict'):
-            medical_history = profile_data.medical_history.dict()
+    personal_info = _to_dict(profile_data.personal_info)
+    location = _to_dict(profile_data.location_info)
+    medical_history = _to_dict(profile_data.medical_history)
     
     # Transform appointments
     appointments = {"list": [], "next": None}
     if profile_data.appointments:
-        appointments_list = []
-        for appt in profile_data.appointments:
-            if hasattr(appt, 'model_dump'):
-                appt_dict = appt.model_dump()
-            elif hasattr(appt, 'dict'):
-                appt_dict = appt.dict()
-            else:
-                appt_dict = {
-                    "id": str(getattr(appt, 'id', '')),
-                    "scheduled_start": getattr(appt, 'scheduled_start', None),
-                    "scheduled_end": getattr(appt, 'scheduled_end', None),
-                    "appointment_type": getattr(appt, 'appointment_type', None),
-                    "status": getattr(appt, 'status', None),
-                    "fee": float(getattr(appt, 'fee', 0)) if getattr(appt, 'fee', None) else None,
-                    "payment_status": getattr(appt, 'payment_status', None),
-                    "specialist_name": getattr(appt, 'specialist_name', None)
-                }
-            appointments_list.append(appt_dict)
-        appointments["list"] = appointments_list
+        appointments["list"] = _appointments_adapter.dump_python(profile_data.appointments)
         
         # Add next appointment if available
         if profile_data.next_appointment:
-            next_appt = profile_data.next_appointment
-            if hasattr(next_appt, 'model_dump'):
-                appointments["next"] = next_appt.model_dump()
-            elif hasattr(next_appt, 'dict'):
-                appointments["next"] = next_appt.dict()
-            else:
-                appointments["next"] = {
-                    "id": str(getattr(next_appt, 'id', '')),
-                    "scheduled_start": getattr(next_appt, 'scheduled_start', None),
-                    "scheduled_end": getattr(next_appt, 'scheduled_end', None),
-                    "appointment_type": getattr(next_appt, 'appointment_type', None),
-                    "status": getattr(next_appt, 'status', None),
-                    "fee": float(getattr(next_appt, 'fee', 0)) if getattr(next_appt, 'fee', None) else None,
-                    "payment_status": getattr(next_appt, 'payment_status', None),
-                    "specialist_name": getattr(next_appt, 'specialist_name', None)
-                }
+            appointments["next"] = _to_dict(profile_data.next_appointment)
     
     # Transform account info
-    account = {}
-    if profile_data.auth_info:
-        if hasattr(profile_data.auth_info, 'model_dump'):
-            account = profile_data.auth_info.model_dump()
-        elif hasattr(profile_data.auth_info, 'dict'):
-            account = profile_data.auth_info.dict()
-        else:
-            account = {
-                "is_active": getattr(profile_data.auth_info, 'is_active', True),
-                "is_verified": getattr(profile_data.auth_info, 'is_verified', False),
-                "is_locked": getattr(profile_data.auth_info, 'is_locked', False),
-                "last_login": getattr(profile_data.auth_info, 'last_login', None),
-                "theme_preference": getattr(profile_data.auth_info, 'theme_preference', None),
-                "avatar_url": getattr(profile_data.auth_info, 'avatar_url', None)
-            }
+    account = _to_dict(profile_data.auth_info)
     
     # Add contact info to account
     if profile_data.contact_info:
-        account["email"] = getattr(profile_data.contact_info, 'email', '')
-        account["phone"] = getattr(profile_data.contact_info, 'phone', None)
+        account["email"] = profile_data.contact_info.email
+        account["phone"] = profile_data.contact_info.phone
     
     return {
         "personal_info": personal_info,
@@ -206,31 +177,30 @@ def transform_profile_for_frontend(profile_data: Any) -> Dict[str, Any]:
 
 @router.get("/patient/profile")
 async def get_patient_profile(
-    current_user_data: dict = Depends(get_current_user_from_token),
+    request: Request,
+    response: Response,
+    patient: Patient = Depends(get_authenticated_patient),
     db: Session = Depends(get_db)
 ):
     """
     Get patient profile data.
     
-    Returns patient profile in the format expected by the frontend.
+    Returns patient profile in the format expected by the frontend, or
+    304 Not Modified when If-None-Match carries the current ETag.
     """
     try:
-        # Get authenticated patient
-        user = current_user_data.get("user")
-        user_type = current_user_data.get("user_type")
+        patient_id = patient.id
         
-        if not user or user_type != "patient":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Patient access required"
-            )
+        etag = _profile_etag(db, patient_id)
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         
-        patient_id = user.id if hasattr(user, 'id') else None
-        if not patient_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Patient not found"
-            )
+        # Cached per ETag, so a cached copy never outlives the state it was built from
+        cached = cache_hget(_profile_cache_key(patient_id), etag)
+        if cached is not None:
+            return cached
         
         # Get patient profile using service
         profile_service = PatientProfileService(db)
@@ -242,8 +212,9 @@ async def get_patient_profile(
                 detail="Profile not found"
             )
         
-        # Transform to frontend format
-        transformed_data = transform_profile_for_frontend(profile)
+        # Transform to frontend format; cache the JSON-ready form
+        transformed_data = jsonable_encoder(transform_profile_for_frontend(profile))
+        cache_hset(_profile_cache_key(patient_id), etag, transformed_data, PROFILE_CACHE_TTL_SECONDS)
         
         return transformed_data
         
@@ -260,7 +231,7 @@ async def get_patient_profile(
 @router.put("/patient/profile")
 async def update_patient_profile(
     profile_data: Dict[str, Any],
-    current_user_data: dict = Depends(get_current_user_from_token),
+    patient: Patient = Depends(get_authenticated_patient),
     db: Session = Depends(get_db)
 ):
     """
@@ -270,17 +241,9 @@ async def update_patient_profile(
     Full implementation would validate and update patient data.
     """
     try:
-        # Get authenticated patient
-        user = current_user_data.get("user")
-        user_type = current_user_data.get("user_type")
-        
-        if not user or user_type != "patient":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Patient access required"
-            )
-        
         # TODO: Implement profile update logic
+        cache_delete(_profile_cache_key(patient.id))
+        
         # For now, return success message
         return {
             "success": True,
@@ -40,7 +40,12 @@ class Settings(BaseSettings):
     DB_NAME: str = "mindmatedb"
     DB_USER: str
     DB_PASSWORD: str
-    DB_MAX_CONNECTIONS: int = 20
+    DB_MAX_CONNECTIONS: int = 20  # Persistent pool size
+    DB_POOL_MAX_OVERFLOW: int = 40  # Extra connections allowed under bursts
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_STATEMENT_TIMEOUT_MS: int = 5000  # Per-statement server timeout for API request sessions; 0 disables
+    DB_QUERY_CACHE_SIZE: int = 1200  # Compiled SQL statements kept per engine
     DB_TIMEOUT: int = 30
     DB_POOL_PRE_PING: bool = True
     DB_ECHO: bool = False
@@ -0,0 +1 @@
+"""Helpers shared by Alembic revisions."""
@@ -0,0 +1,58 @@
+"""
+Batched Data Backfills
+======================
+Runs a large UPDATE from a migration as a series of short, separately
+committed batches instead of one long transaction, so a backfill over a big
+table neither holds row locks for its whole duration nor builds up one huge
+transaction's worth of WAL and dead tuples.
+
+Usage inside a revision's upgrade():
+
+    sessions = sa.table('assessment_sessions_v2', sa.column('id'), sa.column('status'))
+    batched_backfill(sessions, {'status': 'active'}, where=sessions.c.status.is_(None))
+"""
+
+from typing import Any, Dict, Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def batched_backfill(
+    table: sa.TableClause,
+    values: Dict[str, Any],
+    where: Optional[sa.ColumnElement] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    key: str = "id",
+) -> int:
+    """
+    UPDATE table SET values [WHERE where], batch_size rows at a time.
+
+    Rows are walked in `key` order (keyset pagination, so each batch is an
+    index range scan rather than a growing OFFSET) and every batch commits on
+    its own inside autocommit_block(). Returns the number of rows updated.
+    """
+    bind = op.get_bind()
+    key_column = table.c[key]
+    updated = 0
+    last_key = None
+
+    with op.get_context().autocommit_block():
+        while True:
+            batch = sa.select(key_column).order_by(key_column).limit(batch_size)
+            if where is not None:
+                batch = batch.where(where)
+            if last_key is not None:
+                batch = batch.where(key_column > last_key)
+
+            keys = bind.execute(batch).scalars().all()
+            if not keys:
+                break
+
+            result = bind.execute(sa.update(table).where(key_column.in_(keys)).values(**values))
+            updated += result.rowcount
+            last_key = keys[-1]
+
+    return updated
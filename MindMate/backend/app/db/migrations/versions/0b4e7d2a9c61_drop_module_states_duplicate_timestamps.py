@@ -0,0 +1,54 @@
+"""drop_module_states_duplicate_timestamps
+
+Revision ID: 0b4e7d2a9c61
+Revises: f2c6a8e1d394
+Create Date: 2026-10-16 12:26:14.093857
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b4e7d2a9c61'
+down_revision: Union[str, Sequence[str], None] = 'f2c6a8e1d394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop created_at_time/updated_at_time from assessment_module_states; index updated_at instead."""
+    # Dropping updated_at_time also drops the old idx_module_states_updated
+    op.execute(
+        "ALTER TABLE assessment_module_states "
+        "DROP COLUMN IF EXISTS created_at_time, "
+        "DROP COLUMN IF EXISTS updated_at_time"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_module_states_updated "
+            "ON assessment_module_states (updated_at)"
+        )
+
+
+def downgrade() -> None:
+    """Restore the duplicate timestamp columns, filled from created_at/updated_at."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_module_states_updated")
+    op.execute(
+        "ALTER TABLE assessment_module_states "
+        "ADD COLUMN IF NOT EXISTS created_at_time timestamptz, "
+        "ADD COLUMN IF NOT EXISTS updated_at_time timestamptz"
+    )
+    op.execute(
+        "UPDATE assessment_module_states "
+        "SET created_at_time = created_at, updated_at_time = updated_at"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_module_states_updated "
+            "ON assessment_module_states (updated_at_time)"
+        )
@@ -0,0 +1,40 @@
+"""assessment_session_fillfactor
+
+Revision ID: 1c5f9b3e7a28
+Revises: 0b4e7d2a9c61
+Create Date: 2026-10-16 12:51:40.617384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c5f9b3e7a28'
+down_revision: Union[str, Sequence[str], None] = '0b4e7d2a9c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose rows are rewritten on every assessment turn
+HOT_UPDATE_TABLES = (
+    'assessment_sessions',
+    'assessment_module_states',
+    'assessment_sessions_v2',
+)
+
+
+def upgrade() -> None:
+    """Leave 30% free space per page so session updates can stay HOT."""
+    # Only affects newly written pages; existing ones fill up as rows are updated
+    for table_name in HOT_UPDATE_TABLES:
+        op.execute(f"ALTER TABLE {table_name} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    """Back to the default fillfactor."""
+    for table_name in HOT_UPDATE_TABLES:
+        op.execute(f"ALTER TABLE {table_name} RESET (fillfactor)")
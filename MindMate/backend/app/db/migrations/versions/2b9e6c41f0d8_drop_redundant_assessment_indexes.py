@@ -0,0 +1,45 @@
+"""drop_redundant_assessment_indexes
+
+Revision ID: 2b9e6c41f0d8
+Revises: 8a6f3d2c1e57
+Create Date: 2026-10-16 09:24:37.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b9e6c41f0d8'
+down_revision: Union[str, Sequence[str], None] = '8a6f3d2c1e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, columns) already served by the leading column(s) of a
+# composite index or unique constraint on the same table
+REDUNDANT_INDEXES = (
+    ('idx_assessment_sessions_patient', 'assessment_sessions', 'patient_id'),
+    ('idx_assessment_sessions_session_id', 'assessment_sessions', 'session_id'),
+    ('idx_module_states_session', 'assessment_module_states', 'session_id'),
+    ('idx_module_results_session', 'assessment_module_results', 'session_id'),
+    ('idx_module_results_patient', 'assessment_module_results', 'patient_id'),
+    ('idx_conversations_patient', 'assessment_conversations', 'patient_id'),
+)
+
+
+def upgrade() -> None:
+    """Drop single-column assessment indexes covered by composite ones."""
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    """Recreate the single-column assessment indexes."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in REDUNDANT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name} ({column})")
@@ -0,0 +1,46 @@
+"""add_exercise_sessions_practice_day
+
+Revision ID: 3b7e0d9f52c1
+Revises: 9f4b1c6e8a35
+Create Date: 2026-10-15 21:14:06.482913
+
+Adding a STORED generated column rewrites the whole of exercise_sessions
+under an ACCESS EXCLUSIVE lock, blocking reads and writes on the table for
+the duration. Run it in a maintenance window on large databases. The index
+is built CONCURRENTLY afterwards, so it does not extend that lock.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e0d9f52c1'
+down_revision: Union[str, Sequence[str], None] = '9f4b1c6e8a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a stored UTC practice_day to exercise_sessions and index it for mood trends."""
+    op.execute(
+        "ALTER TABLE exercise_sessions ADD COLUMN IF NOT EXISTS practice_day date "
+        "GENERATED ALWAYS AS ((start_time AT TIME ZONE 'UTC')::date) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercise_sessions_patient_day "
+            "ON exercise_sessions (patient_id, practice_day) "
+            "INCLUDE (mood_before, mood_after, mood_improvement) "
+            "WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    """Drop the practice_day column and its index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercise_sessions_patient_day")
+    op.execute("ALTER TABLE exercise_sessions DROP COLUMN IF EXISTS practice_day")
@@ -0,0 +1,36 @@
+"""add_exercise_sessions_keyset_index
+
+Revision ID: 4c8e2a91d7b3
+Revises: 1d11971cce1e
+Create Date: 2026-10-15 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8e2a91d7b3'
+down_revision: Union[str, Sequence[str], None] = '1d11971cce1e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a (patient_id, start_time DESC, id DESC) index on exercise_sessions."""
+    # Serves the keyset-paginated sessions list and per-patient session counts
+    # from the index alone
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercise_sessions_patient_starttime "
+            "ON exercise_sessions (patient_id, start_time DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercise_sessions_patient_starttime")
@@ -0,0 +1,35 @@
+"""add_exercise_progress_count_index
+
+Revision ID: 5e2d7b14a8c6
+Revises: c4e81a2f6d93
+Create Date: 2026-10-15 22:31:52.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2d7b14a8c6'
+down_revision: Union[str, Sequence[str], None] = 'c4e81a2f6d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index live exercise progress by completion count for the most_practiced analytics sort."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercise_progress_patient_count_live "
+            "ON exercise_progress (patient_id, completion_count DESC, id) "
+            "WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    """Drop the completion count index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercise_progress_patient_count_live")
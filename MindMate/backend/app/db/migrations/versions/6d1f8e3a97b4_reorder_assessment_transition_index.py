@@ -0,0 +1,44 @@
+"""reorder_assessment_transition_index
+
+Revision ID: 6d1f8e3a97b4
+Revises: 2b9e6c41f0d8
+Create Date: 2026-10-16 09:58:12.640915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d1f8e3a97b4'
+down_revision: Union[str, Sequence[str], None] = '2b9e6c41f0d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Lead the transitions index with to_module and index open assessment sessions per patient."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transitions_to_from "
+            "ON assessment_module_transitions (to_module, from_module)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_transitions_modules")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assessment_sessions_patient_open "
+            "ON assessment_sessions (patient_id) WHERE is_complete = false"
+        )
+
+
+def downgrade() -> None:
+    """Restore the (from_module, to_module) transitions index and drop the open-session index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_assessment_sessions_patient_open")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transitions_modules "
+            "ON assessment_module_transitions (from_module, to_module)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_transitions_to_from")
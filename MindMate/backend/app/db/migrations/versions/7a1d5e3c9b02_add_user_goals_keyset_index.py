@@ -0,0 +1,35 @@
+"""add_user_goals_keyset_index
+
+Revision ID: 7a1d5e3c9b02
+Revises: 4c8e2a91d7b3
+Create Date: 2026-10-15 14:03:27.904416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1d5e3c9b02'
+down_revision: Union[str, Sequence[str], None] = '4c8e2a91d7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a (patient_id, status, created_at DESC, id DESC) index on user_goals."""
+    # Serves the keyset-paginated goals list, filtered by status
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_goals_patient_status_created "
+            "ON user_goals (patient_id, status, created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_goals_patient_status_created")
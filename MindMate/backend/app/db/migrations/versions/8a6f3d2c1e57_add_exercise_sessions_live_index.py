@@ -0,0 +1,42 @@
+"""add_exercise_sessions_live_index
+
+Revision ID: 8a6f3d2c1e57
+Revises: 5e2d7b14a8c6
+Create Date: 2026-10-15 23:12:08.336491
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a6f3d2c1e57'
+down_revision: Union[str, Sequence[str], None] = '5e2d7b14a8c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index live exercise sessions by start_time for the dashboard and goal range counts."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercise_sessions_patient_start_live "
+            "ON exercise_sessions (patient_id, start_time) "
+            "WHERE is_deleted = false"
+        )
+        # Any (patient_id, start_time) scan is served by ix_exercise_sessions_patient_starttime
+        # (B-tree indexes scan both ways), or by the live index above
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_session_patient_date")
+
+
+def downgrade() -> None:
+    """Drop the live sessions index and restore idx_session_patient_date."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_session_patient_date "
+            "ON exercise_sessions (patient_id, start_time)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercise_sessions_patient_start_live")
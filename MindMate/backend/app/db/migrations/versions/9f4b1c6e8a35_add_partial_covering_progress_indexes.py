@@ -0,0 +1,47 @@
+"""add_partial_covering_progress_indexes
+
+Revision ID: 9f4b1c6e8a35
+Revises: e5c29a7d14f8
+Create Date: 2026-10-15 18:47:52.630194
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f4b1c6e8a35'
+down_revision: Union[str, Sequence[str], None] = 'e5c29a7d14f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial (is_deleted = false) indexes matching the progress endpoints."""
+    # exercise_sessions, mood_assessments and journal_entries are already
+    # covered by the keyset and timeline indexes
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_achievements_patient_live "
+            "ON user_achievements (patient_id) INCLUDE (achievement_id, unlocked_at) "
+            "WHERE is_deleted = false"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_goals_patient_status_live "
+            "ON user_goals (patient_id, status) WHERE is_deleted = false"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exercise_progress_patient_practiced_live "
+            "ON exercise_progress (patient_id, last_practiced_at DESC) WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial progress indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exercise_progress_patient_practiced_live")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_goals_patient_status_live")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_achievements_patient_live")
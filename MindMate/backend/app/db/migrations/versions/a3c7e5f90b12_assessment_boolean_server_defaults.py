@@ -0,0 +1,59 @@
+"""assessment_boolean_server_defaults
+
+Revision ID: a3c7e5f90b12
+Revises: 6d1f8e3a97b4
+Create Date: 2026-10-16 10:31:49.275503
+
+The is_deleted backfill commits in batches (batched_backfill), so the
+revision is not atomic: if it fails partway, the defaults and the rows
+backfilled so far stay. Every step is safe to re-run.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations.utils.batched_backfill import batched_backfill
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e5f90b12'
+down_revision: Union[str, Sequence[str], None] = '6d1f8e3a97b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ASSESSMENT_TABLES = (
+    'assessment_sessions',
+    'assessment_module_states',
+    'assessment_module_results',
+    'assessment_conversations',
+    'assessment_module_transitions',
+    'assessment_demographics',
+)
+
+
+def upgrade() -> None:
+    """Give the assessment booleans server-side false defaults and make is_deleted NOT NULL."""
+    # Defaults first, so rows inserted during the backfill don't add new NULLs
+    for table_name in ASSESSMENT_TABLES:
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN is_deleted SET DEFAULT false")
+    op.execute("ALTER TABLE assessment_sessions ALTER COLUMN is_complete SET DEFAULT false")
+
+    for table_name in ASSESSMENT_TABLES:
+        table = sa.table(table_name, sa.column('id'), sa.column('is_deleted'))
+        batched_backfill(table, {'is_deleted': False}, where=table.c.is_deleted.is_(None))
+        op.execute(f"ALTER TABLE {table_name} ALTER COLUMN is_deleted SET NOT NULL")
+
+
+def downgrade() -> None:
+    """Drop the server defaults and allow NULL is_deleted again."""
+    op.execute("ALTER TABLE assessment_sessions ALTER COLUMN is_complete DROP DEFAULT")
+    for table_name in ASSESSMENT_TABLES:
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            "ALTER COLUMN is_deleted DROP NOT NULL, "
+            "ALTER COLUMN is_deleted DROP DEFAULT"
+        )
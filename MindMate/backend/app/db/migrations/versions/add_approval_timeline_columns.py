@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import JSON
 
 
 # revision identifiers, used by Alembic.
@@ -19,53 +18,29 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    """Upgrade schema."""
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    existing_columns = {column["name"] for column in inspector.get_columns("specialists_approval_data")}
-
-    # Add missing columns to specialists_approval_data table
-    if 'document_verification_status' not in existing_columns:
-        op.add_column(
-            'specialists_approval_data',
-            sa.Column(
-                'document_verification_status',
-                sa.String(20),
-                nullable=True,
-                server_default='pending',
-                comment='Status of document verification'
-            )
-        )
+# (column, type and default, comment) added to specialists_approval_data
+APPROVAL_COLUMNS = (
+    ('document_verification_status', "VARCHAR(20) DEFAULT 'pending'", 'Status of document verification'),
+    ('compliance_check_status', "VARCHAR(20) DEFAULT 'pending'", 'Status of compliance check'),
+    ('approval_timeline', 'JSONB', 'Timeline of approval process: {profile_completion: timestamp, ...}'),
+)
 
-    if 'compliance_check_status' not in existing_columns:
-        op.add_column(
-            'specialists_approval_data',
-            sa.Column(
-                'compliance_check_status',
-                sa.String(20),
-                nullable=True,
-                server_default='pending',
-                comment='Status of compliance check'
-            )
-        )
 
-    if 'approval_timeline' not in existing_columns:
-        op.add_column(
-            'specialists_approval_data',
-            sa.Column(
-                'approval_timeline',
-                JSON,
-                nullable=True,
-                comment='Timeline of approval process: {profile_completion: timestamp, ...}'
-            )
-        )
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One ALTER TABLE so the table lock is taken once; IF NOT EXISTS skips columns already present
+    op.execute(
+        "ALTER TABLE specialists_approval_data "
+        + ", ".join(f"ADD COLUMN IF NOT EXISTS {name} {definition}" for name, definition, _ in APPROVAL_COLUMNS)
+    )
+    for name, _, comment in APPROVAL_COLUMNS:
+        op.execute(f"COMMENT ON COLUMN specialists_approval_data.{name} IS '{comment}'")
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Remove the added columns from specialists_approval_data table
-    op.drop_column('specialists_approval_data', 'approval_timeline')
-    op.drop_column('specialists_approval_data', 'compliance_check_status')
-    op.drop_column('specialists_approval_data', 'document_verification_status')
-
+    op.execute(
+        "ALTER TABLE specialists_approval_data "
+        + ", ".join(f"DROP COLUMN IF EXISTS {name}" for name, _, _ in reversed(APPROVAL_COLUMNS))
+    )
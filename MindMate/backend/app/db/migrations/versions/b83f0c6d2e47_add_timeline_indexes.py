@@ -0,0 +1,40 @@
+"""add_timeline_indexes
+
+Revision ID: b83f0c6d2e47
+Revises: 7a1d5e3c9b02
+Create Date: 2026-10-15 16:41:09.277130
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83f0c6d2e47'
+down_revision: Union[str, Sequence[str], None] = '7a1d5e3c9b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-patient, newest-first indexes used by the progress timeline."""
+    # exercise_sessions is already covered by ix_exercise_sessions_patient_starttime
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_mood_assessments_patient_date "
+            "ON mood_assessments (patient_id, assessment_date DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_journal_entries_patient_date "
+            "ON journal_entries (patient_id, entry_date DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the timeline indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_journal_entries_patient_date")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mood_assessments_patient_date")
@@ -0,0 +1,36 @@
+"""add_practice_calendar_covering_index
+
+Revision ID: c4e81a2f6d93
+Revises: 3b7e0d9f52c1
+Create Date: 2026-10-15 22:03:41.517260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81a2f6d93'
+down_revision: Union[str, Sequence[str], None] = '3b7e0d9f52c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cover the calendar endpoints' live-day range reads with an index-only scan."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_practice_calendar_patient_date_live "
+            "ON practice_calendar (patient_id, practice_date) "
+            "INCLUDE (session_count, intensity_level, exercises_practiced) "
+            "WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    """Drop the covering calendar index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_practice_calendar_patient_date_live")
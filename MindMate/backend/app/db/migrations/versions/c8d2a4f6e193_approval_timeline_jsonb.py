@@ -0,0 +1,35 @@
+"""approval_timeline_jsonb
+
+Revision ID: c8d2a4f6e193
+Revises: a3c7e5f90b12
+Create Date: 2026-10-16 11:02:55.804317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2a4f6e193'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e5f90b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store specialists_approval_data.approval_timeline as jsonb."""
+    op.execute(
+        "ALTER TABLE specialists_approval_data "
+        "ALTER COLUMN approval_timeline TYPE jsonb USING approval_timeline::jsonb"
+    )
+
+
+def downgrade() -> None:
+    """Store approval_timeline as json again."""
+    op.execute(
+        "ALTER TABLE specialists_approval_data "
+        "ALTER COLUMN approval_timeline TYPE json USING approval_timeline::json"
+    )
@@ -0,0 +1,44 @@
+"""assessment_sessions_v2_composite_index
+
+Revision ID: d5b8e1f3a726
+Revises: c8d2a4f6e193
+Create Date: 2026-10-16 11:24:08.319547
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b8e1f3a726'
+down_revision: Union[str, Sequence[str], None] = 'c8d2a4f6e193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the user_id and status indexes on assessment_sessions_v2 with one (user_id, status, updated_at DESC) index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_assessment_sessions_v2_user_status_updated "
+            "ON assessment_sessions_v2 (user_id, status, updated_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_assessment_sessions_v2_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_assessment_sessions_v2_status")
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id and status indexes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_assessment_sessions_v2_status "
+            "ON assessment_sessions_v2 (status)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_assessment_sessions_v2_user_id "
+            "ON assessment_sessions_v2 (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_assessment_sessions_v2_user_status_updated")
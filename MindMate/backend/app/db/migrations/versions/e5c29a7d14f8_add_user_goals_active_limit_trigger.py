@@ -0,0 +1,58 @@
+"""add_user_goals_active_limit_trigger
+
+Revision ID: e5c29a7d14f8
+Revises: b83f0c6d2e47
+Create Date: 2026-10-15 18:02:37.514806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c29a7d14f8'
+down_revision: Union[str, Sequence[str], None] = 'b83f0c6d2e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enforce the 3-active-goals limit per patient in the database."""
+    # The advisory lock serialises concurrent inserts for the same patient, which
+    # a plain count check cannot do under READ COMMITTED
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION enforce_active_goal_limit() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.status = 'ACTIVE' THEN
+                PERFORM pg_advisory_xact_lock(hashtext('user_goals_active:' || NEW.patient_id::text));
+                IF (
+                    SELECT count(*) FROM user_goals
+                    WHERE patient_id = NEW.patient_id
+                      AND status = 'ACTIVE'
+                      AND id <> NEW.id
+                ) >= 3 THEN
+                    RAISE EXCEPTION 'Maximum of 3 active goals allowed'
+                        USING ERRCODE = 'check_violation';
+                END IF;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS user_goals_active_limit ON user_goals")
+    op.execute(
+        "CREATE TRIGGER user_goals_active_limit "
+        "BEFORE INSERT OR UPDATE OF status ON user_goals "
+        "FOR EACH ROW EXECUTE PROCEDURE enforce_active_goal_limit()"
+    )
+
+
+def downgrade() -> None:
+    """Drop the active-goal limit trigger."""
+    op.execute("DROP TRIGGER IF EXISTS user_goals_active_limit ON user_goals")
+    op.execute("DROP FUNCTION IF EXISTS enforce_active_goal_limit()")
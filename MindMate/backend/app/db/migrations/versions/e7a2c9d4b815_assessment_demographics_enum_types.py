@@ -0,0 +1,71 @@
+"""assessment_demographics_enum_types
+
+Revision ID: e7a2c9d4b815
+Revises: d5b8e1f3a726
+Create Date: 2026-10-16 11:47:36.508192
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c9d4b815'
+down_revision: Union[str, Sequence[str], None] = 'd5b8e1f3a726'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# column -> (enum type name, varchar length it replaces, allowed values)
+DEMOGRAPHIC_ENUMS = {
+    'gender': ('gender_enum', 50, ('Male', 'Female', 'Non-binary', 'Prefer not to say')),
+    'education_level': ('education_level_enum', 100, (
+        'No formal education', 'Primary school', 'High school',
+        "Bachelor's degree", "Master's degree", 'Doctorate',
+    )),
+    'occupation': ('occupation_enum', 100, (
+        'Student', 'Employed full-time', 'Employed part-time',
+        'Self-employed', 'Unemployed', 'Retired',
+    )),
+    'marital_status': ('marital_status_enum', 50, ('Single', 'Married', 'Divorced', 'Widowed', 'Separated')),
+    'living_situation': ('living_situation_enum', 50, (
+        'alone', 'with_family', 'with_partner', 'shared', 'institutionalized',
+    )),
+    'financial_status': ('financial_status_enum', 50, ('stable', 'moderate', 'unstable')),
+}
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def upgrade() -> None:
+    """Store the constrained assessment_demographics columns as native enums instead of CHECKed varchars."""
+    bind = op.get_bind()
+    for type_name, _, values in DEMOGRAPHIC_ENUMS.values():
+        postgresql.ENUM(*values, name=type_name).create(bind, checkfirst=True)
+
+    # One ALTER TABLE so the table is rewritten once for all six columns
+    clauses = []
+    for column, (type_name, _, _) in DEMOGRAPHIC_ENUMS.items():
+        clauses.append(f"DROP CONSTRAINT IF EXISTS assessment_demographics_{column}_check")
+        clauses.append(f"ALTER COLUMN {column} TYPE {type_name} USING {column}::text::{type_name}")
+    op.execute("ALTER TABLE assessment_demographics " + ", ".join(clauses))
+
+
+def downgrade() -> None:
+    """Go back to varchar columns guarded by CHECK constraints."""
+    clauses = []
+    for column, (_, length, values) in DEMOGRAPHIC_ENUMS.items():
+        value_list = ", ".join(_quote(value) for value in values)
+        clauses.append(f"ALTER COLUMN {column} TYPE varchar({length}) USING {column}::text")
+        clauses.append(
+            f"ADD CONSTRAINT assessment_demographics_{column}_check CHECK ({column} IN ({value_list}))"
+        )
+    op.execute("ALTER TABLE assessment_demographics " + ", ".join(clauses))
+
+    for type_name, _, _ in DEMOGRAPHIC_ENUMS.values():
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
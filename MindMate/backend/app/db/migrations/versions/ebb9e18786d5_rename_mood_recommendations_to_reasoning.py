@@ -18,33 +18,31 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _rename_column_if_present(old_name: str, new_name: str) -> None:
+    """Rename a mood_assessments column in one server-side check-and-ALTER."""
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'mood_assessments' AND column_name = '{old_name}'
+            ) AND NOT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'mood_assessments' AND column_name = '{new_name}'
+            ) THEN
+                ALTER TABLE mood_assessments RENAME COLUMN {old_name} TO {new_name};
+            END IF;
+        END $$;
+    """)
+
+
 def upgrade() -> None:
     """Upgrade schema - Rename recommendations to reasoning in mood_assessments."""
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    columns = {column["name"] for column in inspector.get_columns("mood_assessments")}
-
-    if 'recommendations' in columns and 'reasoning' not in columns:
-        op.alter_column(
-            'mood_assessments',
-            'recommendations',
-            new_column_name='reasoning',
-            existing_type=sa.Text(),
-            existing_nullable=True
-        )
+    _rename_column_if_present('recommendations', 'reasoning')
 
 
 def downgrade() -> None:
     """Downgrade schema - Rename reasoning back to recommendations."""
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    columns = {column["name"] for column in inspector.get_columns("mood_assessments")}
-
-    if 'reasoning' in columns and 'recommendations' not in columns:
-        op.alter_column(
-            'mood_assessments',
-            'reasoning',
-            new_column_name='recommendations',
-            existing_type=sa.Text(),
-            existing_nullable=True
-        )
+    _rename_column_if_present('reasoning', 'recommendations')
@@ -0,0 +1,34 @@
+"""add_module_history_gin_index
+
+Revision ID: f2c6a8e1d394
+Revises: e7a2c9d4b815
+Create Date: 2026-10-16 12:08:51.742630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6a8e1d394'
+down_revision: Union[str, Sequence[str], None] = 'e7a2c9d4b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """GIN-index assessment_sessions.module_history for module_history @> ARRAY[...] lookups."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sessions_module_history_gin "
+            "ON assessment_sessions USING gin (module_history)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the module_history GIN index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_sessions_module_history_gin")
@@ -19,15 +19,19 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    with op.batch_alter_table('mandatory_questionnaires', schema=None) as batch_op:
-        batch_op.drop_column('full_name')
-        batch_op.drop_column('gender')
-        batch_op.drop_column('chief_complaint')
+    # DROP COLUMN only marks the columns dropped in the catalog; one statement takes the lock once
+    op.execute(
+        "ALTER TABLE mandatory_questionnaires "
+        "DROP COLUMN full_name, "
+        "DROP COLUMN gender, "
+        "DROP COLUMN chief_complaint"
+    )
 
 
 def downgrade() -> None:
-    with op.batch_alter_table('mandatory_questionnaires', schema=None) as batch_op:
-        batch_op.add_column(sa.Column('chief_complaint', sa.Text(), nullable=True))
-        batch_op.add_column(sa.Column('gender', sa.String(length=50), nullable=True))
-        batch_op.add_column(sa.Column('full_name', sa.String(length=200), nullable=True))
-
+    op.execute(
+        "ALTER TABLE mandatory_questionnaires "
+        "ADD COLUMN chief_complaint TEXT, "
+        "ADD COLUMN gender VARCHAR(50), "
+        "ADD COLUMN full_name VARCHAR(200)"
+    )
@@ -2,7 +2,7 @@
 import logging
 from typing import Generator, Optional
 from contextlib import contextmanager
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 import redis
@@ -13,17 +13,21 @@ from app.core.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Create SQLAlchemy engine
+_connect_args = {
+    "connect_timeout": settings.DB_TIMEOUT,
+    "application_name": settings.APP_NAME
+}
+
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
-    pool_recycle=300,  # Recycle connections every 5 minutes
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_size=settings.DB_MAX_CONNECTIONS,
-    max_overflow=20,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     echo=settings.DB_ECHO,
-    connect_args={
-        "connect_timeout": settings.DB_TIMEOUT,
-        "application_name": settings.APP_NAME
-    }
+    connect_args=_connect_args
 )
 
 # Create session factory
@@ -32,6 +36,26 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Import the declarative base from models (which has all models registered)
 from app.models import Base
 
+
+def _set_request_statement_timeout(session: Session, transaction, connection) -> None:
+    """Cap each statement of a request transaction; SET LOCAL ends with the transaction"""
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {settings.DB_STATEMENT_TIMEOUT_MS}")
+
+
+def _request_session() -> Session:
+    """
+    Create a session for an API request.
+    
+    Runaway queries are cancelled server-side after DB_STATEMENT_TIMEOUT_MS
+    instead of holding a pooled connection. Only request sessions get the
+    limit: scripts and data migrations using SessionLocal/engine directly run
+    without it.
+    """
+    db = SessionLocal()
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        event.listen(db, "after_begin", _set_request_statement_timeout)
+    return db
+
 # Create Redis client (singleton)
 redis_client = redis.Redis(
     host=settings.REDIS_HOST,
@@ -55,7 +79,7 @@ def get_db() -> Generator[Session, None, None]:
     Raises:
         SQLAlchemyError: If database operation fails
     """
-    db = SessionLocal()
+    db = _request_session()
     try:
         yield db
     except SQLAlchemyError as e:
@@ -77,7 +101,7 @@ def get_db_session() -> Generator[Session, None, None]:
     Raises:
         SQLAlchemyError: If database operation fails
     """
-    db = SessionLocal()
+    db = _request_session()
     try:
         yield db
     except SQLAlchemyError as e:
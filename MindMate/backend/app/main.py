@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.core.config import settings
@@ -312,6 +313,15 @@ async def http_handler(request: Request, exc: HTTPException):
         content={"detail": exc.detail, "status_code": exc.status_code}
     )
 
+@app.exception_handler(SQLAlchemyError)
+async def database_handler(request: Request, exc: SQLAlchemyError):
+    """Handle database errors without exposing driver messages"""
+    logger.error(f"💥 Database error on {request.url.path}: {exc}", exc_info=True)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Database error", "status_code": 500}
+    )
+
 @app.exception_handler(Exception)
 async def general_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
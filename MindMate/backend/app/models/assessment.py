@@ -17,7 +17,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from datetime import datetime, date
 from typing import Optional
 import uuid
@@ -39,14 +39,13 @@ class AssessmentSession(Base, BaseModel):
     __tablename__ = "assessment_sessions"
     
     # Session identification
-    session_id = Column(String(100), unique=True, nullable=False, index=True)
+    session_id = Column(String(100), unique=True, nullable=False)
     
     # Patient linkage - CASCADE DELETE ensures cleanup
     patient_id = Column(
         UUID(as_uuid=True),
         ForeignKey('patients.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # User identification (for auth cross-reference)
@@ -62,7 +61,7 @@ class AssessmentSession(Base, BaseModel):
     completed_at = Column(DateTime(timezone=True))
     
     # Status
-    is_complete = Column(Boolean, default=False, nullable=False, index=True)
+    is_complete = Column(Boolean, default=False, server_default=text('false'), nullable=False, index=True)
     
     # Flexible metadata storage (renamed from 'metadata' to avoid SQLAlchemy reserved word)
     session_metadata = Column(JSONB)
@@ -93,7 +92,12 @@ class AssessmentSession(Base, BaseModel):
     # Table args
     __table_args__ = (
         Index('idx_assessment_sessions_patient_active', 'patient_id', 'is_complete'),
+        # A patient's in-progress session
+        Index('idx_assessment_sessions_patient_open', 'patient_id',
+              postgresql_where=text('is_complete = false')),
         Index('idx_assessment_sessions_updated', 'updated_at'),
+        # Sessions that visited a module: module_history @> ARRAY['mood_assessment']
+        Index('idx_sessions_module_history_gin', 'module_history', postgresql_using='gin'),
     )
     
     def __repr__(self):
@@ -117,8 +121,7 @@ class AssessmentModuleState(Base, BaseModel):
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey('assessment_sessions.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     patient_id = Column(
         UUID(as_uuid=True),
@@ -136,10 +139,6 @@ class AssessmentModuleState(Base, BaseModel):
     # Metadata
     # checkpoint_metadata = Column(JSONB, nullable=True)  # REMOVED: Column doesn't exist in database
     
-    # Timestamps
-    created_at_time = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at_time = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
-    
     # Relationships
     session = relationship("AssessmentSession", back_populates="module_states")
     patient = relationship("Patient")
@@ -148,7 +147,7 @@ class AssessmentModuleState(Base, BaseModel):
     __table_args__ = (
         Index('idx_module_states_session_module', 'session_id', 'module_name', unique=True),
         Index('idx_module_states_patient', 'patient_id'),
-        Index('idx_module_states_updated', 'updated_at_time'),
+        Index('idx_module_states_updated', 'updated_at'),
     )
     
     def __repr__(self):
@@ -171,14 +170,12 @@ class AssessmentModuleResult(Base, BaseModel):
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey('assessment_sessions.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     patient_id = Column(
         UUID(as_uuid=True),
         ForeignKey('patients.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Module information
@@ -233,8 +230,7 @@ class AssessmentConversation(Base, BaseModel):
     patient_id = Column(
         UUID(as_uuid=True),
         ForeignKey('patients.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Message context
@@ -323,7 +319,7 @@ class AssessmentModuleTransition(Base, BaseModel):
         Index('idx_transitions_session', 'session_id'),
         Index('idx_transitions_patient', 'patient_id'),
         Index('idx_transitions_timestamp', 'transitioned_at'),
-        Index('idx_transitions_modules', 'from_module', 'to_module'),
+        Index('idx_transitions_to_from', 'to_module', 'from_module'),
     )
     
     def __repr__(self):
@@ -361,27 +357,26 @@ class AssessmentDemographics(Base, BaseModel):
     
     # Demographics fields
     age = Column(Integer, CheckConstraint('age >= 18 AND age <= 120'))
-    gender = Column(String(50), CheckConstraint("gender IN ('Male', 'Female', 'Non-binary', 'Prefer not to say')"))
-    education_level = Column(String(100), CheckConstraint(
-        "education_level IN ('No formal education', 'Primary school', 'High school', "
-        "'Bachelor''s degree', 'Master''s degree', 'Doctorate')"
+    gender = Column(Enum('Male', 'Female', 'Non-binary', 'Prefer not to say', name='gender_enum'))
+    education_level = Column(Enum(
+        'No formal education', 'Primary school', 'High school',
+        "Bachelor's degree", "Master's degree", 'Doctorate',
+        name='education_level_enum'
     ))
-    occupation = Column(String(100), CheckConstraint(
-        "occupation IN ('Student', 'Employed full-time', 'Employed part-time', "
-        "'Self-employed', 'Unemployed', 'Retired')"
-    ))
-    marital_status = Column(String(50), CheckConstraint(
-        "marital_status IN ('Single', 'Married', 'Divorced', 'Widowed', 'Separated')"
+    occupation = Column(Enum(
+        'Student', 'Employed full-time', 'Employed part-time',
+        'Self-employed', 'Unemployed', 'Retired',
+        name='occupation_enum'
     ))
+    marital_status = Column(Enum('Single', 'Married', 'Divorced', 'Widowed', 'Separated', name='marital_status_enum'))
     cultural_background = Column(String(200))
     location = Column(String(200))
     family_psychiatric_conditions = Column(JSONB)  # Array stored as JSON
-    living_situation = Column(String(50), CheckConstraint(
-        "living_situation IN ('alone', 'with_family', 'with_partner', 'shared', 'institutionalized')"
-    ))
-    financial_status = Column(String(50), CheckConstraint(
-        "financial_status IN ('stable', 'moderate', 'unstable')"
+    living_situation = Column(Enum(
+        'alone', 'with_family', 'with_partner', 'shared', 'institutionalized',
+        name='living_situation_enum'
     ))
+    financial_status = Column(Enum('stable', 'moderate', 'unstable', name='financial_status_enum'))
     recent_stressors = Column(JSONB)  # Array stored as JSON
     
     # Metadata
@@ -7,9 +7,10 @@ history, presenting concerns, and risk assessment
 
 from sqlalchemy import (
     Column, Integer, String, Date, DateTime, Boolean, Enum, Text, JSON,
-    ForeignKey, Index, UniqueConstraint, CheckConstraint, Numeric
+    ForeignKey, Index, UniqueConstraint, CheckConstraint, Numeric, text, case, cast, func, Computed
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, validates
 from pydantic import BaseModel, Field, field_validator, computed_field, ConfigDict
 from datetime import datetime, date, timezone
@@ -666,6 +667,12 @@ class MoodAssessment(Base, SQLAlchemyBaseModel):
     # Relationships
     patient = relationship("Patient", back_populates="mood_assessments")
     
+    # Constraints
+    __table_args__ = (
+        # Per-patient, newest-first scans (progress timeline)
+        Index('ix_mood_assessments_patient_date', 'patient_id', text('assessment_date DESC')),
+    )
+    
     def __repr__(self):
         return f"<MoodAssessment(patient_id={self.patient_id}, date={self.assessment_date}, overall_mood_score={self.overall_mood_score}, msi={self.msi})>"
 
@@ -774,6 +781,12 @@ class JournalEntry(Base, SQLAlchemyBaseModel):
     # Relationships
     patient = relationship("Patient", back_populates="journal_entries")
     
+    # Constraints
+    __table_args__ = (
+        # Per-patient, newest-first scans (progress timeline)
+        Index('ix_journal_entries_patient_date', 'patient_id', text('entry_date DESC')),
+    )
+    
     # ============================================================================
     # PROPERTIES
     # ============================================================================
@@ -936,20 +949,37 @@ class ExerciseProgress(Base, SQLAlchemyBaseModel):
         Index('idx_progress_status', 'status'),
         Index('idx_progress_favorite', 'is_favorite'),
         Index('idx_progress_mastery', 'mastery_level'),
+        # Serves the exercise progress list without a sort step
+        Index('ix_exercise_progress_patient_practiced_live', 'patient_id', text('last_practiced_at DESC'),
+              postgresql_where=text('is_deleted = false')),
+        # Serves the most_practiced exercise analytics page in index order
+        Index('ix_exercise_progress_patient_count_live', 'patient_id', text('completion_count DESC'), 'id',
+              postgresql_where=text('is_deleted = false')),
         UniqueConstraint('patient_id', 'exercise_name', name='uq_patient_exercise'),
     )
     
-    @property
+    @hybrid_property
     def total_time_hours(self) -> float:
         """Convert total time to hours"""
         return round(self.total_time_seconds / 3600, 2)
     
-    @property
+    @total_time_hours.expression
+    def total_time_hours(cls):
+        return func.round(cast(cls.total_time_seconds, Numeric) / 3600, 2)
+    
+    @hybrid_property
     def average_session_duration_minutes(self) -> float:
         """Calculate average session duration in minutes"""
         if self.completion_count == 0:
             return 0
         return round((self.total_time_seconds / self.completion_count) / 60, 1)
+    
+    @average_session_duration_minutes.expression
+    def average_session_duration_minutes(cls):
+        return case(
+            (cls.completion_count == 0, 0),
+            else_=func.round(cast(cls.total_time_seconds, Numeric) / cls.completion_count / 60, 1)
+        )
 
 
 class ExerciseSession(Base, SQLAlchemyBaseModel):
@@ -971,6 +1001,8 @@ class ExerciseSession(Base, SQLAlchemyBaseModel):
     start_time = Column(DateTime(timezone=True), nullable=False)
     end_time = Column(DateTime(timezone=True), nullable=True)
     duration_seconds = Column(Integer, nullable=True)
+    # UTC calendar day of start_time, maintained by Postgres for per-day grouping
+    practice_day = Column(Date, Computed("(start_time AT TIME ZONE 'UTC')::date", persisted=True))
     
     # Mood tracking (1-10 scale)
     mood_before = Column(Integer, nullable=True)
@@ -996,12 +1028,24 @@ class ExerciseSession(Base, SQLAlchemyBaseModel):
     # Constraints
     __table_args__ = (
         Index('idx_session_patient', 'patient_id'),
-        Index('idx_session_patient_date', 'patient_id', 'start_time'),
+        # Matches the sessions list keyset order (start_time DESC, id DESC)
+        Index('ix_exercise_sessions_patient_starttime', 'patient_id', text('start_time DESC'), text('id DESC')),
+        # Live-session start_time ranges for the dashboard and goal counts
+        Index('ix_exercise_sessions_patient_start_live', 'patient_id', 'start_time',
+              postgresql_where=text('is_deleted = false')),
+        # Index-only per-day mood aggregates for the mood trends endpoint
+        Index('ix_exercise_sessions_patient_day', 'patient_id', 'practice_day',
+              postgresql_include=['mood_before', 'mood_after', 'mood_improvement'],
+              postgresql_where=text('is_deleted = false')),
         Index('idx_session_exercise', 'exercise_name'),
         Index('idx_session_completed', 'session_completed'),
         Index('idx_session_start_time', 'start_time'),
     )
     
+    # Fetch server-generated created_at/updated_at via RETURNING at flush time,
+    # so endpoints can serialize the row without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
     @property
     def computed_duration_minutes(self) -> float:
         """Calculate duration in minutes from stored values."""
@@ -1064,6 +1108,10 @@ class UserGoal(Base, SQLAlchemyBaseModel):
     # Constraints
     __table_args__ = (
         Index('idx_goal_patient', 'patient_id'),
+        # Matches the goals list filter and keyset order (created_at DESC, id DESC)
+        Index('ix_user_goals_patient_status_created', 'patient_id', 'status', text('created_at DESC'), text('id DESC')),
+        # Index-only goal counts for the stats endpoint
+        Index('ix_user_goals_patient_status_live', 'patient_id', 'status', postgresql_where=text('is_deleted = false')),
         Index('idx_goal_status', 'status'),
         Index('idx_goal_type', 'goal_type'),
         Index('idx_goal_deadline', 'deadline'),
@@ -1127,6 +1175,10 @@ class UserAchievement(Base, SQLAlchemyBaseModel):
         Index('idx_achievement_unlocked', 'unlocked_at'),
         Index('idx_achievement_category', 'achievement_category'),
         Index('idx_achievement_rarity', 'rarity'),
+        # Covers the unlocked-achievements lookups and count (index-only scans)
+        Index('ix_user_achievements_patient_live', 'patient_id',
+              postgresql_include=['achievement_id', 'unlocked_at'],
+              postgresql_where=text('is_deleted = false')),
         UniqueConstraint('patient_id', 'achievement_id', name='uq_patient_achievement'),
     )
 
@@ -1203,6 +1255,10 @@ class PracticeCalendar(Base, SQLAlchemyBaseModel):
         Index('idx_calendar_patient', 'patient_id'),
         Index('idx_calendar_date', 'practice_date'),
         Index('idx_calendar_patient_date', 'patient_id', 'practice_date'),
+        # Index-only reads of live days for the month/year calendar endpoints
+        Index('ix_practice_calendar_patient_date_live', 'patient_id', 'practice_date',
+              postgresql_include=['session_count', 'intensity_level', 'exercises_practiced'],
+              postgresql_where=text('is_deleted = false')),
         Index('idx_calendar_intensity', 'intensity_level'),
         UniqueConstraint('patient_id', 'practice_date', name='uq_patient_practice_date'),
     )
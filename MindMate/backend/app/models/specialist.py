@@ -12,7 +12,7 @@ from sqlalchemy import (
     func, text
 )
 from sqlalchemy.orm import validates, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy import Enum as SA_Enum
 from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime, timedelta, timezone
@@ -846,7 +846,7 @@ class SpecialistsApprovalData(Base, SQLBaseModel):
     compliance_check_status = Column(String(20), default='pending', nullable=True, comment="Status of compliance check")
     
     # Timeline Tracking
-    approval_timeline = Column(JSON, nullable=True, comment="Timeline of approval process: {profile_completion: timestamp, ...}")
+    approval_timeline = Column(JSONB, nullable=True, comment="Timeline of approval process: {profile_completion: timestamp, ...}")
     
     # Relationship
     specialist = relationship("Specialists", back_populates="approval_data")
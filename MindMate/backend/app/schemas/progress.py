@@ -426,19 +426,46 @@ class InsightResponse(BaseModel):
 class PaginatedSessionsResponse(BaseModel):
     """Paginated sessions response"""
     sessions: List[SessionResponse]
-    total: int
+    total: Optional[int] = None  # Only set when include_total is requested
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class PaginatedGoalsResponse(BaseModel):
     """Paginated goals response"""
     goals: List[GoalResponse]
-    total: int
+    total: Optional[int] = None  # Only set when include_total is requested
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class PaginatedExerciseAnalyticsResponse(BaseModel):
+    """Offset-paginated exercise analytics response"""
+    exercises: List[ExerciseAnalytics]
+    total: Optional[int] = None  # Only set when include_total is requested
+    limit: int
+    offset: int
+    has_more: bool = False
+    next_offset: Optional[int] = None
+
+
+class PaginatedCalendarResponse(BaseModel):
+    """Date-cursor paginated calendar days, oldest first"""
+    days: List[CalendarDayData]
+    has_more: bool = False
+    next_cursor: Optional[date] = None  # First practice_date of the next page
+
+
+class StreakCalendarResponse(BaseModel):
+    """Streak plus recent calendar days, fetched together"""
+    streak: StreakResponse
+    calendar: List[CalendarDayData]
 
 
 # ============================================================================
@@ -496,5 +523,8 @@ __all__ = [
     # Pagination schemas
     'PaginatedSessionsResponse',
     'PaginatedGoalsResponse',
+    'PaginatedExerciseAnalyticsResponse',
+    'PaginatedCalendarResponse',
+    'StreakCalendarResponse',
 ]
 
@@ -7,12 +7,13 @@ Service methods for creating different patient profile access levels:
 - Private: Accessible to patient only (complete detailed profile)
 """
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from sqlalchemy import desc, and_
 from datetime import datetime, date, timezone
 from typing import Optional, List, Dict, Any
 import uuid
 
+from app.core.config import settings
 from app.models.patient import (
     Patient, PatientAuthInfo, PatientPreferences, PatientHistory,
     PatientPresentingConcerns, PatientRiskAssessment
@@ -40,8 +41,19 @@ class PatientProfileService:
     def __init__(self, db: Session):
         self.db = db
     
-    def _get_patient_with_relations(self, patient_id: uuid.UUID, load_relations: List[str] = None) -> Optional[Patient]:
-        """Get patient with specified relations loaded"""
+    def _get_patient_with_relations(
+        self,
+        patient_id: uuid.UUID,
+        load_relations: List[str] = None,
+        raise_on_lazy: bool = False
+    ) -> Optional[Patient]:
+        """
+        Get patient with specified relations loaded.
+        
+        One-to-one relations are joined into the patient query; collections
+        are loaded with one SELECT ... IN each, and appointments bring their
+        specialist along. With raise_on_lazy, any other relation access raises.
+        """
         query = self.db.query(Patient).filter(
             Patient.id == patient_id,
             Patient.is_deleted == False
@@ -49,7 +61,16 @@ class PatientProfileService:
         
         if load_relations:
             for relation in load_relations:
-                query = query.options(selectinload(getattr(Patient, relation)))
+                attribute = getattr(Patient, relation)
+                if not attribute.property.uselist:
+                    query = query.options(joinedload(attribute))
+                elif relation == 'appointments':
+                    query = query.options(selectinload(attribute).joinedload(Appointment.specialist))
+                else:
+                    query = query.options(selectinload(attribute))
+        
+        if raise_on_lazy:
+            query = query.options(raiseload('*'))
         
         return query.first()
     
@@ -288,7 +309,8 @@ class PatientProfileService:
         # Load patient with all relations
         patient = self._get_patient_with_relations(
             patient_id, 
-            ['auth_info', 'preferences', 'history', 'presenting_concerns', 'risk_assessments', 'appointments']
+            ['auth_info', 'preferences', 'history', 'presenting_concerns', 'risk_assessments', 'appointments'],
+            raise_on_lazy=settings.DEBUG
         )
         
         if not patient:
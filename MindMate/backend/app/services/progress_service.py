@@ -9,8 +9,9 @@ Version: 1.0.0
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc
-from datetime import datetime, date, timedelta
+from sqlalchemy import func, and_, or_, desc, case
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 import logging
@@ -29,13 +30,94 @@ from app.utils.achievements_config import (
     check_mastery_achievements,
     check_practice_time_achievements,
 )
+from app.utils.cache import cache_delete, cache_get, cache_hget, cache_hset, cache_set
 
 logger = logging.getLogger(__name__)
 
+# Assembled achievement responses are cached per user in one Redis hash
+# (achievements:{user_id}), one field per query variant, so a single DEL
+# invalidates every variant
+ACHIEVEMENTS_CACHE_TTL_SECONDS = 300
+# The unified stats snapshot (progress_stats:{user_id}) tolerates brief
+# staleness; progress mutations drop it, the TTL bounds anything else
+STATS_CACHE_TTL_SECONDS = 60
+# The streak response (streak:{user_id}) changes only on session completion
+# and resets, which drop it
+STREAK_CACHE_TTL_SECONDS = 30
+
+
+def _achievements_cache_key(patient_id: UUID) -> str:
+    return f"achievements:{patient_id}"
+
+
+def _stats_cache_key(patient_id: UUID) -> str:
+    return f"progress_stats:{patient_id}"
+
+
+def _streak_cache_key(patient_id: UUID) -> str:
+    return f"streak:{patient_id}"
+
+
+def get_cached_achievements(patient_id: UUID, variant: str) -> Optional[Any]:
+    """Return the cached achievements payload for this variant, if any"""
+    return cache_hget(_achievements_cache_key(patient_id), variant)
+
+
+def cache_achievements(patient_id: UUID, variant: str, payload: Any) -> None:
+    """Store a JSON-serializable achievements payload for this variant"""
+    cache_hset(_achievements_cache_key(patient_id), variant, payload, ACHIEVEMENTS_CACHE_TTL_SECONDS)
+
+
+def invalidate_achievements_cache(patient_id: UUID) -> None:
+    """Drop every cached achievements variant, and the stats snapshot that counts them"""
+    cache_delete(_achievements_cache_key(patient_id), _stats_cache_key(patient_id))
+
+
+def get_cached_stats(patient_id: UUID) -> Optional[Dict[str, Any]]:
+    """Return the cached unified stats snapshot for a user, if any"""
+    return cache_get(_stats_cache_key(patient_id))
+
+
+def cache_stats(patient_id: UUID, stats: Dict[str, Any]) -> None:
+    """Store the unified stats snapshot for a user"""
+    cache_set(_stats_cache_key(patient_id), stats, STATS_CACHE_TTL_SECONDS)
+
+
+def invalidate_stats_cache(patient_id: UUID) -> None:
+    """Drop the cached unified stats snapshot for a user"""
+    cache_delete(_stats_cache_key(patient_id))
+
+
+def get_cached_streak(patient_id: UUID) -> Optional[Dict[str, Any]]:
+    """Return the cached streak response for a user, if any"""
+    return cache_get(_streak_cache_key(patient_id))
+
+
+def cache_streak(patient_id: UUID, streak: Dict[str, Any]) -> None:
+    """Store the JSON-ready streak response for a user"""
+    cache_set(_streak_cache_key(patient_id), streak, STREAK_CACHE_TTL_SECONDS)
+
+
+def invalidate_progress_caches(patient_id: UUID) -> None:
+    """Drop every cached progress response for a user"""
+    cache_delete(
+        _achievements_cache_key(patient_id), _stats_cache_key(patient_id), _streak_cache_key(patient_id)
+    )
+
 
 class ProgressService:
     """Service for managing exercise progress tracking"""
     
+    @staticmethod
+    def _save(db: Session, instance=None, commit: bool = True) -> None:
+        """Commit (and refresh) or, when batching, just flush pending changes"""
+        if commit:
+            db.commit()
+            if instance is not None:
+                db.refresh(instance)
+        else:
+            db.flush()
+    
     # ========================================================================
     # EXERCISE PROGRESS METHODS
     # ========================================================================
@@ -45,7 +127,8 @@ class ProgressService:
         db: Session,
         patient_id: UUID,
         exercise_name: str,
-        exercise_category: Optional[str] = None
+        exercise_category: Optional[str] = None,
+        commit: bool = True
     ) -> ExerciseProgress:
         """Get existing or create new exercise progress record"""
         progress = db.query(ExerciseProgress).filter(
@@ -64,8 +147,7 @@ class ProgressService:
                 total_time_seconds=0,
             )
             db.add(progress)
-            db.commit()
-            db.refresh(progress)
+            ProgressService._save(db, progress, commit)
         
         return progress
     
@@ -73,11 +155,12 @@ class ProgressService:
     def update_exercise_progress(
         db: Session,
         patient_id: UUID,
-        session: ExerciseSession
+        session: ExerciseSession,
+        commit: bool = True
     ) -> ExerciseProgress:
         """Update exercise progress after session completion"""
         progress = ProgressService.get_or_create_exercise_progress(
-            db, patient_id, session.exercise_name, session.exercise_category
+            db, patient_id, session.exercise_name, session.exercise_category, commit=commit
         )
         
         # Update metrics
@@ -108,8 +191,7 @@ class ProgressService:
             progress.average_mood_improvement
         )
         
-        db.commit()
-        db.refresh(progress)
+        ProgressService._save(db, progress, commit)
         return progress
     
     @staticmethod
@@ -118,12 +200,24 @@ class ProgressService:
         patient_id: UUID,
         session: ExerciseSession
     ) -> Dict[str, Any]:
-        """Run all downstream updates when a session is completed."""
-        progress = ProgressService.update_exercise_progress(db, patient_id, session)
-        streak = ProgressService.update_streak(db, patient_id, session.start_time.date())
-        calendar = ProgressService.update_practice_calendar(db, patient_id, session)
-        achievements = ProgressService.check_and_unlock_achievements(db, patient_id)
-        updated_goals = ProgressService.check_and_update_goals(db, patient_id)
+        """
+        Run all downstream updates when a session is completed.
+        
+        Each step only flushes so later steps see earlier writes; everything,
+        including any pending changes to the session itself, is committed once.
+        """
+        db.flush()
+        progress = ProgressService.update_exercise_progress(db, patient_id, session, commit=False)
+        streak = ProgressService.update_streak(db, patient_id, session.start_time.date(), commit=False)
+        calendar = ProgressService.update_practice_calendar(db, patient_id, session, commit=False)
+        achievements = ProgressService.check_and_unlock_achievements(db, patient_id, commit=False)
+        updated_goals = ProgressService.check_and_update_goals(db, patient_id, commit=False)
+        db.commit()
+        # The streak and stats always change; achievements only when one unlocked
+        if achievements:
+            invalidate_progress_caches(patient_id)
+        else:
+            cache_delete(_stats_cache_key(patient_id), _streak_cache_key(patient_id))
         
         return {
             "progress": progress,
@@ -168,23 +262,47 @@ class ProgressService:
     # ========================================================================
     
     @staticmethod
-    def get_or_create_streak(db: Session, patient_id: UUID) -> UserStreak:
-        """Get existing or create new streak record"""
+    def get_or_create_streak(db: Session, patient_id: UUID, commit: bool = True) -> UserStreak:
+        """
+        Get existing or create new streak record
+        
+        Creation is an upsert on the unique patient_id, so concurrent first
+        requests all get the same row instead of racing to INSERT it. A
+        soft-deleted row for the patient is revived with fresh counters;
+        a live row (a concurrent request won the insert) is kept as is.
+        """
         streak = db.query(UserStreak).filter(
             UserStreak.patient_id == patient_id,
             UserStreak.is_deleted == False
         ).first()
         
         if not streak:
-            streak = UserStreak(
-                patient_id=patient_id,
-                current_streak=0,
-                longest_streak=0,
-                total_practice_days=0
-            )
-            db.add(streak)
-            db.commit()
-            db.refresh(streak)
+            fresh = {
+                "current_streak": 0,
+                "longest_streak": 0,
+                "total_practice_days": 0,
+                "last_practice_date": None,
+                "streak_start_date": None,
+                "longest_streak_start": None,
+                "longest_streak_end": None,
+            }
+            stmt = insert(UserStreak).values(patient_id=patient_id, **fresh)
+            # SET expressions see the pre-update row, so is_deleted here is the old flag
+            set_ = {
+                column: case(
+                    (UserStreak.is_deleted == True, stmt.excluded[column]),
+                    else_=getattr(UserStreak, column)
+                )
+                for column in fresh
+            }
+            set_.update(is_deleted=False, updated_at=func.now())
+            streak = db.scalars(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserStreak.patient_id],
+                    set_=set_
+                ).returning(UserStreak)
+            ).one()
+            ProgressService._save(db, streak, commit)
         
         return streak
     
@@ -192,13 +310,14 @@ class ProgressService:
     def update_streak(
         db: Session,
         patient_id: UUID,
-        practice_date: date = None
+        practice_date: date = None,
+        commit: bool = True
     ) -> UserStreak:
         """Update user streak after practice"""
         if practice_date is None:
             practice_date = date.today()
         
-        streak = ProgressService.get_or_create_streak(db, patient_id)
+        streak = ProgressService.get_or_create_streak(db, patient_id, commit=commit)
         
         # Check if already practiced today
         if streak.last_practice_date == practice_date:
@@ -234,8 +353,7 @@ class ProgressService:
             streak.total_practice_days += 1
         streak.last_practice_date = practice_date
         
-        db.commit()
-        db.refresh(streak)
+        ProgressService._save(db, streak, commit)
         return streak
     
     # ========================================================================
@@ -246,7 +364,8 @@ class ProgressService:
     def update_practice_calendar(
         db: Session,
         patient_id: UUID,
-        session: ExerciseSession
+        session: ExerciseSession,
+        commit: bool = True
     ) -> PracticeCalendar:
         """Update practice calendar after session"""
         practice_date = session.start_time.date()
@@ -289,8 +408,7 @@ class ProgressService:
         elif calendar.session_count >= 4:
             calendar.intensity_level = 4
         
-        db.commit()
-        db.refresh(calendar)
+        ProgressService._save(db, calendar, commit)
         return calendar
     
     # ========================================================================
@@ -300,7 +418,8 @@ class ProgressService:
     @staticmethod
     def check_and_unlock_achievements(
         db: Session,
-        patient_id: UUID
+        patient_id: UUID,
+        commit: bool = True
     ) -> List[UserAchievement]:
         """Check and unlock any earned achievements"""
         newly_unlocked = []
@@ -321,7 +440,7 @@ class ProgressService:
         for achievement_id in session_achievements:
             if achievement_id not in unlocked_ids:
                 achievement = ProgressService._unlock_achievement(
-                    db, patient_id, achievement_id, stats['total_sessions']
+                    db, patient_id, achievement_id, stats['total_sessions'], commit
                 )
                 if achievement:
                     newly_unlocked.append(achievement)
@@ -332,7 +451,7 @@ class ProgressService:
         for achievement_id in streak_achievements:
             if achievement_id not in unlocked_ids:
                 achievement = ProgressService._unlock_achievement(
-                    db, patient_id, achievement_id, stats['current_streak']
+                    db, patient_id, achievement_id, stats['current_streak'], commit
                 )
                 if achievement:
                     newly_unlocked.append(achievement)
@@ -343,7 +462,7 @@ class ProgressService:
         for achievement_id in variety_achievements:
             if achievement_id not in unlocked_ids:
                 achievement = ProgressService._unlock_achievement(
-                    db, patient_id, achievement_id, stats['exercises_tried']
+                    db, patient_id, achievement_id, stats['exercises_tried'], commit
                 )
                 if achievement:
                     newly_unlocked.append(achievement)
@@ -358,7 +477,7 @@ class ProgressService:
             if achievement_id not in unlocked_ids:
                 achievement = ProgressService._unlock_achievement(
                     db, patient_id, achievement_id,
-                    max(stats['advanced_exercises'], stats['intermediate_exercises'])
+                    max(stats['advanced_exercises'], stats['intermediate_exercises']), commit
                 )
                 if achievement:
                     newly_unlocked.append(achievement)
@@ -369,7 +488,7 @@ class ProgressService:
         for achievement_id in time_achievements:
             if achievement_id not in unlocked_ids:
                 achievement = ProgressService._unlock_achievement(
-                    db, patient_id, achievement_id, stats['total_time_seconds']
+                    db, patient_id, achievement_id, stats['total_time_seconds'], commit
                 )
                 if achievement:
                     newly_unlocked.append(achievement)
@@ -382,14 +501,21 @@ class ProgressService:
         db: Session,
         patient_id: UUID,
         achievement_id: str,
-        progress_value: int
+        progress_value: int,
+        commit: bool = True
     ) -> Optional[UserAchievement]:
-        """Unlock a specific achievement"""
+        """
+        Unlock a specific achievement
+        
+        When batching (commit=False) the insert runs in a savepoint so a failure
+        only discards this achievement, not the surrounding transaction.
+        """
         achievement_def = get_achievement_by_id(achievement_id)
         if not achievement_def:
             logger.warning(f"Achievement not found: {achievement_id}")
             return None
         
+        savepoint = None if commit else db.begin_nested()
         try:
             achievement = UserAchievement(
                 patient_id=patient_id,
@@ -405,14 +531,19 @@ class ProgressService:
                 is_notified=False
             )
             db.add(achievement)
-            db.commit()
-            db.refresh(achievement)
+            if savepoint is not None:
+                savepoint.commit()
+            else:
+                ProgressService._save(db, achievement)
             
             logger.info(f"Achievement unlocked: {achievement_id} for patient {patient_id}")
             return achievement
         except Exception as e:
             logger.error(f"Error unlocking achievement: {e}")
-            db.rollback()
+            if savepoint is not None:
+                savepoint.rollback()
+            else:
+                db.rollback()
             return None
     
     # ========================================================================
@@ -420,7 +551,7 @@ class ProgressService:
     # ========================================================================
     
     @staticmethod
-    def check_and_update_goals(db: Session, patient_id: UUID) -> List[UserGoal]:
+    def check_and_update_goals(db: Session, patient_id: UUID, commit: bool = True) -> List[UserGoal]:
         """Check and update all active goals"""
         updated_goals = []
         
@@ -442,7 +573,8 @@ class ProgressService:
                 today = date.today()
                 practiced_today = db.query(ExerciseSession).filter(
                     ExerciseSession.patient_id == patient_id,
-                    func.date(ExerciseSession.start_time) == today,
+                    ExerciseSession.start_time >= datetime.combine(today, time.min),
+                    ExerciseSession.start_time < datetime.combine(today + timedelta(days=1), time.min),
                     ExerciseSession.is_deleted == False
                 ).count() > 0
                 goal.current_value = 1 if practiced_today else 0
@@ -453,7 +585,7 @@ class ProgressService:
                 week_start = date.today() - timedelta(days=date.today().weekday())
                 sessions_this_week = db.query(ExerciseSession).filter(
                     ExerciseSession.patient_id == patient_id,
-                    func.date(ExerciseSession.start_time) >= week_start,
+                    ExerciseSession.start_time >= datetime.combine(week_start, time.min),
                     ExerciseSession.is_deleted == False
                 ).count()
                 goal.current_value = sessions_this_week
@@ -505,7 +637,7 @@ class ProgressService:
                 updated_goals.append(goal)
         
         if updated_goals:
-            db.commit()
+            ProgressService._save(db, commit=commit)
         
         return updated_goals
     
@@ -583,7 +715,7 @@ class ProgressService:
         week_start = date.today() - timedelta(days=date.today().weekday())
         sessions_this_week = db.query(func.count(ExerciseSession.id)).filter(
             ExerciseSession.patient_id == patient_id,
-            func.date(ExerciseSession.start_time) >= week_start,
+            ExerciseSession.start_time >= datetime.combine(week_start, time.min),
             ExerciseSession.session_completed == True,
             ExerciseSession.is_deleted == False
         ).scalar() or 0
@@ -592,7 +724,7 @@ class ProgressService:
         month_start = date.today().replace(day=1)
         sessions_this_month = db.query(func.count(ExerciseSession.id)).filter(
             ExerciseSession.patient_id == patient_id,
-            func.date(ExerciseSession.start_time) >= month_start,
+            ExerciseSession.start_time >= datetime.combine(month_start, time.min),
             ExerciseSession.session_completed == True,
             ExerciseSession.is_deleted == False
         ).scalar() or 0
@@ -634,7 +766,7 @@ class ProgressService:
         # Achievements this month
         achievements_this_month = db.query(func.count(UserAchievement.id)).filter(
             UserAchievement.patient_id == patient_id,
-            func.date(UserAchievement.unlocked_at) >= month_start,
+            UserAchievement.unlocked_at >= datetime.combine(month_start, time.min),
             UserAchievement.is_deleted == False
         ).scalar() or 0
         
@@ -340,21 +340,26 @@ ACHIEVEMENTS: List[Dict[str, Any]] = [
 ]
 
 
+# Lookup tables built once at import; ACHIEVEMENTS is static
+_ACHIEVEMENTS_BY_ID: Dict[str, Dict[str, Any]] = {a["achievement_id"]: a for a in ACHIEVEMENTS}
+_ACHIEVEMENTS_BY_CATEGORY: Dict[str, List[Dict[str, Any]]] = {}
+for _achievement in ACHIEVEMENTS:
+    _ACHIEVEMENTS_BY_CATEGORY.setdefault(_achievement["category"], []).append(_achievement)
+del _achievement
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
 def get_achievement_by_id(achievement_id: str) -> Dict[str, Any]:
     """Get achievement definition by ID"""
-    for achievement in ACHIEVEMENTS:
-        if achievement["achievement_id"] == achievement_id:
-            return achievement
-    return None
+    return _ACHIEVEMENTS_BY_ID.get(achievement_id)
 
 
 def get_achievements_by_category(category: str) -> List[Dict[str, Any]]:
-    """Get all achievements in a category"""
-    return [a for a in ACHIEVEMENTS if a["category"] == category]
+    """Get all achievements in a category (shared list; do not mutate)"""
+    return _ACHIEVEMENTS_BY_CATEGORY.get(category, [])
 
 
 def get_achievements_by_rarity(rarity: str) -> List[Dict[str, Any]]:
@@ -0,0 +1,115 @@
+"""
+Redis JSON Cache Helpers
+========================
+Small read-through cache helpers on top of the shared Redis client.
+
+Every helper degrades to a cache miss / no-op when Redis is unreachable, and
+after an error the cache is skipped for REDIS_RETRY_AFTER_SECONDS instead of
+paying the connection timeout on every request. Hits and misses are counted
+per key namespace (the part of the key before the first ':').
+
+Author: MindMate Team
+Version: 1.0.0
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional
+import json
+import logging
+import time
+
+import redis
+
+from app.db.session import redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_AFTER_SECONDS = 30
+
+_redis_retry_at = 0.0
+_counters: Counter = Counter()
+
+
+def _client() -> Optional[redis.Redis]:
+    """Redis client for caching, or None while backing off"""
+    return None if time.monotonic() < _redis_retry_at else redis_client
+
+
+def _failed(error: Exception) -> None:
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+    logger.warning(f"Cache unavailable, falling back to database: {error}")
+
+
+def _count(key: str, cached: Optional[str]) -> None:
+    namespace = key.split(":", 1)[0]
+    _counters[f"{namespace}.{'hit' if cached is not None else 'miss'}"] += 1
+
+
+def cache_counters() -> Dict[str, int]:
+    """Hit/miss counts per namespace since process start, e.g. {"streak.hit": 3}"""
+    return dict(_counters)
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """Return the cached JSON value under key, if any"""
+    client = _client()
+    if client is None:
+        return None
+    try:
+        cached = client.get(key)
+    except redis.RedisError as e:
+        _failed(e)
+        return None
+    _count(key, cached)
+    return json.loads(cached) if cached is not None else None
+
+
+def cache_set(key: str, value: Any, ttl_seconds: int) -> None:
+    """Store a JSON-serializable value under key for ttl_seconds"""
+    client = _client()
+    if client is None:
+        return
+    try:
+        client.set(key, json.dumps(value), ex=ttl_seconds)
+    except redis.RedisError as e:
+        _failed(e)
+
+
+def cache_hget(key: str, field: str) -> Optional[Any]:
+    """Return the cached JSON value in field of the hash under key, if any"""
+    client = _client()
+    if client is None:
+        return None
+    try:
+        cached = client.hget(key, field)
+    except redis.RedisError as e:
+        _failed(e)
+        return None
+    _count(key, cached)
+    return json.loads(cached) if cached is not None else None
+
+
+def cache_hset(key: str, field: str, value: Any, ttl_seconds: int) -> None:
+    """Store a JSON-serializable value in field of the hash under key; the TTL covers the whole hash"""
+    client = _client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline()
+        pipe.hset(key, field, json.dumps(value))
+        pipe.expire(key, ttl_seconds)
+        pipe.execute()
+    except redis.RedisError as e:
+        _failed(e)
+
+
+def cache_delete(*keys: str) -> None:
+    """Drop the given keys in one round trip"""
+    client = _client()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        _failed(e)
@@ -0,0 +1,3 @@
+"""
+Tests package for MindMate backend
+"""
@@ -0,0 +1,4 @@
+"""
+Tests for the assessment system
+"""
+
@@ -0,0 +1,177 @@
+"""
+Unit tests for the session patient_id migration script.
+
+The migration runs server-side batched UPDATEs per id range and keeps a
+checkpoint per range in migration_state. A fake session answers each SQL
+statement by name so the batching, checkpoint and failure bookkeeping can
+be checked without Postgres.
+"""
+
+import sys
+import threading
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.agents.assessment.migrations import migrate_session_patient_ids as migration
+
+
+class FakeResult:
+    def __init__(self, value: Any = None):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+    def one(self):
+        return self.value
+
+
+class FakeMigrationSession:
+    """
+    Answers the migration's statements in order.
+
+    `batches` is the sequence of MIGRATE_BATCH_SQL outcomes: a row, or an
+    exception to raise. `bounds` answers BATCH_BOUNDS_SQL after a failure.
+    """
+
+    def __init__(self, batches: List[Any], checkpoint: Any = None, bounds: Any = None):
+        self.batches = list(batches)
+        self.checkpoint = checkpoint
+        self.bounds = bounds
+        self.calls: List[tuple] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql == migration.LOAD_CHECKPOINT_SQL:
+            self.calls.append(("load", params))
+            return FakeResult(self.checkpoint)
+        if sql == migration.MIGRATE_BATCH_SQL:
+            self.calls.append(("batch", params))
+            outcome = self.batches.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return FakeResult(outcome)
+        if sql == migration.SAVE_CHECKPOINT_SQL:
+            self.calls.append(("save", params))
+            return FakeResult()
+        if sql == migration.CLEAR_CHECKPOINT_SQL:
+            self.calls.append(("clear", params))
+            return FakeResult()
+        if sql == migration.BATCH_BOUNDS_SQL:
+            self.calls.append(("bounds", params))
+            return FakeResult(self.bounds)
+        raise AssertionError(f"Unexpected statement: {sql}")
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+def batch_row(last_id, scanned: int, migrated: int) -> SimpleNamespace:
+    return SimpleNamespace(last_id=last_id, scanned=scanned, migrated=migrated)
+
+
+def new_stats() -> Dict[str, Any]:
+    return {
+        "total_sessions": 0,
+        "needs_migration": 0,
+        "migrated": 0,
+        "failed": 0,
+        "skipped": 0,
+        "errors": []
+    }
+
+
+@pytest.fixture()
+def run_range(monkeypatch):
+    """Run migrate_id_range over the whole keyspace against a FakeMigrationSession."""
+    def _run(fake: FakeMigrationSession, batch_size: int = 2) -> Dict[str, Any]:
+        monkeypatch.setattr(migration, "SessionLocal", lambda: fake)
+        stats = new_stats()
+        lower, upper = migration.split_id_ranges(1)[0]
+        migration.migrate_id_range(lower, upper, stats, threading.Lock(), batch_size=batch_size)
+        return stats
+    return _run
+
+
+def test_batches_walk_the_range_and_count_updates(run_range):
+    first, second = uuid.uuid4(), uuid.uuid4()
+    fake = FakeMigrationSession(batches=[
+        batch_row(first, scanned=2, migrated=1),
+        batch_row(second, scanned=1, migrated=1),
+        batch_row(None, scanned=0, migrated=0),
+    ])
+
+    stats = run_range(fake)
+
+    assert stats["migrated"] == 2
+    assert stats["needs_migration"] == 2
+    assert stats["skipped"] == 1
+    assert stats["failed"] == 0
+
+    batch_cursors = [params["cursor"] for kind, params in fake.calls if kind == "batch"]
+    assert batch_cursors[1:] == [str(first), str(second)]
+    saved = [params["last_id"] for kind, params in fake.calls if kind == "save"]
+    assert saved == [str(first), str(second)]
+
+
+def test_completed_range_clears_its_checkpoint(run_range):
+    resume_from = uuid.uuid4()
+    fake = FakeMigrationSession(
+        batches=[batch_row(None, scanned=0, migrated=0)],
+        checkpoint=resume_from
+    )
+
+    run_range(fake)
+
+    # Resumed from the checkpoint, then dropped it once nothing was left
+    kind, params = fake.calls[1]
+    assert kind == "batch"
+    assert params["cursor"] == str(resume_from)
+    assert fake.calls[-1][0] == "clear"
+
+
+def test_failed_batch_is_counted_and_skipped(run_range):
+    failed_last_id, next_last_id = uuid.uuid4(), uuid.uuid4()
+    fake = FakeMigrationSession(
+        batches=[
+            RuntimeError("deadlock detected"),
+            batch_row(next_last_id, scanned=1, migrated=1),
+            batch_row(None, scanned=0, migrated=0),
+        ],
+        bounds=SimpleNamespace(last_id=failed_last_id, scanned=2)
+    )
+
+    stats = run_range(fake)
+
+    assert fake.rollbacks == 1
+    assert stats["failed"] == 2
+    assert stats["errors"][0]["error"] == "deadlock detected"
+    assert stats["migrated"] == 1
+    # The walk continued after the failed batch
+    batch_cursors = [params["cursor"] for kind, params in fake.calls if kind == "batch"]
+    assert batch_cursors[1] == str(failed_last_id)
+
+
+def test_id_ranges_cover_the_keyspace_without_gaps():
+    ranges = migration.split_id_ranges(4)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] == uuid.UUID(int=0)
+    assert ranges[-1][1] == migration.MAX_UUID
+    for (_, upper), (lower, _) in zip(ranges, ranges[1:]):
+        assert upper == lower
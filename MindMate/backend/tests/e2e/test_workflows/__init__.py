@@ -0,0 +1 @@
+# backend1\tests\e2e\test_workflows
@@ -0,0 +1 @@
+# backend1\tests\integration\test_agents
@@ -0,0 +1,168 @@
+"""
+API-level tests for goal creation in the progress tracker.
+
+`POST /progress-tracker/goals` inserts with a single
+INSERT ... SELECT ... WHERE (active goals) < MAX_ACTIVE_GOALS RETURNING
+statement, and the user_goals_active_limit trigger backs it up against
+concurrent requests. Both outcomes must surface as the same 400.
+"""
+
+from __future__ import annotations
+
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from app.api.v1.endpoints import progress
+from app.api.v1.endpoints.auth import get_current_user_from_token
+from app.db.session import get_db
+
+
+PATIENT_ID = uuid.uuid4()
+
+GOAL_REQUEST = {
+    "goal_type": "daily_practice",
+    "title": "Practice every day",
+    "target_value": 7,
+}
+
+# Message raised by the user_goals_active_limit trigger (e5c29a7d14f8)
+TRIGGER_MESSAGE = f"Maximum of {progress.MAX_ACTIVE_GOALS} active goals allowed"
+
+
+class FakeResult:
+    def __init__(self, goal: Optional[Any]):
+        self.goal = goal
+
+    def one_or_none(self):
+        return self.goal
+
+
+class FakeDB:
+    """Session stand-in: returns a canned insert result or raises."""
+
+    def __init__(self, goal: Optional[Any] = None, error: Optional[Exception] = None):
+        self.goal = goal
+        self.error = error
+        self.statements: List[Any] = []
+        self.committed = False
+        self.rolled_back = False
+
+    def scalars(self, statement):
+        self.statements.append(statement)
+        if self.error is not None:
+            raise self.error
+        return FakeResult(self.goal)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def make_goal() -> SimpleNamespace:
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        patient_id=PATIENT_ID,
+        goal_type="daily_practice",
+        title=GOAL_REQUEST["title"],
+        description=None,
+        target_value=GOAL_REQUEST["target_value"],
+        current_value=0,
+        target_exercise_name=None,
+        reminder_frequency="weekly",
+        progress_percentage=0.0,
+        start_date=date.today(),
+        deadline=None,
+        status="active",
+        completed_at=None,
+        reward_badge_id=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture()
+def goals_api(monkeypatch: pytest.MonkeyPatch):
+    """Yields (client, use_db): use_db installs the FakeDB for the next request."""
+    monkeypatch.setattr(progress, "invalidate_stats_cache", lambda patient_id: None)
+
+    app = FastAPI()
+    app.include_router(progress.router)
+    app.dependency_overrides[get_current_user_from_token] = lambda: {
+        "user": SimpleNamespace(id=PATIENT_ID),
+        "user_type": "patient",
+    }
+
+    def use_db(db: FakeDB) -> FakeDB:
+        app.dependency_overrides[get_db] = lambda: db
+        return db
+
+    yield TestClient(app), use_db
+
+
+def test_goal_is_created_by_one_conditional_insert(goals_api):
+    client, use_db = goals_api
+    goal = make_goal()
+    db = use_db(FakeDB(goal=goal))
+
+    response = client.post("/progress-tracker/goals", json=GOAL_REQUEST)
+
+    assert response.status_code == 201
+    assert response.json()["id"] == str(goal.id)
+    assert db.committed is True
+
+    assert len(db.statements) == 1
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO user_goals")
+    assert "count(user_goals.id)" in sql
+    assert "RETURNING" in sql
+
+
+def test_goal_limit_reached_returns_400(goals_api):
+    client, use_db = goals_api
+    db = use_db(FakeDB(goal=None))
+
+    response = client.post("/progress-tracker/goals", json=GOAL_REQUEST)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == TRIGGER_MESSAGE
+    assert db.rolled_back is True
+    assert db.committed is False
+
+
+def test_trigger_violation_maps_to_the_same_400(goals_api):
+    client, use_db = goals_api
+    error = IntegrityError("INSERT INTO user_goals ...", {}, Exception(TRIGGER_MESSAGE))
+    db = use_db(FakeDB(error=error))
+
+    response = client.post("/progress-tracker/goals", json=GOAL_REQUEST)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == TRIGGER_MESSAGE
+    assert db.committed is False
+
+
+def test_other_integrity_errors_are_not_reported_as_the_limit(goals_api):
+    client, use_db = goals_api
+    error = IntegrityError("INSERT INTO user_goals ...", {}, Exception("violates foreign key constraint"))
+    use_db(FakeDB(error=error))
+
+    response = client.post("/progress-tracker/goals", json=GOAL_REQUEST)
+
+    assert response.status_code == 500
+    assert "active goals" not in response.json()["detail"]
@@ -0,0 +1,198 @@
+"""
+API-level tests for the exercise sessions list in the progress tracker.
+
+`GET /progress-tracker/sessions` pages with a (start_time, id) keyset
+cursor and only reports `total`/`total_pages` when `include_total` is
+requested. The database session is replaced with a recording fake so the
+paging contract can be checked without Postgres.
+"""
+
+from __future__ import annotations
+
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from app.api.v1.endpoints import progress
+from app.api.v1.endpoints.auth import get_current_user_from_token
+from app.db.session import get_db
+
+
+PATIENT_ID = uuid.uuid4()
+
+
+class FakeQuery:
+    """Records the calls get_sessions makes and returns canned rows."""
+
+    def __init__(self, rows: List[Any]):
+        self.rows = rows
+        self.filters: List[Any] = []
+        self.offset_value = None
+        self.limit_value = None
+
+    def options(self, *options):
+        return self
+
+    def filter(self, *criteria):
+        self.filters.extend(criteria)
+        return self
+
+    def offset(self, value: int):
+        self.offset_value = value
+        return self
+
+    def order_by(self, *clauses):
+        return self
+
+    def limit(self, value: int):
+        self.limit_value = value
+        return self
+
+    def all(self):
+        return self.rows[: self.limit_value]
+
+
+def make_session(start_time: datetime) -> SimpleNamespace:
+    """Exercise session row carrying every SessionResponse field."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        patient_id=PATIENT_ID,
+        exercise_name="Box Breathing",
+        exercise_category="breathing",
+        start_time=start_time,
+        end_time=None,
+        duration_seconds=None,
+        duration_minutes=None,
+        mood_before=None,
+        mood_after=None,
+        mood_improvement=None,
+        steps_completed=None,
+        completion_percentage=100.0,
+        session_completed=True,
+        notes=None,
+        tags=None,
+        time_of_day=None,
+        location_type=None,
+        created_at=start_time,
+    )
+
+
+def newest_first(count: int) -> List[SimpleNamespace]:
+    now = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+    return [make_session(now - timedelta(hours=i)) for i in range(count)]
+
+
+class FakeDB:
+    """Session stand-in whose query() hands out FakeQuery objects."""
+
+    def __init__(self):
+        self.rows: List[Any] = []
+        self.queries: List[FakeQuery] = []
+
+    def query(self, *entities):
+        query = FakeQuery(self.rows)
+        self.queries.append(query)
+        return query
+
+
+@pytest.fixture()
+def sessions_api():
+    """
+    TestClient for the progress router backed by a FakeDB.
+    Yields (client, db); set db.rows to the rows the sessions query returns.
+    """
+    db = FakeDB()
+
+    app = FastAPI()
+    app.include_router(progress.router)
+    app.dependency_overrides[get_current_user_from_token] = lambda: {
+        "user": SimpleNamespace(id=PATIENT_ID),
+        "user_type": "patient",
+    }
+    app.dependency_overrides[get_db] = lambda: db
+
+    yield TestClient(app), db
+
+
+def test_first_page_returns_cursor_and_no_total(sessions_api):
+    client, db = sessions_api
+    rows = newest_first(3)
+    db.rows = rows
+
+    response = client.get("/progress-tracker/sessions", params={"page_size": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [s["id"] for s in body["sessions"]] == [str(rows[0].id), str(rows[1].id)]
+    assert body["has_more"] is True
+    assert body["next_cursor"] == f"{rows[1].start_time.isoformat()}|{rows[1].id}"
+    # Totals are opt-in
+    assert body["total"] is None
+    assert body["total_pages"] is None
+    # One extra row is fetched to detect the next page
+    assert db.queries[0].limit_value == 3
+
+
+def test_cursor_continues_after_last_row_without_offset(sessions_api):
+    client, db = sessions_api
+    rows = newest_first(2)
+    db.rows = rows
+    cursor = f"{rows[0].start_time.isoformat()}|{rows[0].id}"
+
+    response = client.get(
+        "/progress-tracker/sessions",
+        params={"page_size": 2, "cursor": cursor, "page": 5}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+
+    query = db.queries[0]
+    # page is ignored once a cursor is given
+    assert query.offset_value is None
+    compiled = [str(f.compile(dialect=postgresql.dialect())) for f in query.filters]
+    assert any(
+        "(exercise_sessions.start_time, exercise_sessions.id) <" in clause
+        for clause in compiled
+    )
+
+
+def test_invalid_cursor_is_rejected(sessions_api):
+    client, db = sessions_api
+    db.rows = []
+
+    response = client.get("/progress-tracker/sessions", params={"cursor": "not-a-timestamp"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_include_total_reads_the_window_count(sessions_api):
+    client, db = sessions_api
+    rows: List[Tuple[SimpleNamespace, int]] = [(s, 5) for s in newest_first(3)]
+    db.rows = rows
+
+    response = client.get(
+        "/progress-tracker/sessions",
+        params={"page_size": 2, "include_total": True}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["sessions"]) == 2
+    assert body["total"] == 5
+    assert body["total_pages"] == 3
+    assert body["has_more"] is True
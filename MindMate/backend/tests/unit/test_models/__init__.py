@@ -0,0 +1 @@
+# backend1\tests\unit\test_models